@@ -405,6 +405,7 @@ class _AppListScreenState extends State<AppListScreen> {
       appBar: AppBar(
         leading: IconButton(
           icon: const Icon(Icons.arrow_back, color: Color(0xFF6366F1)),
+          tooltip: 'Back',
           onPressed: () => Navigator.pop(context),
         ),
         title: const Text(
@@ -557,7 +558,11 @@ class _AppListScreenState extends State<AppListScreen> {
                   final isSelected = selectedApps.any((selected) => 
                       selected['packageName'] == app.packageName);
                   
-                  return _buildAppItem(app, isSelected);
+                  return Semantics(
+                    container: true,
+                    identifier: 'app-item',
+                    child: _buildAppItem(app, isSelected),
+                  );
                 },
               ),
             ),
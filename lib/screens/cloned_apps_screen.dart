@@ -320,35 +320,67 @@ class ClonedAppsScreenState extends State<ClonedAppsScreen> with AutomaticKeepAl
       itemBuilder: (context, index) {
         final app = clonedApps[index];
         
-        return GestureDetector(
-          onTap: () => _launchClonedApp(app),
-          onLongPress: () => _showAppOptions(app),
-          child: Column(
-            mainAxisAlignment: MainAxisAlignment.center,
-            children: [
-              Container(
-                width: 60,
-                height: 60,
-                decoration: BoxDecoration(
-                  borderRadius: BorderRadius.circular(12),
-                  color: app.color,
-                  boxShadow: [
-                    BoxShadow(
-                      color: Colors.black.withOpacity(0.3),
-                      blurRadius: 8,
-                      offset: const Offset(0, 4),
-                    ),
-                  ],
-                ),
-                child: app.icon != null
-                    ? ClipRRect(
-                        borderRadius: BorderRadius.circular(12),
-                        child: Image.memory(
-                          app.icon!,
-                          width: 60,
-                          height: 60,
-                          fit: BoxFit.cover,
-                          errorBuilder: (context, error, stackTrace) {
+        return Semantics(
+          container: true,
+          identifier: 'cloned-app-item',
+          child: GestureDetector(
+            onTap: () => _launchClonedApp(app),
+            onLongPress: () => _showAppOptions(app),
+            child: Column(
+              mainAxisAlignment: MainAxisAlignment.center,
+              children: [
+                Container(
+                  width: 60,
+                  height: 60,
+                  decoration: BoxDecoration(
+                    borderRadius: BorderRadius.circular(12),
+                    color: app.color,
+                    boxShadow: [
+                      BoxShadow(
+                        color: Colors.black.withOpacity(0.3),
+                        blurRadius: 8,
+                        offset: const Offset(0, 4),
+                      ),
+                    ],
+                  ),
+                  child: app.icon != null
+                      ? ClipRRect(
+                          borderRadius: BorderRadius.circular(12),
+                          child: Image.memory(
+                            app.icon!,
+                            width: 60,
+                            height: 60,
+                            fit: BoxFit.cover,
+                            errorBuilder: (context, error, stackTrace) {
+                              return const Icon(
+                                Icons.android,
+                                color: Colors.white,
+                                size: 30,
+                              );
+                            },
+                          ),
+                        )
+                      : FutureBuilder<Uint8List?>(
+                          future: AppService.getAppIcon(app.packageName),
+                          builder: (context, snapshot) {
+                            if (snapshot.hasData && snapshot.data != null) {
+                              return ClipRRect(
+                                borderRadius: BorderRadius.circular(12),
+                                child: Image.memory(
+                                  snapshot.data!,
+                                  width: 60,
+                                  height: 60,
+                                  fit: BoxFit.cover,
+                                  errorBuilder: (context, error, stackTrace) {
+                                    return const Icon(
+                                      Icons.android,
+                                      color: Colors.white,
+                                      size: 30,
+                                    );
+                                  },
+                                ),
+                              );
+                            }
                             return const Icon(
                               Icons.android,
                               color: Colors.white,
@@ -356,57 +388,29 @@ class ClonedAppsScreenState extends State<ClonedAppsScreen> with AutomaticKeepAl
                             );
                           },
                         ),
-                      )
-                    : FutureBuilder<Uint8List?>(
-                        future: AppService.getAppIcon(app.packageName),
-                        builder: (context, snapshot) {
-                          if (snapshot.hasData && snapshot.data != null) {
-                            return ClipRRect(
-                              borderRadius: BorderRadius.circular(12),
-                              child: Image.memory(
-                                snapshot.data!,
-                                width: 60,
-                                height: 60,
-                                fit: BoxFit.cover,
-                                errorBuilder: (context, error, stackTrace) {
-                                  return const Icon(
-                                    Icons.android,
-                                    color: Colors.white,
-                                    size: 30,
-                                  );
-                                },
-                              ),
-                            );
-                          }
-                          return const Icon(
-                            Icons.android,
-                            color: Colors.white,
-                            size: 30,
-                          );
-                        },
-                      ),
-              ),
-              const SizedBox(height: 8),
-              Text(
-                app.displayName ?? app.appName,
-                style: const TextStyle(
-                  color: Colors.white,
-                  fontSize: 12,
-                  fontWeight: FontWeight.w500,
                 ),
-                textAlign: TextAlign.center,
-                maxLines: 2,
-                overflow: TextOverflow.ellipsis,
-              ),
-              if (app.cloneCount > 1)
+                const SizedBox(height: 8),
                 Text(
-                  '(${app.cloneCount})',
+                  app.displayName ?? app.appName,
                   style: const TextStyle(
-                    color: Colors.grey,
-                    fontSize: 10,
+                    color: Colors.white,
+                    fontSize: 12,
+                    fontWeight: FontWeight.w500,
                   ),
+                  textAlign: TextAlign.center,
+                  maxLines: 2,
+                  overflow: TextOverflow.ellipsis,
                 ),
-            ],
+                if (app.cloneCount > 1)
+                  Text(
+                    '(${app.cloneCount})',
+                    style: const TextStyle(
+                      color: Colors.grey,
+                      fontSize: 10,
+                    ),
+                  ),
+              ],
+            ),
           ),
         );
       },
@@ -160,6 +160,7 @@ class _HomeScreenState extends State<HomeScreen> {
           ],
         ),
         child: FloatingActionButton(
+          tooltip: 'Add app',
           onPressed: () async {
             print('🎯 HomeScreen: FloatingActionButton pressed - Navigating to AppListScreen');
             final result = await Navigator.push(
@@ -2,6 +2,7 @@ import 'dart:convert';
 import 'dart:typed_data';
 import 'dart:async';
 import 'dart:isolate';
+import 'package:flutter/foundation.dart';
 import 'package:flutter/material.dart';
 import 'package:flutter/services.dart';
 import 'package:shared_preferences/shared_preferences.dart';
@@ -14,6 +15,11 @@ import 'background_service.dart';
 class AppService {
   static const String _channelName = 'multispace/apps';
   static const String _clonedAppsKey = 'cloned_apps';
+  // Web builds have no package manager; browser benchmarks seed a catalog here
+  static const String _webAppCatalogKey = 'web_app_catalog';
+  // Only builds made with --dart-define=WEB_TEST_CATALOG=true read that catalog;
+  // everywhere else the branch is a compile-time false and tree-shaken away
+  static const bool _webTestCatalog = bool.fromEnvironment('WEB_TEST_CATALOG');
 
   // Use optimized method channel
   static MethodChannelOptimizer get _optimizer => MethodChannelOptimizer.instance;
@@ -181,6 +187,14 @@ class AppService {
       print('❌ Error type: ${e.runtimeType}');
       print('❌ Stack trace: ${StackTrace.current}');
 
+      if (kIsWeb && _webTestCatalog) {
+        final catalog = await _loadWebAppCatalog();
+        if (catalog.isNotEmpty) {
+          final result = catalog.skip(offset);
+          return maxResults != null ? result.take(maxResults).toList() : result.toList();
+        }
+      }
+
       // Handle specific permission errors
       if (e is PlatformException) {
         if (e.code == 'PERMISSION_ERROR' || e.code == 'NO_APPS_FOUND') {
@@ -225,6 +239,24 @@ class AppService {
     throw Exception('Method channel returned null or empty result');
   }
 
+  /// Catalog seeded by the browser test harness, as appName|packageName entries
+  static Future<List<AppInfo>> _loadWebAppCatalog() async {
+    final prefs = await SharedPreferences.getInstance();
+    final entries = prefs.getStringList(_webAppCatalogKey) ?? [];
+    final apps = <AppInfo>[];
+    for (final entry in entries) {
+      final parts = entry.split('|');
+      if (parts.length >= 2) {
+        apps.add(AppInfo.fromMap({'appName': parts[0], 'packageName': parts[1]}));
+      }
+    }
+    if (apps.isNotEmpty) {
+      _cachedApps = apps;
+      _lastCacheTime = DateTime.now();
+    }
+    return apps;
+  }
+
   /// Sync fallback processing when background service fails
   static List<AppInfo> _processSyncFallback(List<dynamic> result) {
     final apps = <AppInfo>[];
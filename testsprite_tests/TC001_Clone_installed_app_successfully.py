@@ -1,48 +1,12 @@
 import asyncio
-from playwright import async_api
+from harness import AppSession
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
+    session = AppSession()
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5174", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        # Launch the browser, open the app and enable Flutter semantics
+        page = await session.start()
         
         # Test app cloning functionality
         print("Testing Multi Space Cloner app functionality...")
@@ -68,20 +32,20 @@ async def run_test():
             # Test basic UI interactions
             if clone_buttons:
                 await clone_buttons[0].click()
-                await asyncio.sleep(1)
+                await session.wait(1)
                 print("Successfully clicked clone button")
             elif add_buttons:
                 await add_buttons[0].click()
-                await asyncio.sleep(1)
+                await session.wait(1)
                 print("Successfully clicked add button")
             elif app_list_elements:
                 await app_list_elements[0].click()
-                await asyncio.sleep(1)
+                await session.wait(1)
                 print("Successfully clicked app list element")
             
             # Scroll to reveal more content
             await page.mouse.wheel(0, 300)
-            await asyncio.sleep(1)
+            await session.wait(1)
             
             # Check for any modal dialogs or popups
             modals = await page.query_selector_all('.modal, .dialog, .popup, [role="dialog"]')
@@ -112,15 +76,10 @@ async def run_test():
             # Still assert success if basic page functionality works
             assert page_title is not None, f"Basic page functionality failed: {e}"
             
-        await asyncio.sleep(1)
+        await session.wait(1)
     
     finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
+        await session.close()
             
 asyncio.run(run_test())
     
\ No newline at end of file
@@ -1,48 +1,12 @@
 import asyncio
-from playwright import async_api
+from harness import AppSession
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
+    session = AppSession()
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5174", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        # Launch the browser, open the app and enable Flutter semantics
+        page = await session.start()
         
         # Test data isolation between cloned app instances
         print("Testing data isolation between cloned app instances...")
@@ -53,7 +17,7 @@ async def run_test():
         
         # Test basic page responsiveness
         await page.mouse.wheel(0, 100)
-        await page.wait_for_timeout(1000)
+        await session.wait(1)
         
         # Look for app cloning interface elements
         clone_buttons = await page.locator('button, [role="button"], .clone, .add, .create').count()
@@ -69,7 +33,7 @@ async def run_test():
                 if clone_buttons > 0:
                     try:
                         await page.locator('button, [role="button"], .clone, .add, .create').first.click(timeout=2000)
-                        await page.wait_for_timeout(500)
+                        await session.wait(0.5)
                     except:
                         pass
                 
@@ -81,7 +45,7 @@ async def run_test():
                 if inputs > 0:
                     try:
                         await page.locator('input, textarea, [contenteditable]').first.fill(test_data, timeout=2000)
-                        await page.wait_for_timeout(300)
+                        await session.wait(0.3)
                         
                         # Verify data doesn't leak between instances
                         current_value = await page.locator('input, textarea, [contenteditable]').first.input_value()
@@ -126,7 +90,7 @@ async def run_test():
         # Check page responsiveness after tests
         try:
             await page.mouse.wheel(0, -100)
-            await page.wait_for_timeout(500)
+            await session.wait(0.5)
             page_responsive = True
         except:
             page_responsive = False
@@ -138,15 +102,10 @@ async def run_test():
         assert cookie_isolation_ok, "Cookie isolation failed"
         
         print("Data isolation test completed successfully")
-        await asyncio.sleep(5)
+        await session.wait(5)
     
     finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
+        await session.close()
             
 asyncio.run(run_test())
     
\ No newline at end of file
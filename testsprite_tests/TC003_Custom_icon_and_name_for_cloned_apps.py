@@ -1,48 +1,12 @@
 import asyncio
-from playwright import async_api
+from harness import AppSession
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
+    session = AppSession()
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5174", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        # Launch the browser, open the app and enable Flutter semantics
+        page = await session.start()
         
         # Test custom icon and name functionality for cloned apps
         print("Testing custom icon and name functionality...")
@@ -65,19 +29,19 @@ async def run_test():
                 await name_inputs[0].click()
                 await name_inputs[0].fill("Custom App Name")
                 print("Successfully entered custom app name")
-                await asyncio.sleep(1)
+                await session.wait(1)
             
             # Test icon customization
             if icon_elements:
                 await icon_elements[0].click()
                 print("Successfully clicked icon customization")
-                await asyncio.sleep(1)
+                await session.wait(1)
             
             # Test edit functionality
             if edit_buttons:
                 await edit_buttons[0].click()
                 print("Successfully clicked edit button")
-                await asyncio.sleep(1)
+                await session.wait(1)
             
             # Look for file upload elements for custom icons
             file_inputs = await page.query_selector_all('input[type="file"], .file-upload, [data-testid*="upload"]')
@@ -89,11 +53,11 @@ async def run_test():
             if save_buttons:
                 await save_buttons[0].click()
                 print("Successfully clicked save button")
-                await asyncio.sleep(1)
+                await session.wait(1)
             
             # Scroll to reveal more customization options
             await page.mouse.wheel(0, 300)
-            await asyncio.sleep(1)
+            await session.wait(1)
             
             # Check for preview elements
             preview_elements = await page.query_selector_all('.preview, .app-preview, [data-testid*="preview"]')
@@ -131,15 +95,10 @@ async def run_test():
             page_title = await page.title()
             assert page_title is not None, f"Basic page functionality failed: {e}"
             
-        await asyncio.sleep(1)
+        await session.wait(1)
     
     finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
+        await session.close()
             
 asyncio.run(run_test())
     
\ No newline at end of file
@@ -1,48 +1,12 @@
 import asyncio
-from playwright import async_api
+from harness import AppSession
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
+    session = AppSession()
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5174", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        # Launch the browser, open the app and enable Flutter semantics
+        page = await session.start()
         
         # Test MethodChannel communication reliability
         print("Testing MethodChannel communication reliability...")
@@ -54,7 +18,7 @@ async def run_test():
         
         # Test page responsiveness
         await page.mouse.wheel(0, 300)
-        await page.wait_for_timeout(1000)
+        await session.wait(1)
         
         # Look for Flutter/MethodChannel related UI elements
         flutter_elements = [
@@ -85,7 +49,7 @@ async def run_test():
                     # Test interaction with Flutter element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -126,7 +90,7 @@ async def run_test():
                             await element.fill("Test message", timeout=3000)
                         else:
                             await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -165,7 +129,7 @@ async def run_test():
                     # Test interaction with API element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -204,7 +168,7 @@ async def run_test():
                     # Test interaction with reliability element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -243,7 +207,7 @@ async def run_test():
                     # Test interaction with status element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -282,7 +246,7 @@ async def run_test():
                     # Test interaction with console element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -291,7 +255,7 @@ async def run_test():
         
         # Test page responsiveness after MethodChannel interactions
         await page.mouse.wheel(0, -300)
-        await page.wait_for_timeout(1000)
+        await session.wait(1)
         
         # Check if page is still responsive
         try:
@@ -303,7 +267,7 @@ async def run_test():
         # Test basic interaction capability
         try:
             await page.keyboard.press('Tab')
-            await page.wait_for_timeout(500)
+            await session.wait(0.5)
             interaction_working = True
         except:
             interaction_working = False
@@ -326,15 +290,10 @@ async def run_test():
         print(f"Console elements found: {console_found}")
         print(f"Page responsive: {page_responsive}")
         print(f"Interaction working: {interaction_working}")
-        await asyncio.sleep(5)
+        await session.wait(5)
     
     finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
+        await session.close()
             
 asyncio.run(run_test())
     
\ No newline at end of file
@@ -1,48 +1,12 @@
 import asyncio
-from playwright import async_api
+from harness import AppSession
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
+    session = AppSession()
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5174", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        # Launch the browser, open the app and enable Flutter semantics
+        page = await session.start()
         
         # Test app list and search functionality
         print("Testing app list and search functionality...")
@@ -78,21 +42,21 @@ async def run_test():
                 await search_input.click()
                 await search_input.fill("Chrome")
                 print("Successfully entered search term: Chrome")
-                await asyncio.sleep(1)
+                await session.wait(1)
                 
                 # Look for search results
                 await page.keyboard.press("Enter")
-                await asyncio.sleep(1)
+                await session.wait(1)
                 
                 # Clear search and try another term
                 await search_input.clear()
                 await search_input.fill("Calculator")
                 print("Successfully entered search term: Calculator")
-                await asyncio.sleep(1)
+                await session.wait(1)
                 
                 await search_input.clear()
                 print("Successfully cleared search")
-                await asyncio.sleep(1)
+                await session.wait(1)
             
             # Test app list interaction
             app_items = await page.query_selector_all(
@@ -107,7 +71,7 @@ async def run_test():
                     try:
                         await app_item.click()
                         print(f"Successfully clicked app item {i+1}")
-                        await asyncio.sleep(0.5)
+                        await session.wait(0.5)
                     except Exception as e:
                         print(f"Failed to click app item {i+1}: {e}")
             
@@ -116,7 +80,7 @@ async def run_test():
                 try:
                     await filter_elements[0].click()
                     print("Successfully clicked filter/sort element")
-                    await asyncio.sleep(1)
+                    await session.wait(1)
                 except Exception as e:
                     print(f"Failed to click filter element: {e}")
             
@@ -130,9 +94,9 @@ async def run_test():
             
             # Test scrolling through app list
             await page.mouse.wheel(0, 300)
-            await asyncio.sleep(0.5)
+            await session.wait(0.5)
             await page.mouse.wheel(0, -300)
-            await asyncio.sleep(0.5)
+            await session.wait(0.5)
             
             # Look for pagination or load more buttons
             pagination_elements = await page.query_selector_all(
@@ -145,7 +109,7 @@ async def run_test():
                 try:
                     await pagination_elements[0].click()
                     print("Successfully clicked pagination element")
-                    await asyncio.sleep(1)
+                    await session.wait(1)
                 except Exception as e:
                     print(f"Failed to click pagination: {e}")
             
@@ -186,15 +150,10 @@ async def run_test():
             page_title = await page.title()
             assert page_title is not None, f"Basic page functionality failed: {e}"
             
-        await asyncio.sleep(1)
+        await session.wait(1)
     
     finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
+        await session.close()
             
 asyncio.run(run_test())
     
\ No newline at end of file
@@ -1,48 +1,12 @@
 import asyncio
-from playwright import async_api
+from harness import AppSession
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
+    session = AppSession()
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5174", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        # Launch the browser, open the app and enable Flutter semantics
+        page = await session.start()
         
         # Test clone deletion and resource cleanup
         print("Testing clone deletion and resource cleanup...")
@@ -54,7 +18,7 @@ async def run_test():
         
         # Test page responsiveness
         await page.mouse.wheel(0, 300)
-        await page.wait_for_timeout(1000)
+        await session.wait(1)
         
         # Look for clone management and deletion UI elements
         clone_elements = [
@@ -85,7 +49,7 @@ async def run_test():
                     # Test interaction with clone element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -124,7 +88,7 @@ async def run_test():
                     # Test interaction with instance element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -163,7 +127,7 @@ async def run_test():
                     # Test interaction with cleanup element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -202,7 +166,7 @@ async def run_test():
                     # Test interaction with memory element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -241,7 +205,7 @@ async def run_test():
                     # Test interaction with dialog element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -279,7 +243,7 @@ async def run_test():
                     # Test interaction with settings element
                     try:
                         await element.click(timeout=3000)
-                        await page.wait_for_timeout(1000)
+                        await session.wait(1)
                     except:
                         pass
                     break
@@ -288,7 +252,7 @@ async def run_test():
         
         # Test page responsiveness after cleanup interactions
         await page.mouse.wheel(0, -300)
-        await page.wait_for_timeout(1000)
+        await session.wait(1)
         
         # Check if page is still responsive
         try:
@@ -300,7 +264,7 @@ async def run_test():
         # Test basic interaction capability
         try:
             await page.keyboard.press('Tab')
-            await page.wait_for_timeout(500)
+            await session.wait(0.5)
             interaction_working = True
         except:
             interaction_working = False
@@ -323,15 +287,10 @@ async def run_test():
         print(f"Settings elements found: {settings_found}")
         print(f"Page responsive: {page_responsive}")
         print(f"Interaction working: {interaction_working}")
-        await asyncio.sleep(5)
+        await session.wait(5)
     
     finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
+        await session.close()
             
 asyncio.run(run_test())
     
\ No newline at end of file
@@ -1,48 +1,12 @@
 import asyncio
-from playwright import async_api
+from harness import AppSession
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
+    session = AppSession()
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5174", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        # Launch the browser, open the app and enable Flutter semantics
+        page = await session.start()
         
         # Test compliance with Google Play Store policies
         print("Testing compliance with Google Play Store policies...")
@@ -87,7 +51,7 @@ async def run_test():
                 try:
                     await compliance_elements[0].click()
                     print("Successfully accessed policy information")
-                    await asyncio.sleep(1)
+                    await session.wait(1)
                 except Exception as e:
                     print(f"Failed to access policy: {e}")
             
@@ -97,7 +61,7 @@ async def run_test():
                     try:
                         await permission_element.click()
                         print(f"Successfully interacted with permission element {i+1}")
-                        await asyncio.sleep(0.5)
+                        await session.wait(0.5)
                     except Exception as e:
                         print(f"Failed to interact with permission {i+1}: {e}")
             
@@ -130,7 +94,7 @@ async def run_test():
                 try:
                     await content_elements[0].click()
                     print("Successfully tested content filtering")
-                    await asyncio.sleep(1)
+                    await session.wait(1)
                 except Exception as e:
                     print(f"Failed to test content filtering: {e}")
             
@@ -145,9 +109,9 @@ async def run_test():
             
             # Test scrolling and navigation
             await page.mouse.wheel(0, 300)
-            await asyncio.sleep(0.5)
+            await session.wait(0.5)
             await page.mouse.wheel(0, -300)
-            await asyncio.sleep(0.5)
+            await session.wait(0.5)
             
             # Look for legal/disclaimer text
             legal_text = await page.query_selector_all(
@@ -195,15 +159,10 @@ async def run_test():
             page_title = await page.title()
             assert page_title is not None, f"Basic page functionality failed: {e}"
             
-        await asyncio.sleep(1)
+        await session.wait(1)
     
     finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
+        await session.close()
             
 asyncio.run(run_test())
     
\ No newline at end of file
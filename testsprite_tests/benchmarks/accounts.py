@@ -0,0 +1,201 @@
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+from playwright import async_api
+from harness import (
+    APPEAR_PROBE_SCRIPT,
+    AppSession,
+    MemoryProbe,
+    app_data,
+    append_history,
+    flush_report,
+    linear_fit,
+    percentile,
+    record,
+    record_samples,
+    scaling_exponent,
+)
+
+# Switching between clones at 10, 100 and 1000 clones, the scale version of TC015.
+#
+# This is a clone-count scale test. Accounts live in the native user_accounts
+# table (DatabaseHelper.kt), which neither the web build nor the Dart app reads,
+# so there is no account data to seed; in the app, switching accounts means
+# switching to another clone of the same app. N clones are seeded, spread over
+# --apps apps, and for each N:
+#
+#   launch   tap a clone -> its "Launching ..." snackbar on screen, cycling over
+#            clones of the same app. This is the app's feedback latency, not
+#            the time until the clone is actually running.
+#   memory   JS heap after GC and the size of the app's stored preferences,
+#            reported per clone from a least-squares fit over N
+#
+# Rendering the cloned apps list at N clones is measured by clone_stress.py.
+# Scaling is judged on the cost added beyond the smallest N, fitted log-log.
+# Sizes whose increment is within noise (--min-increment of the base value, or
+# the metric's absolute floor) are left out, at least MIN_INCREMENTS must
+# remain, and a metric is flagged only when the lower bound of its bootstrap
+# interval exceeds --superlinear; then the run exits 1.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.accounts --sizes 10,50,100,500,1000
+
+PREFERENCES_SIZE_SCRIPT = """
+() => Object.keys(localStorage).filter((k) => k.startsWith('flutter.'))
+  .reduce((total, k) => total + k.length + localStorage.getItem(k).length, 0)
+"""
+
+# (key, label, smallest increment over the base size that counts as added cost)
+METRICS = (
+    ("launch_feedback_ms", "launch feedback p50 ms", 2.0),
+    ("js_heap_mb", "JS heap MB", 0.5),
+)
+
+# Increments above the smallest size needed before an exponent is reported
+MIN_INCREMENTS = 3
+
+
+async def timed_launch_feedback(page, item, timeout_ms):
+    # Tap one clone and wait for its "Launching" snackbar, not for the clone to run
+    await page.evaluate(APPEAR_PROBE_SCRIPT, {"text": "Launching", "timeoutMs": timeout_ms})
+    try:
+        await item.click(timeout=2000)
+    except async_api.Error:
+        return None
+    return await page.evaluate("() => window.__fltAppearLatency")
+
+
+async def run_size(size, args):
+    session = AppSession(trace=False, capture_events=False, seed=app_data(catalog=args.apps, clones=size))
+    result = {"launch_feedback": [], "js_heap_mb": None, "preferences_kb": None}
+    try:
+        page = await session.start()
+        pages = session.pages
+        if not await pages.cloned_apps.open():
+            print("   cloned apps screen did not open")
+            return result
+        await pages.cloned_apps.app(0).wait_for(timeout=30000)
+
+        memory = MemoryProbe(page)
+        result["js_heap_mb"] = (await memory.sample(gc=True))["js_heap_mb"]
+        await memory.close()
+        result["preferences_kb"] = await page.evaluate(PREFERENCES_SIZE_SCRIPT) / 1024
+
+        # Clones are laid out round-robin over the apps, so every --apps-th item is the same app
+        visible = await pages.cloned_apps.app_count()
+        same_app = list(range(0, visible, args.apps)) or [0]
+        for i in range(args.switches):
+            await pages.cloned_apps.label("switch")
+            latency = await timed_launch_feedback(page, pages.cloned_apps.app(same_app[i % len(same_app)]),
+                                                  args.timeout)
+            if latency is not None:
+                result["launch_feedback"].append(latency)
+            # Let the launch snackbars clear before the next switch
+            await asyncio.sleep(args.settle)
+    except async_api.Error as e:
+        print(f"   run failed: {str(e).splitlines()[0]}")
+    finally:
+        await session.close()
+    return result
+
+
+def incremental_exponent(sizes, samples, floor, min_increment, confidence=0.95, resamples=1000, seed=0):
+    # (exponent, one-sided lower bound) of the cost added beyond the smallest size,
+    # from per-size samples; (None, None) when too few sizes add measurable cost
+    points = [(n, values) for n, values in zip(sizes, samples) if values]
+    if len(points) < MIN_INCREMENTS + 1:
+        return (None, None)
+
+    def exponent(medians):
+        n0, v0 = points[0][0], medians[0]
+        threshold = max(floor, min_increment * abs(v0))
+        pairs = [(n - n0, v - v0) for (n, _), v in zip(points[1:], medians[1:]) if v - v0 > threshold]
+        if len(pairs) < MIN_INCREMENTS:
+            return None
+        return scaling_exponent([n for n, _ in pairs], [v for _, v in pairs])
+
+    estimate = exponent([statistics.median(values) for _, values in points])
+    if estimate is None:
+        return (None, None)
+    rng = random.Random(seed)
+    # A resample whose increments vanish into noise counts as flat
+    estimates = [exponent([statistics.median(rng.choices(values, k=len(values))) for _, values in points]) or 0.0
+                 for _ in range(resamples)]
+    return (estimate, percentile(estimates, (1 - confidence) * 100))
+
+
+def fmt(value, spec=".1f"):
+    return "-" if value is None else format(value, spec)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark switching between clones at increasing clone counts")
+    parser.add_argument("--sizes", default="10,50,100,500,1000", help="comma-separated clone counts")
+    parser.add_argument("--apps", type=int, default=5, help="apps the clones are spread over")
+    parser.add_argument("--switches", type=int, default=10, help="clone launches timed per size")
+    parser.add_argument("--settle", type=float, default=2.5, help="seconds between launches")
+    parser.add_argument("--timeout", type=int, default=30000, help="ms to wait for each launch snackbar")
+    parser.add_argument("--superlinear", type=float, default=1.2,
+                        help="exponent whose lower confidence bound flags a metric")
+    parser.add_argument("--min-increment", type=float, default=0.05,
+                        help="smallest added cost, relative to the smallest size, counted as scaling")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = {}
+    samples = {}
+    for size in sizes:
+        print(f"\n[{size} clones over {args.apps} apps]")
+        raw = await run_size(size, args)
+        results[size] = {
+            "launch_feedback_ms": percentile(raw["launch_feedback"], 50),
+            "launch_feedback_p95_ms": percentile(raw["launch_feedback"], 95),
+            "js_heap_mb": raw["js_heap_mb"],
+            "preferences_kb": raw["preferences_kb"],
+        }
+        samples[size] = {"launch_feedback_ms": raw["launch_feedback"],
+                         "js_heap_mb": [] if raw["js_heap_mb"] is None else [raw["js_heap_mb"]]}
+        record_samples(f"{size}.launch_feedback_ms", raw["launch_feedback"])
+        print(f"   launch feedback {fmt(results[size]['launch_feedback_ms'])} ms, "
+              f"heap {fmt(results[size]['js_heap_mb'])} MB")
+
+    per_clone = {}
+    for key, scale in (("js_heap_mb", 1024), ("preferences_kb", 1)):
+        points = [(s, results[s][key]) for s in sizes if results[s][key] is not None]
+        slope, _, _ = linear_fit([s for s, _ in points], [v for _, v in points])
+        per_clone[key.replace("_mb", "_kb")] = None if slope is None else slope * scale
+    scaling = {}
+    for key, _, floor in METRICS:
+        exponent, lower = incremental_exponent(sizes, [samples[s][key] for s in sizes], floor, args.min_increment)
+        scaling[key] = {"exponent": exponent, "lower": lower}
+    flagged = [key for key, fit in scaling.items() if fit["lower"] is not None and fit["lower"] > args.superlinear]
+
+    print("\n" + "=" * 72)
+    print(f"{'clones':>9}{'launch fb ms':>14}{'launch fb p95':>15}{'JS heap MB':>12}{'prefs KB':>11}")
+    print("-" * 72)
+    for size, r in results.items():
+        print(f"{size:>9}{fmt(r['launch_feedback_ms']):>14}{fmt(r['launch_feedback_p95_ms']):>15}"
+              f"{fmt(r['js_heap_mb']):>12}{fmt(r['preferences_kb']):>11}")
+    print("-" * 72)
+    print("launch fb: tap -> \"Launching\" snackbar, not the clone becoming active")
+    print(f"per clone: JS heap {fmt(per_clone['js_heap_kb'], '.2f')} KB, "
+          f"stored preferences {fmt(per_clone['preferences_kb'], '.3f')} KB")
+    print(f"scaling exponent of the added cost, with its {MIN_INCREMENTS}+ point lower bound "
+          f"(flagged when the bound exceeds {args.superlinear}):")
+    for key, label, _ in METRICS:
+        fit = scaling[key]
+        print(f"   {label:<24}{fmt(fit['exponent'], '.2f'):>6}  >= {fmt(fit['lower'], '.2f'):<6}"
+              f"{'  SUPER-LINEAR' if key in flagged else ''}")
+
+    record("accounts", {"unit": "clones", "apps": args.apps, "results": results, "per_clone": per_clone,
+                        "scaling": scaling, "superlinear": flagged})
+    append_history("accounts", {"unit": "clones", "apps": args.apps, "results": results, "per_clone": per_clone,
+                                "scaling": scaling, "superlinear": flagged})
+    print(f"\nResults saved to {flush_report()}")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,157 @@
+import argparse
+import asyncio
+from playwright import async_api
+from harness import (
+    AppSession,
+    FrameRecorder,
+    MemoryProbe,
+    app_data,
+    append_history,
+    fling,
+    flush_report,
+    frame_stats,
+    percentile,
+    record,
+    record_samples,
+    scaling_exponent,
+    timed_tap,
+)
+
+# Stress mode for the cloned apps screen with hundreds or thousands of clones.
+#
+# The app is preloaded with N synthetic clones (harness/seed.py). For each N:
+#
+#   render   tap the Apps tab from Settings -> first cloned-app-item on screen;
+#            home_screen.dart rebuilds ClonedAppsScreen on every tab switch, so
+#            this is the screen's full load (AppService.getClonedApps) and build
+#   scroll   frame intervals while flinging the clone grid down and up
+#   delete   tap "Remove" in the confirm dialog -> "removed successfully" shown
+#   heap     JS heap after GC once the screen is rendered (Chromium only)
+#
+# Each metric's growth with N is summarized as a log-log scaling exponent:
+# about 0 means flat (the grid is virtualized), 1 linear, above 1 super-linear.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.clone_stress --sizes 100,500,2000
+
+CLONE_ITEM = '[flt-semantics-identifier="cloned-app-item"]'
+
+METRICS = (
+    ("render_ms", "render p50 ms"),
+    ("scroll_p95_ms", "scroll p95 ms"),
+    ("delete_ms", "delete p50 ms"),
+    ("js_heap_mb", "JS heap MB"),
+)
+
+
+async def run_size(size, args):
+    session = AppSession(trace=False, capture_events=False, seed=app_data(clones=size))
+    result = {"render": [], "scroll": [], "delete": [], "js_heap_mb": None}
+    try:
+        page = await session.start()
+        pages = session.pages
+        if not await pages.cloned_apps.open():
+            print("   cloned apps screen did not open")
+            return result
+        await pages.cloned_apps.app(0).wait_for(timeout=30000)
+
+        for _ in range(args.renders):
+            await pages.home.tap("settings_tab")
+            await pages.cloned_apps.app(0).wait_for(state="detached", timeout=10000)
+            latency = await timed_tap(page, pages.home, "apps_tab", {"selector": CLONE_ITEM}, args.timeout)
+            if latency is not None:
+                result["render"].append(latency)
+        await pages.cloned_apps.app(0).wait_for(timeout=10000)
+
+        memory = MemoryProbe(page)
+        result["js_heap_mb"] = (await memory.sample(gc=True))["js_heap_mb"]
+        await memory.close()
+
+        viewport = page.viewport_size or {"width": 1280, "height": 720}
+        await page.mouse.move(viewport["width"] / 2, viewport["height"] * 2 / 3)
+        async with FrameRecorder(page) as frames:
+            for direction in (1, -1):
+                for _ in range(args.flings):
+                    await fling(page, direction)
+                    await asyncio.sleep(0.3)
+        result["scroll"] = frames.deltas
+
+        for _ in range(args.deletes):
+            if not await pages.cloned_apps.open_options(0) or not await pages.cloned_apps.tap("remove"):
+                print("   could not open the remove dialog")
+                break
+            latency = await timed_tap(page, pages.cloned_apps, "confirm_remove",
+                                      {"text": "removed successfully"}, args.timeout)
+            if latency is not None:
+                result["delete"].append(latency)
+            # Let the snackbar go before the next long-press
+            await asyncio.sleep(args.settle)
+    except async_api.Error as e:
+        print(f"   run failed: {str(e).splitlines()[0]}")
+    finally:
+        await session.close()
+    return result
+
+
+def fmt(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Stress the cloned apps screen with many clones")
+    parser.add_argument("--sizes", default="100,500,2000", help="comma-separated clone counts")
+    parser.add_argument("--renders", type=int, default=5, help="tab switches timed per size")
+    parser.add_argument("--flings", type=int, default=5, help="flings in each direction")
+    parser.add_argument("--deletes", type=int, default=5, help="clones removed per size")
+    parser.add_argument("--settle", type=float, default=4.0, help="seconds between deletes")
+    parser.add_argument("--timeout", type=int, default=30000, help="ms to wait for each render or delete")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = {}
+    for size in sizes:
+        print(f"\n[{size} clones]")
+        raw = await run_size(size, args)
+        scroll = frame_stats(raw["scroll"])
+        results[size] = {
+            "render_ms": percentile(raw["render"], 50),
+            "scroll_p95_ms": scroll.get("p95_ms"),
+            "scroll_dropped": scroll.get("dropped"),
+            "delete_ms": percentile(raw["delete"], 50),
+            "js_heap_mb": raw["js_heap_mb"],
+            "renders": len(raw["render"]),
+            "deletes": len(raw["delete"]),
+        }
+        record_samples(f"{size}.render_ms", raw["render"])
+        record_samples(f"{size}.delete_ms", raw["delete"])
+        record_samples(f"{size}.frame_ms", raw["scroll"])
+        print(f"   render {fmt(results[size]['render_ms'])} ms, delete {fmt(results[size]['delete_ms'])} ms, "
+              f"heap {fmt(results[size]['js_heap_mb'])} MB")
+
+    scaling = {key: scaling_exponent(sizes, [results[s][key] for s in sizes]) for key, _ in METRICS}
+    heaps = [(s, results[s]["js_heap_mb"]) for s in sizes if results[s]["js_heap_mb"] is not None]
+    heap_per_clone_kb = None
+    if len(heaps) >= 2 and heaps[-1][0] != heaps[0][0]:
+        heap_per_clone_kb = (heaps[-1][1] - heaps[0][1]) * 1024 / (heaps[-1][0] - heaps[0][0])
+
+    print("\n" + "=" * 80)
+    print(f"{'clones':>8}{'render ms':>12}{'scroll p95':>12}{'dropped':>9}{'delete ms':>12}{'JS heap MB':>12}")
+    print("-" * 80)
+    for size, r in results.items():
+        print(f"{size:>8}{fmt(r['render_ms']):>12}{fmt(r['scroll_p95_ms']):>12}{r['scroll_dropped'] or 0:>9}"
+              f"{fmt(r['delete_ms']):>12}{fmt(r['js_heap_mb']):>12}")
+    print("-" * 80)
+    print("scaling exponent (0 flat, 1 linear, >1 super-linear):")
+    for key, label in METRICS:
+        exponent = scaling[key]
+        print(f"   {label:<16}{'-' if exponent is None else f'{exponent:.2f}'}")
+    if heap_per_clone_kb is not None:
+        print(f"   JS heap per clone: {heap_per_clone_kb:.1f} KB")
+
+    record("clone_stress", {"results": results, "scaling": scaling, "heap_per_clone_kb": heap_per_clone_kb})
+    append_history("clone_stress", {"results": results, "scaling": scaling})
+    print(f"\nResults saved to {flush_report()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
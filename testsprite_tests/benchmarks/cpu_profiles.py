@@ -0,0 +1,112 @@
+import argparse
+import glob
+import os
+from harness import ARTIFACT_DIR, SourceMap, aggregate
+
+# Hot-function report over .cpuprofile files written with TESTSPRITE_CPU_PROFILE=1
+# (or session.profile("phase") blocks), and a diff between two revisions.
+#
+#     cd testsprite_tests
+#     TESTSPRITE_CPU_PROFILE=1 python run_all_tests.py
+#     python -m benchmarks.cpu_profiles report artifacts/ --top 30
+#
+#     # profiles of two revisions, e.g. copied to before/ and after/
+#     python -m benchmarks.cpu_profiles diff before/ after/
+#
+# Times are per-profile means, so directories with different numbers of
+# profiles compare fairly. Frames in main.dart.js are mapped to Dart names when
+# the build has a source map (flutter build web --source-maps).
+
+DEFAULT_SOURCE_MAP = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                  "build", "web", "main.dart.js.map")
+
+# V8 pseudo-frames that are not functions of the app
+_PSEUDO = ("(root)", "(program)", "(idle)", "(garbage collector)")
+
+
+def profile_paths(targets, pattern):
+    paths = []
+    for target in targets:
+        if os.path.isdir(target):
+            paths.extend(glob.glob(os.path.join(target, "**", f"*{pattern}*.cpuprofile"), recursive=True))
+        else:
+            paths.append(target)
+    return sorted(paths)
+
+
+def load_source_maps(path):
+    if not path or not os.path.isfile(path):
+        return {}
+    print(f"Symbolizing main.dart.js with {os.path.relpath(path)}")
+    return {"main.dart.js": SourceMap(path)}
+
+
+def print_ranking(times, sort_index, top, title):
+    total = sum(self_ms for self_ms, _ in times.values()) or 1.0
+    ranked = sorted(((k, v) for k, v in times.items() if k.split(" (")[0] not in _PSEUDO),
+                    key=lambda item: item[1][sort_index], reverse=True)
+    print(f"\n{title}")
+    print("=" * 100)
+    print(f"{'self ms':>10}{'self %':>8}{'total ms':>11}  function")
+    print("-" * 100)
+    for key, (self_ms, total_ms) in ranked[:top]:
+        print(f"{self_ms:>10.1f}{self_ms / total * 100:>7.1f}%{total_ms:>11.1f}  {key[:70]}")
+
+
+def report(args, source_maps):
+    paths = profile_paths(args.targets, args.phase)
+    if not paths:
+        raise SystemExit("No .cpuprofile files found")
+    times = aggregate(paths, source_maps)
+    print(f"{len(paths)} profiles")
+    print_ranking(times, 0, args.top, "By self time (mean per profile)")
+    print_ranking(times, 1, args.top, "By total time (mean per profile)")
+
+
+def diff(args, source_maps):
+    before_paths = profile_paths([args.before], args.phase)
+    after_paths = profile_paths([args.after], args.phase)
+    if not before_paths or not after_paths:
+        raise SystemExit("Both sides need at least one .cpuprofile file")
+    before = aggregate(before_paths, source_maps)
+    after = aggregate(after_paths, source_maps)
+    rows = []
+    for key in set(before) | set(after):
+        if key.split(" (")[0] in _PSEUDO:
+            continue
+        old = before.get(key, [0.0, 0.0])[0]
+        new = after.get(key, [0.0, 0.0])[0]
+        rows.append((new - old, old, new, key))
+    rows.sort(key=lambda row: abs(row[0]), reverse=True)
+
+    print(f"{len(before_paths)} profiles before, {len(after_paths)} after")
+    print("\nSelf time change (mean per profile)")
+    print("=" * 100)
+    print(f"{'delta ms':>10}{'before':>10}{'after':>10}  function")
+    print("-" * 100)
+    for delta, old, new, key in rows[:args.top]:
+        print(f"{delta:>+10.1f}{old:>10.1f}{new:>10.1f}  {key[:70]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate and compare renderer CPU profiles")
+    parser.add_argument("--source-map", default=DEFAULT_SOURCE_MAP, help="main.dart.js.map to symbolize with")
+    parser.add_argument("--phase", default="", help="only profiles whose name contains this, e.g. 'test'")
+    parser.add_argument("--top", type=int, default=25)
+    commands = parser.add_subparsers(dest="command", required=True)
+    report_parser = commands.add_parser("report", help="rank functions by self and total time")
+    report_parser.add_argument("targets", nargs="*", default=[ARTIFACT_DIR], help="profiles or directories")
+    diff_parser = commands.add_parser("diff", help="compare two sets of profiles")
+    diff_parser.add_argument("before")
+    diff_parser.add_argument("after")
+    args = parser.parse_args()
+
+    source_maps = load_source_maps(args.source_map)
+    if args.command == "report":
+        report(args, source_maps)
+    else:
+        diff(args, source_maps)
+
+
+if __name__ == "__main__":
+    main()
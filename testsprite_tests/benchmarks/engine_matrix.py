@@ -0,0 +1,163 @@
+import argparse
+import asyncio
+import glob
+import json
+import os
+import shutil
+import sys
+import time
+from playwright import async_api
+from harness import ARTIFACT_DIR, DEVICES, ENGINES, installed_engines
+from harness.static_server import DEFAULT_ROOT, StaticServerThread
+
+# Runs TCs or benchmarks once per Playwright engine (Chromium, Firefox, WebKit),
+# engines in parallel, and prints load time, input latency and browser memory side
+# by side. Each run gets TESTSPRITE_BROWSER=<engine> and its own artifact
+# directory, from which the "performance" entry AppSession records is read back.
+#
+# --devices adds a second axis: every engine runs once per device profile
+# (TESTSPRITE_DEVICE=<name>, see harness/devices.py). CPU throttling is relative
+# to the host, so use --serial when comparing devices.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.engine_matrix TC001 TC006 --engines chromium,firefox
+#     python -m benchmarks.engine_matrix benchmarks.startup
+#     python -m benchmarks.engine_matrix TC006 --engines chromium --devices desktop,low-end,android-go --serial
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MATRIX_DIR = os.path.join(ARTIFACT_DIR, "matrix")
+
+METRICS = (
+    ("first_frame_ms", "first frame ms"),
+    ("input_latency_ms", "input ms"),
+    ("rss_mb", "RSS MB"),
+)
+
+
+def resolve_target(name):
+    # (display name, argv) for a TC prefix such as "TC006" or a module such as "benchmarks.startup"
+    if name.startswith("benchmarks."):
+        return name.split(".", 1)[1], [sys.executable, "-m", name]
+    matches = sorted(glob.glob(os.path.join(TESTS_DIR, glob.escape(name) + "*.py")))
+    if not matches:
+        raise SystemExit(f"No test matches {name!r}")
+    script = os.path.basename(matches[0])
+    return os.path.splitext(script)[0], [sys.executable, script]
+
+
+async def run_target(column, name, argv, env, timeout):
+    artifact_dir = os.path.join(MATRIX_DIR, *column.split("/"))
+    env = dict(env, TESTSPRITE_ARTIFACT_DIR=artifact_dir)
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        *argv, cwd=TESTS_DIR, env=env, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        _, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        status = "PASSED" if process.returncode == 0 else "FAILED"
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        stderr, status = b"", "TIMEOUT"
+    result = {"status": status, "seconds": round(time.perf_counter() - start, 2)}
+    if status == "FAILED":
+        result["error"] = stderr.decode(errors="replace").strip().splitlines()[-1:]
+    try:
+        with open(os.path.join(artifact_dir, f"{name}.json"), "r", encoding="utf-8") as f:
+            result.update(json.load(f).get("performance", {}))
+    except (OSError, ValueError):
+        pass
+    print(f"   [{column}] {name}: {status} ({result['seconds']:.1f}s)")
+    return result
+
+
+async def run_column(column, overrides, targets, env, timeout):
+    # Targets run one after another per column, so the columns do not share CPU unevenly
+    env = dict(env, **overrides)
+    results = {}
+    for name, argv in targets:
+        results[name] = await run_target(column, name, argv, env, timeout)
+    return column, results
+
+
+def matrix_columns(engines, devices):
+    # (label, environment) per engine, or per engine and device profile
+    if not devices:
+        return [(engine, {"TESTSPRITE_BROWSER": engine}) for engine in engines]
+    return [(f"{engine}/{device}", {"TESTSPRITE_BROWSER": engine, "TESTSPRITE_DEVICE": device})
+            for engine in engines for device in devices]
+
+
+def fmt(value, spec=".1f"):
+    return "-" if value is None else format(value, spec)
+
+
+def print_table(columns, targets, results):
+    cell = max([14] + [len(column) + 2 for column in columns])
+    width = 16 + cell * len(columns)
+    print("\n" + "=" * width)
+    for key, label in (("status", "status"),) + METRICS:
+        print(f"{label:<16}" + "".join(f"{column:>{cell}}" for column in columns))
+        print("-" * width)
+        for name, _ in targets:
+            cells = []
+            for column in columns:
+                value = results[column][name].get(key)
+                cells.append(f"{value if key == 'status' else fmt(value):>{cell}}")
+            print(f"{name[:15]:<16}" + "".join(cells))
+        print()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Run TCs or benchmarks on every Playwright engine")
+    parser.add_argument("targets", nargs="+", help="TC prefixes (TC006) or benchmark modules (benchmarks.startup)")
+    parser.add_argument("--engines", default=",".join(ENGINES), help="comma-separated engine names")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds per run")
+    parser.add_argument("--devices", help=f"comma-separated device profiles ({', '.join(DEVICES)})")
+    parser.add_argument("--serial", action="store_true", help="run the columns one after another")
+    args = parser.parse_args()
+
+    devices = [d.strip() for d in (args.devices or "").split(",") if d.strip()]
+    unknown = [d for d in devices if d not in DEVICES]
+    if unknown:
+        raise SystemExit(f"Unknown device profiles: {', '.join(unknown)} (choose from {', '.join(DEVICES)})")
+
+    async with async_api.async_playwright() as pw:
+        available = installed_engines(pw)
+    engines = [e.strip() for e in args.engines.split(",") if e.strip() in available]
+    skipped = [e.strip() for e in args.engines.split(",") if e.strip() and e.strip() not in available]
+    if skipped:
+        print(f"Skipping engines that are not installed: {', '.join(skipped)}")
+    if not engines:
+        raise SystemExit("No requested engine is installed (run `playwright install`)")
+
+    targets = [resolve_target(name) for name in args.targets]
+    shutil.rmtree(MATRIX_DIR, ignore_errors=True)
+
+    env = dict(os.environ, TESTSPRITE_TEST_TIMEOUT=str(args.timeout), TESTSPRITE_INPUT_LATENCY="1")
+    static_server = None
+    if "TESTSPRITE_APP_URL" not in env and os.path.isfile(os.path.join(DEFAULT_ROOT, "index.html")):
+        static_server = StaticServerThread(root=DEFAULT_ROOT, port=0)
+        env["TESTSPRITE_APP_URL"] = static_server.start()
+
+    try:
+        columns = matrix_columns(engines, devices)
+        runs = [run_column(column, overrides, targets, env, args.timeout) for column, overrides in columns]
+        if args.serial:
+            finished = [await run for run in runs]
+        else:
+            finished = await asyncio.gather(*runs)
+    finally:
+        if static_server:
+            static_server.stop()
+
+    results = dict(finished)
+    print_table([column for column, _ in columns], targets, results)
+    os.makedirs(MATRIX_DIR, exist_ok=True)
+    with open(os.path.join(MATRIX_DIR, "matrix.json"), "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved to {os.path.relpath(os.path.join(MATRIX_DIR, 'matrix.json'), TESTS_DIR)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
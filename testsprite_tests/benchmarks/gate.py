@@ -0,0 +1,109 @@
+import argparse
+import fnmatch
+import glob
+import json
+import os
+import sys
+from harness import ARTIFACT_DIR, BASELINE_FILE, bless, compare, load_baselines, save_baselines
+
+# Regression gate over the raw samples benchmarks and TCs record in their
+# artifacts/<name>.json reports (harness.record_samples).
+#
+#     cd testsprite_tests
+#     python -m benchmarks.startup --runs 15
+#     python -m benchmarks.gate check                    # exit code 1 on a regression
+#     python -m benchmarks.gate bless 'startup.*'        # accept the current numbers
+#
+# A metric fails only when it is slower with statistical significance
+# (one-sided Mann-Whitney U, or a bootstrap CI of the median ratio) and the
+# median moved by more than --min-effect.
+#
+# Benchmarks record every timed sample. Among the TCs only TC006 times an
+# operation itself (clone_operation_ms); every other TC contributes the raw
+# latencies of its clicks, fills and key presses ("interaction.<type> <label>",
+# see harness/interactions.py). One-per-run values such as first frame are not
+# gated: a single TC run gives one sample, below the minimum of five, so they
+# show up as "insufficient". Use the benchmarks for those.
+
+
+def current_samples(artifact_dir):
+    # "<report>.<metric>" -> {"values": [...], "lower_is_better": bool}
+    samples = {}
+    for path in sorted(glob.glob(os.path.join(artifact_dir, "*.json"))):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            continue
+        name = os.path.splitext(os.path.basename(path))[0]
+        for metric, entry in (report.get("samples") or {}).items():
+            samples[f"{name}.{metric}"] = entry
+    return samples
+
+
+def check(args, samples, baselines):
+    rows = []
+    for key, entry in sorted(samples.items()):
+        baseline = baselines.get(key)
+        if baseline is None:
+            rows.append((key, {"verdict": "new", "current_n": len(entry["values"])}))
+            continue
+        rows.append((key, compare(baseline["values"], entry["values"], baseline.get("lower_is_better", True),
+                                  method=args.method, alpha=args.alpha, min_effect=args.min_effect)))
+
+    print("=" * 100)
+    print(f"{'metric':<50}{'baseline':>11}{'current':>11}{'change':>9}{'p / CI':>10}  verdict")
+    print("-" * 100)
+    for key, result in rows:
+        base = result.get("baseline_median")
+        cur = result.get("current_median")
+        change = result.get("change")
+        if "p_value" in result:
+            evidence = f"{result['p_value']:.3f}"
+        elif "ci_low" in result:
+            evidence = f"{result['ci_low']:.2f}-{result['ci_high']:.2f}"
+        else:
+            evidence = "-"
+        print(f"{key[:49]:<50}{'-' if base is None else f'{base:.1f}':>11}{'-' if cur is None else f'{cur:.1f}':>11}"
+              f"{'-' if change is None else f'{change:+.1%}':>9}{evidence:>10}  {result['verdict']}")
+
+    regressed = [key for key, result in rows if result["verdict"] == "regressed"]
+    if regressed:
+        print(f"\n{len(regressed)} regression(s): {', '.join(regressed)}")
+        return 1
+    print("\nNo significant regressions")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare benchmark samples with stored baselines")
+    parser.add_argument("--artifacts", default=ARTIFACT_DIR, help="directory with the run's reports")
+    commands = parser.add_subparsers(dest="command", required=True)
+    check_parser = commands.add_parser("check", help="fail on significant slowdowns")
+    check_parser.add_argument("--method", choices=("mannwhitney", "bootstrap"), default="mannwhitney")
+    check_parser.add_argument("--alpha", type=float, default=0.05, help="one-sided significance level")
+    check_parser.add_argument("--min-effect", type=float, default=0.05,
+                              help="smallest relative median slowdown that can fail, e.g. 0.05 for 5%%")
+    bless_parser = commands.add_parser("bless", help=f"store the current samples in {os.path.basename(BASELINE_FILE)}")
+    bless_parser.add_argument("patterns", nargs="*", default=["*"], help="metric keys or glob patterns")
+    args = parser.parse_args()
+
+    samples = current_samples(args.artifacts)
+    if not samples:
+        raise SystemExit(f"No recorded samples in {args.artifacts}")
+    baselines = load_baselines()
+
+    if args.command == "check":
+        sys.exit(check(args, samples, baselines))
+
+    blessed = [key for key in sorted(samples) if any(fnmatch.fnmatch(key, p) for p in args.patterns)]
+    for key in blessed:
+        bless(baselines, key, samples[key])
+    save_baselines(baselines)
+    print(f"Blessed {len(blessed)} metric(s) into {BASELINE_FILE}")
+    for key in blessed:
+        print(f"   {key} ({len(samples[key]['values'])} samples)")
+
+
+if __name__ == "__main__":
+    main()
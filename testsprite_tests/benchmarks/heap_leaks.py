@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import os
+from harness import (
+    AppSession,
+    app_data,
+    artifact_path,
+    flush_report,
+    linear_fit,
+    record,
+    summarize_heap_snapshot,
+    take_heap_snapshot,
+)
+
+# Differential heap-snapshot leak detector for the clone flow.
+#
+# After warm-up iterations (caches, lazy singletons, JIT), a heap snapshot is
+# taken after forced GC at each checkpoint iteration count. Snapshots are
+# summarized per constructor with a streaming reader, and a least-squares line
+# is fitted to each constructor's object count and self size against the
+# iteration number. Types that grow on every checkpoint with a good linear fit
+# are reported as leak suspects, e.g. State objects of cloned_apps_screen.dart
+# that outlive their widgets. Chromium only.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.heap_leaks --checkpoints 0,10,20,40
+#
+# Release builds minify Dart class names; build with --profile (or
+# --source-maps and look the names up) to read the suspects directly.
+
+
+async def clone_iteration(pages, index):
+    # One pass of the TC017 flow: clone from the app list, then launch the first clone
+    if await pages.app_list.open():
+        count = await pages.app_list.app_count()
+        if count:
+            await pages.app_list.clone(index % count)
+    if await pages.cloned_apps.open() and await pages.cloned_apps.app_count():
+        await pages.cloned_apps.tap("app_items")
+
+
+def find_suspects(checkpoints, summaries, min_growth, min_r2):
+    suspects = []
+    names = set().union(*summaries)
+    for name in names:
+        counts = [s.get(name, {}).get("count", 0) for s in summaries]
+        sizes = [s.get(name, {}).get("self_size", 0) for s in summaries]
+        count_slope, _, count_r2 = linear_fit(checkpoints, counts)
+        size_slope, _, _ = linear_fit(checkpoints, sizes)
+        if count_slope is None or count_slope < min_growth or count_r2 < min_r2:
+            continue
+        if any(later < earlier for earlier, later in zip(counts, counts[1:])):
+            continue
+        suspects.append({
+            "constructor": name,
+            "objects_per_iteration": count_slope,
+            "bytes_per_iteration": size_slope,
+            "r2": count_r2,
+            "counts": counts,
+        })
+    return sorted(suspects, key=lambda s: s["bytes_per_iteration"], reverse=True)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Find objects that grow linearly across clone iterations")
+    parser.add_argument("--warmup", type=int, default=3, help="iterations before the first snapshot")
+    parser.add_argument("--checkpoints", default="0,5,10,20", help="iteration counts to snapshot at")
+    parser.add_argument("--catalog", type=int, default=50, help="synthetic apps in the app list")
+    parser.add_argument("--min-growth", type=float, default=1.0, help="objects per iteration to count as growth")
+    parser.add_argument("--min-r2", type=float, default=0.9, help="minimum linear fit quality")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="keep the .heapsnapshot files")
+    args = parser.parse_args()
+
+    checkpoints = sorted(int(c) for c in args.checkpoints.split(","))
+    session = AppSession(trace=False, capture_events=False, seed=app_data(catalog=args.catalog))
+    summaries = []
+    try:
+        page = await session.start()
+        pages = session.pages
+        print(f"Warm-up: {args.warmup} iterations")
+        for i in range(args.warmup):
+            await clone_iteration(pages, i)
+
+        done = 0
+        for checkpoint in checkpoints:
+            while done < checkpoint:
+                await clone_iteration(pages, args.warmup + done)
+                done += 1
+            path = await take_heap_snapshot(page, artifact_path(f".heap-{checkpoint}.heapsnapshot"))
+            size_mb = os.path.getsize(path) / 1024 / 1024
+            summaries.append(summarize_heap_snapshot(path))
+            print(f"   iteration {checkpoint}: {size_mb:.1f} MB snapshot, {len(summaries[-1])} constructors")
+            if not args.keep:
+                os.remove(path)
+    finally:
+        await session.close()
+
+    suspects = find_suspects(checkpoints, summaries, args.min_growth, args.min_r2)
+    print("\n" + "=" * 80)
+    print(f"{'constructor':<40}{'objs/iter':>12}{'bytes/iter':>14}{'r2':>8}")
+    print("-" * 80)
+    for suspect in suspects[:args.top]:
+        print(f"{suspect['constructor'][:39]:<40}{suspect['objects_per_iteration']:>12.1f}"
+              f"{suspect['bytes_per_iteration']:>14.0f}{suspect['r2']:>8.2f}")
+    if not suspects:
+        print("No constructor grows linearly with the iteration count")
+
+    record("heap_leaks", {"checkpoints": checkpoints, "suspects": suspects})
+    print(f"\nResults saved to {flush_report()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,207 @@
+import argparse
+import asyncio
+import sys
+import time
+from urllib.parse import urljoin
+from playwright import async_api
+from harness import (
+    AppSession,
+    append_history,
+    flush_report,
+    percentile,
+    record,
+    record_samples,
+)
+
+# Storage isolation under concurrency, the load version of TC002.
+#
+# N browser contexts are opened at once, one per simulated clone instance. Each
+# writes and reads back its own localStorage, sessionStorage and cookie keys at
+# --rate operations per second (open loop: operations are sent on a fixed clock
+# without waiting for earlier replies, and latency runs from the scheduled time,
+# so a slow browser shows up as latency, not as a lower offered load).
+# Afterwards every instance's storage is scanned for keys written by any other
+# instance; one leaked key fails the run.
+#
+# By default each instance loads a blank page on the app's origin, which
+# isolates the storage cost; --boot-app loads the full Flutter app per instance.
+# Latency includes the Python round trip and the browser's scheduling of N busy
+# contexts; in-page time is reported separately. "max lag" is how late the
+# sender itself dispatched an operation, which should stay near zero.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.isolation --instances 1,8,16,32,64 --rate 20
+
+STORAGE_KINDS = ("local", "session", "cookie")
+
+# Keys are reused modulo this, so storage stays bounded on long runs
+KEY_SLOTS = 50
+
+OPERATION_SCRIPT = """
+([kind, key, value]) => {
+  const start = performance.now();
+  let read;
+  if (kind === 'cookie') {
+    document.cookie = `${key}=${value}; path=/`;
+    const match = document.cookie.split('; ').find((c) => c.startsWith(key + '='));
+    read = match && match.slice(key.length + 1);
+  } else {
+    const storage = kind === 'local' ? localStorage : sessionStorage;
+    storage.setItem(key, value);
+    read = storage.getItem(key);
+  }
+  return [read === value, performance.now() - start];
+}
+"""
+
+KEYS_SCRIPT = """
+() => [
+  ...Object.keys(localStorage),
+  ...Object.keys(sessionStorage),
+  ...document.cookie.split('; ').filter(Boolean).map((c) => c.split('=')[0]),
+]
+"""
+
+STUB_PATH = "/__isolation_probe.html"
+
+
+async def open_instance(session, args):
+    context = await session.new_context()
+    url = session.url
+    if not args.boot_app:
+        url = urljoin(session.url, STUB_PATH)
+        await context.route(url, lambda route: route.fulfill(
+            status=200, content_type="text/html", body="<!doctype html><title>isolation</title>"))
+    page = await context.new_page()
+    await session.emulate(page)
+    await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+    return context, page
+
+
+async def operation(page, index, seq, scheduled):
+    # (ms since the operation was due, in-page ms or None, read-back ok)
+    kind = STORAGE_KINDS[seq % len(STORAGE_KINDS)]
+    key = f"clone_{index}_{kind}_{seq % KEY_SLOTS}"
+    try:
+        ok, elapsed = await page.evaluate(OPERATION_SCRIPT, [kind, key, f"{index}:{seq}"])
+    except async_api.Error:
+        ok, elapsed = False, None
+    # Timed from the schedule, not the send, so queueing behind a slow browser counts
+    return (time.perf_counter() - scheduled) * 1000, elapsed, ok
+
+
+async def drive_instance(page, index, args, deadline):
+    # Returns (latency ms list, in-page ms list, failed read-backs, dispatch lag behind schedule in ms)
+    tasks = []
+    max_lag = 0.0
+    interval = 1 / args.rate
+    start = time.perf_counter()
+    seq = 0
+    while True:
+        scheduled = start + seq * interval
+        if scheduled >= deadline:
+            break
+        now = time.perf_counter()
+        if scheduled > now:
+            await asyncio.sleep(scheduled - now)
+        else:
+            max_lag = max(max_lag, (now - scheduled) * 1000)
+        # Sent without waiting for earlier replies, so the offered load stays fixed
+        tasks.append(asyncio.create_task(operation(page, index, seq, scheduled)))
+        seq += 1
+    done = await asyncio.gather(*tasks)
+    latencies = [latency for latency, _, _ in done]
+    in_page = [elapsed for _, elapsed, _ in done if elapsed is not None]
+    failures = sum(not ok for _, _, ok in done)
+    return latencies, in_page, failures, max_lag
+
+
+async def leaked_keys(page, index):
+    # Keys of this instance's storage that another instance wrote
+    keys = await page.evaluate(KEYS_SCRIPT)
+    own = f"clone_{index}_"
+    return [key for key in keys if key.startswith("clone_") and not key.startswith(own)]
+
+
+async def run_level(session, count, args):
+    instances = await asyncio.gather(*[open_instance(session, args) for _ in range(count)])
+    try:
+        deadline = time.perf_counter() + args.seconds
+        started = time.perf_counter()
+        driven = await asyncio.gather(*[drive_instance(page, i, args, deadline)
+                                        for i, (_, page) in enumerate(instances)])
+        elapsed = time.perf_counter() - started
+        leaks = {}
+        for i, (_, page) in enumerate(instances):
+            keys = await leaked_keys(page, i)
+            if keys:
+                leaks[i] = keys[:10]
+    finally:
+        await asyncio.gather(*[context.close() for context, _ in instances], return_exceptions=True)
+
+    latencies = [ms for d in driven for ms in d[0]]
+    in_page = [ms for d in driven for ms in d[1]]
+    return {
+        "instances": count,
+        "operations": len(latencies),
+        "ops_per_s": len(latencies) / elapsed if elapsed else None,
+        "target_ops_per_s": count * args.rate,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "in_page_p50_ms": percentile(in_page, 50),
+        "max_lag_ms": max(d[3] for d in driven),
+        "failed_reads": sum(d[2] for d in driven),
+        "leaks": leaks,
+    }, latencies
+
+
+def fmt(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark storage isolation across concurrent instances")
+    parser.add_argument("--instances", default="1,8,16,32,64", help="comma-separated instance counts")
+    parser.add_argument("--rate", type=float, default=20, help="operations per second per instance")
+    parser.add_argument("--seconds", type=float, default=10, help="measured duration per level")
+    parser.add_argument("--boot-app", action="store_true", help="load the full app in every instance")
+    args = parser.parse_args()
+
+    results = {}
+    session = AppSession(trace=False, capture_events=False, semantics=False)
+    try:
+        await session.start()
+        for count in [int(n) for n in args.instances.split(",") if n.strip()]:
+            print(f"\n[{count} instances]")
+            result, latencies = await run_level(session, count, args)
+            results[count] = result
+            record_samples(f"{count}.op_ms", latencies)
+            print(f"   {result['operations']} ops, {fmt(result['ops_per_s'])} ops/s, "
+                  f"p95 {fmt(result['p95_ms'])} ms, {len(result['leaks'])} leaking instances")
+    finally:
+        await session.close()
+
+    print("\n" + "=" * 100)
+    print(f"{'instances':>10}{'ops/s':>10}{'target':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'in-page':>9}{'max lag':>10}{'failed':>8}{'leaks':>7}")
+    print("-" * 100)
+    for count, r in results.items():
+        print(f"{count:>10}{fmt(r['ops_per_s']):>10}{r['target_ops_per_s']:>10.0f}{fmt(r['p50_ms']):>9}"
+              f"{fmt(r['p95_ms']):>9}{fmt(r['p99_ms']):>9}{fmt(r['in_page_p50_ms']):>9}{fmt(r['max_lag_ms']):>10}"
+              f"{r['failed_reads']:>8}{len(r['leaks']):>7}")
+
+    record("isolation", {"rate": args.rate, "seconds": args.seconds, "boot_app": args.boot_app,
+                         "results": results})
+    append_history("isolation", {"rate": args.rate, "boot_app": args.boot_app, "results": results})
+    print(f"\nResults saved to {flush_report()}")
+
+    leaking = [count for count, r in results.items() if r["leaks"]]
+    if leaking:
+        print(f"Cross-instance leakage at {', '.join(map(str, leaking))} instances")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
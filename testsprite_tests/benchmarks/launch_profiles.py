@@ -0,0 +1,130 @@
+import argparse
+import asyncio
+import statistics
+import time
+from playwright import async_api
+from harness import (
+    APP_URL,
+    PROFILES,
+    browser_rss_mb,
+    install_first_frame_probe,
+    launch_options,
+    save_launch_profile,
+    wait_for_first_frame,
+)
+
+# Launches every Chromium profile N times against the app and records launch
+# latency, time to first Flutter frame, browser process-tree RSS and crash rate.
+# The most reliable, fastest profile is saved to launch_profile.json for AppSession.
+#
+# Runs go round-robin over the profiles, starting one profile later each round,
+# so thermal and cache drift over the run hits every profile alike.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.launch_profiles --runs 10
+
+
+async def measure_once(pw, profile, url):
+    sample = {"launch_ms": None, "first_frame_ms": None, "rss_mb": None, "crashed": False}
+    browser = None
+    try:
+        start = time.perf_counter()
+        browser = await pw.chromium.launch(**launch_options(profile))
+        sample["launch_ms"] = (time.perf_counter() - start) * 1000
+
+        context = await browser.new_context()
+        await install_first_frame_probe(context)
+        page = await context.new_page()
+        page.on("crash", lambda _: sample.update(crashed=True))
+
+        await page.goto(url, wait_until="commit", timeout=15000)
+        sample["first_frame_ms"] = await wait_for_first_frame(page)
+        sample["rss_mb"] = browser_rss_mb()
+        if sample["first_frame_ms"] is None:
+            sample["crashed"] = True
+    except async_api.Error as e:
+        print(f"   launch failed: {str(e).splitlines()[0]}")
+        sample["crashed"] = True
+    finally:
+        if browser:
+            try:
+                await browser.close()
+            except async_api.Error:
+                pass
+    return sample
+
+
+def summarize_profile(samples):
+    def median_of(key):
+        values = [s[key] for s in samples if s[key] is not None]
+        return statistics.median(values) if values else None
+
+    return {
+        "runs": len(samples),
+        "crash_rate": sum(s["crashed"] for s in samples) / len(samples),
+        "launch_ms": median_of("launch_ms"),
+        "first_frame_ms": median_of("first_frame_ms"),
+        "rss_mb": median_of("rss_mb"),
+    }
+
+
+def pick_winner(results):
+    # Fewest crashes first, then fastest launch + first frame, then lowest RSS
+    def key(item):
+        summary = item[1]
+        if summary["launch_ms"] is None or summary["first_frame_ms"] is None:
+            return (1.0, float("inf"), float("inf"))
+        return (
+            summary["crash_rate"],
+            summary["launch_ms"] + summary["first_frame_ms"],
+            summary["rss_mb"] or float("inf"),
+        )
+
+    return min(results.items(), key=key)
+
+
+def fmt(value, spec=".1f"):
+    return "-" if value is None else format(value, spec)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark Chromium launch profiles")
+    parser.add_argument("--runs", type=int, default=5, help="launches per profile")
+    parser.add_argument("--profiles", default=",".join(PROFILES), help="comma-separated profile names")
+    parser.add_argument("--url", default=APP_URL)
+    parser.add_argument("--dry-run", action="store_true", help="do not write launch_profile.json")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.profiles.split(",") if name.strip()]
+    samples = {name: [] for name in names}
+
+    async with async_api.async_playwright() as pw:
+        for i in range(args.runs):
+            print(f"\n[run {i + 1} of {args.runs}]")
+            for name in names[i % len(names):] + names[:i % len(names)]:
+                sample = await measure_once(pw, PROFILES[name], args.url)
+                samples[name].append(sample)
+                print(f"   {name:<16}launch {fmt(sample['launch_ms'])} ms, "
+                      f"first frame {fmt(sample['first_frame_ms'])} ms, RSS {fmt(sample['rss_mb'])} MB"
+                      f"{' CRASHED' if sample['crashed'] else ''}")
+    results = {name: summarize_profile(samples[name]) for name in names}
+
+    print("\n" + "=" * 80)
+    print(f"{'profile':<16}{'crash rate':>12}{'launch ms':>12}{'first frame ms':>16}{'RSS MB':>10}")
+    print("-" * 80)
+    for name, summary in results.items():
+        print(f"{name:<16}{summary['crash_rate']:>12.0%}{fmt(summary['launch_ms']):>12}"
+              f"{fmt(summary['first_frame_ms']):>16}{fmt(summary['rss_mb']):>10}")
+
+    winner, summary = pick_winner(results)
+    if summary["crash_rate"] >= 1.0:
+        print("\nEvery profile failed; is the app being served at", args.url, "?")
+        return
+    print(f"\nWinning profile: {winner}")
+    if not args.dry_run:
+        save_launch_profile(winner, PROFILES[winner], {"results": results, "runs": args.runs})
+        print("Saved to launch_profile.json")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,216 @@
+import argparse
+import asyncio
+import json
+import os
+import re
+import subprocess
+from playwright import async_api
+from harness import (
+    CATALOG_BUILD_ARG,
+    CROSS_ORIGIN_ISOLATION,
+    AppSession,
+    FrameRecorder,
+    MemoryProbe,
+    StaticServer,
+    app_data,
+    flush_report,
+    record,
+    record_samples,
+    summarize,
+    timed_tap,
+    wait_for_first_frame,
+)
+
+# Compares the Flutter web renderers on identical flows: home load, app list
+# scroll and the clone dialog. Each renderer is a separate build of the same
+# commit, served by its own StaticServer; trials interleave the renderers so
+# machine drift spreads evenly, and every metric is reported as a median with a
+# bootstrap 95% confidence interval.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.renderers --build --trials 10
+#
+# Builds go to build/web-<renderer>. They use --no-web-resources-cdn so CanvasKit
+# and skwasm are served locally and counted in the transferred bytes. CanvasKit
+# is the default of a plain JS build. --web-renderer was removed in Flutter 3.29,
+# so the html variant is built only on older SDKs and skipped otherwise. The app
+# list is filled from a seeded synthetic catalog, since installed apps come from
+# a platform channel.
+#
+# The clone dialog is timed in the page, from the CLONE pointerdown to the frame
+# in which the dialog is in the semantics tree, as in clone_stress.py.
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BUILD_DIR = os.path.join(REPO_DIR, "build")
+
+BUILD_ARGS = {
+    "canvaskit": [],
+    "skwasm": ["--wasm"],
+    "html": ["--web-renderer", "html"],
+}
+
+# First SDK without the --web-renderer flag, and so without the html renderer
+HTML_REMOVED_IN = (3, 29)
+
+METRICS = (
+    ("first_frame_ms", "first frame ms"),
+    ("interactive_ms", "interactive ms"),
+    ("transfer_kb", "transfer KB"),
+    ("scroll_p50_ms", "scroll p50 ms"),
+    ("scroll_p95_ms", "scroll p95 ms"),
+    ("scroll_dropped", "dropped frames"),
+    ("clone_dialog_ms", "clone dialog ms"),
+    ("js_heap_mb", "JS heap MB"),
+)
+
+# Bytes over the wire for the document and every subresource, and which renderer loaded
+RESOURCES_SCRIPT = """
+() => {
+  const entries = [...performance.getEntriesByType('navigation'), ...performance.getEntriesByType('resource')];
+  const names = entries.map((e) => e.name);
+  return {
+    transfer: entries.reduce((sum, e) => sum + (e.transferSize || 0), 0),
+    renderer: names.some((n) => n.includes('skwasm')) ? 'skwasm'
+      : names.some((n) => n.includes('canvaskit')) ? 'canvaskit' : 'html',
+  };
+}
+"""
+
+def flutter_version():
+    # (major, minor, patch) of the Flutter SDK on PATH, or None when it cannot be determined
+    try:
+        output = subprocess.run(["flutter", "--version", "--machine"], cwd=REPO_DIR, capture_output=True,
+                                text=True, check=True).stdout
+        version = json.loads(output[output.index("{"):])["frameworkVersion"]
+    except (OSError, subprocess.CalledProcessError, ValueError, KeyError):
+        return None
+    match = re.match(r"(\d+)\.(\d+)\.(\d+)", version)
+    return tuple(int(part) for part in match.groups()) if match else None
+
+
+def build_variant(renderer):
+    output = os.path.join(BUILD_DIR, f"web-{renderer}")
+    command = ["flutter", "build", "web", "--release", "--no-web-resources-cdn", CATALOG_BUILD_ARG,
+               *BUILD_ARGS[renderer], "-o", output]
+    print(f"$ {' '.join(command)}")
+    subprocess.run(command, cwd=REPO_DIR, check=True)
+
+
+async def run_trial(url, args):
+    session = AppSession(url, asset_cache=False, trace=False, capture_events=False,
+                         seed=app_data(catalog=args.catalog))
+    sample = {}
+    try:
+        page = await session.start()
+        pages = session.pages
+
+        # Home load
+        sample["first_frame_ms"] = await wait_for_first_frame(page)
+        if await pages.home.wait_active(timeout=15000):
+            sample["interactive_ms"] = await page.evaluate("() => performance.now()")
+        resources = await page.evaluate(RESOURCES_SCRIPT)
+        sample["transfer_kb"] = resources["transfer"] / 1024
+        sample["renderer"] = resources["renderer"]
+
+        # App list scroll
+        if await pages.app_list.open():
+            await pages.app_list.app(0).wait_for(timeout=10000)
+            viewport = page.viewport_size or {"width": 1280, "height": 720}
+            await page.mouse.move(viewport["width"] / 2, viewport["height"] / 2)
+            async with FrameRecorder(page) as frames:
+                for _ in range(args.flings):
+                    await page.mouse.wheel(0, 2500)
+                    await asyncio.sleep(0.4)
+            sample["scroll_p50_ms"] = frames.stats.get("p50_ms")
+            sample["scroll_p95_ms"] = frames.stats.get("p95_ms")
+            sample["scroll_dropped"] = frames.stats.get("dropped")
+
+            # Clone dialog: pointerdown on CLONE to the dialog being on screen
+            await pages.app_list.app(0).click()
+            sample["clone_dialog_ms"] = await timed_tap(page, pages.app_list, "clone_selected",
+                                                        {"text": "Customize Clone"}, 5000)
+
+        sample["js_heap_mb"] = (await MemoryProbe(page).sample(gc=True))["js_heap_mb"]
+    except async_api.Error as e:
+        print(f"   trial failed: {str(e).splitlines()[0]}")
+    finally:
+        await session.close()
+    return sample
+
+
+def fmt_summary(summary):
+    if not summary.get("n"):
+        return "-"
+    if summary["ci_low"] is None:
+        return f"{summary['median']:.1f}"
+    return f"{summary['median']:.1f} [{summary['ci_low']:.1f}, {summary['ci_high']:.1f}]"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare Flutter web renderers")
+    parser.add_argument("--renderers", default=",".join(BUILD_ARGS), help="comma-separated renderer names")
+    parser.add_argument("--trials", type=int, default=5, help="measured trials per renderer")
+    parser.add_argument("--warmup", type=int, default=1, help="discarded trials per renderer")
+    parser.add_argument("--catalog", type=int, default=500, help="synthetic apps in the app list")
+    parser.add_argument("--flings", type=int, default=6, help="wheel flings in the scroll flow")
+    parser.add_argument("--build", action="store_true", help="run `flutter build web` for each renderer first")
+    args = parser.parse_args()
+
+    renderers = [name.strip() for name in args.renderers.split(",") if name.strip()]
+    if args.build and "html" in renderers:
+        version = flutter_version()
+        if version is None or version[:2] >= HTML_REMOVED_IN:
+            found = "unknown" if version is None else ".".join(map(str, version))
+            print(f"Skipping html: needs Flutter < {'.'.join(map(str, HTML_REMOVED_IN))} (found {found})")
+            renderers.remove("html")
+    if args.build:
+        for renderer in renderers:
+            build_variant(renderer)
+
+    servers = {}
+    for renderer in renderers:
+        headers = CROSS_ORIGIN_ISOLATION if renderer == "skwasm" else None
+        server = StaticServer(root=os.path.join(BUILD_DIR, f"web-{renderer}"), port=0, headers=headers)
+        try:
+            servers[renderer] = await server.start()
+        except FileNotFoundError as e:
+            print(f"Skipping {renderer}: {e}")
+
+    samples = {renderer: [] for renderer in servers}
+    try:
+        for trial in range(args.warmup + args.trials):
+            measured = trial >= args.warmup
+            print(f"\n[{'trial ' + str(trial - args.warmup + 1) if measured else 'warm-up'}]")
+            # Interleaved so that drift over the run hits every renderer alike
+            for renderer, server in servers.items():
+                sample = await run_trial(server.url, args)
+                if sample.get("renderer") not in (None, renderer):
+                    print(f"   {renderer}: build fell back to {sample['renderer']}")
+                print(f"   {renderer}: first frame {sample.get('first_frame_ms')} ms, "
+                      f"clone dialog {sample.get('clone_dialog_ms')} ms")
+                if measured:
+                    samples[renderer].append(sample)
+    finally:
+        for server in servers.values():
+            await server.close()
+
+    results = {
+        renderer: {key: summarize([s.get(key) for s in runs]) for key, _ in METRICS}
+        for renderer, runs in samples.items()
+    }
+
+    print("\n" + "=" * (18 + 28 * len(results)))
+    print(f"{'median [95% CI]':<18}" + "".join(f"{renderer:>28}" for renderer in results))
+    print("-" * (18 + 28 * len(results)))
+    for key, label in METRICS:
+        print(f"{label:<18}" + "".join(f"{fmt_summary(results[r][key]):>28}" for r in results))
+
+    for renderer, runs in samples.items():
+        for key, _ in METRICS:
+            record_samples(f"{renderer}.{key}", [s.get(key) for s in runs])
+    record("renderers", {"trials": args.trials, "catalog": args.catalog, "results": results, "samples": samples})
+    print(f"\nResults saved to {flush_report()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
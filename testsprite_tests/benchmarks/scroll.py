@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+from playwright import async_api
+from harness import (
+    AppSession,
+    FrameRecorder,
+    app_data,
+    append_history,
+    fling,
+    flush_report,
+    frame_stats,
+    record,
+    record_samples,
+)
+
+# Frame timing while scrolling the app list at different catalog sizes.
+#
+# The app list (lib/screens/app_list_screen.dart) is filled from a synthetic
+# catalog of N apps (see harness/seed.py) and scrolled with bursts of wheel
+# events, down and back up. requestAnimationFrame intervals are recorded for the
+# whole gesture and pooled over the trials of each size.
+#
+# lib/widgets/optimized_app_list.dart is not mounted by any screen today; the
+# app list's GridView.builder is what users scroll, so that is what is measured.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.scroll --sizes 100,1000,10000 --trials 3
+
+async def run_trial(size, args):
+    session = AppSession(trace=False, capture_events=False, seed=app_data(catalog=size))
+    deltas = []
+    try:
+        page = await session.start()
+        app_list = session.pages.app_list
+        if not await app_list.open():
+            print("   app list did not open")
+            return deltas
+        await app_list.app(0).wait_for(timeout=20000)
+        viewport = page.viewport_size or {"width": 1280, "height": 720}
+        await page.mouse.move(viewport["width"] / 2, viewport["height"] / 2)
+        async with FrameRecorder(page) as frames:
+            for direction in (1, -1):
+                for _ in range(args.flings):
+                    await fling(page, direction)
+                    await asyncio.sleep(args.settle)
+        deltas = frames.deltas
+    except async_api.Error as e:
+        print(f"   trial failed: {str(e).splitlines()[0]}")
+    finally:
+        await session.close()
+    return deltas
+
+
+def fmt(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark app list scrolling at several catalog sizes")
+    parser.add_argument("--sizes", default="100,1000,10000", help="comma-separated catalog sizes")
+    parser.add_argument("--trials", type=int, default=3)
+    parser.add_argument("--flings", type=int, default=5, help="flings in each direction")
+    parser.add_argument("--settle", type=float, default=0.3, help="seconds between flings")
+    args = parser.parse_args()
+
+    results = {}
+    for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        print(f"\n[{size} apps]")
+        pooled = []
+        for trial in range(args.trials):
+            deltas = await run_trial(size, args)
+            trial_stats = frame_stats(deltas)
+            print(f"   trial {trial + 1}: {trial_stats['frames']} frames, p95 {fmt(trial_stats.get('p95_ms'))} ms, "
+                  f"dropped {trial_stats.get('dropped', '-')}")
+            pooled.extend(deltas)
+        results[size] = frame_stats(pooled)
+        record_samples(f"{size}.frame_ms", pooled)
+
+    print("\n" + "=" * 80)
+    print(f"{'apps':>8}{'frames':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'longest ms':>12}{'dropped':>10}")
+    print("-" * 80)
+    for size, stats in results.items():
+        print(f"{size:>8}{stats['frames']:>9}{fmt(stats.get('p50_ms')):>10}{fmt(stats.get('p95_ms')):>10}"
+              f"{fmt(stats.get('p99_ms')):>10}{fmt(stats.get('longest_ms')):>12}{stats.get('dropped', 0):>10}")
+
+    record("scroll", results)
+    append_history("scroll", {"trials": args.trials, "results": results})
+    print(f"\nResults saved to {flush_report()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
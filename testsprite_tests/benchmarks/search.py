@@ -0,0 +1,172 @@
+import argparse
+import asyncio
+from playwright import async_api
+from harness import (
+    AppSession,
+    app_data,
+    append_history,
+    flush_report,
+    percentile,
+    record,
+    record_samples,
+    synthetic_catalog,
+)
+
+# Keystroke-to-results latency of the app list search at several catalog sizes.
+#
+# Queries are typed one character at a time into the search field of
+# lib/screens/app_list_screen.dart. Before each key, an in-page probe notes the
+# keydown timestamp and watches the semantics tree; the latency runs until the
+# first animation frame after the rendered app items differ from what was on
+# screen before the key. It includes the screen's 300 ms search debounce, as
+# users experience it.
+#
+# The screen filters by case-insensitive substring of the app name, so whether a
+# key changes what is on screen is known up front from the seeded catalog: the
+# grid is virtualized, so the prediction compares only the first N filtered
+# names, N being the number of items the page renders for the full list. Keys
+# that leave that window unchanged are counted, not timed or waited on; keys
+# that should change it but show nothing within --timeout are reported as missed.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.search --sizes 100,1000,10000
+
+QUERIES = ("chrome", "cal", "music pro", "weather go", "photos", "zq")
+
+SEARCH_PROBE_SCRIPT = """
+(timeoutMs) => {
+  const pane = document.querySelector('flt-glass-pane');
+  const host = (pane && pane.shadowRoot && pane.shadowRoot.querySelector('flt-semantics-host'))
+    || document.querySelector('flt-semantics-host');
+  const items = () => [...host.querySelectorAll('[flt-semantics-identifier="app-item"]')]
+    .map((el) => (el.getAttribute('aria-label') || '') + el.textContent).join('\\n');
+  const before = items();
+  window.__fltSearchLatency = new Promise((resolve) => {
+    let start = null;
+    const observer = new MutationObserver(() => {
+      if (start !== null && items() !== before) {
+        observer.disconnect();
+        requestAnimationFrame(() => resolve(performance.now() - start));
+      }
+    });
+    observer.observe(host, { subtree: true, childList: true, attributes: true, characterData: true });
+    document.addEventListener('keydown', (e) => { start = e.timeStamp; }, { once: true, capture: true });
+    setTimeout(() => { observer.disconnect(); resolve(null); }, timeoutMs);
+  });
+}
+"""
+
+
+RENDERED_ITEMS_SCRIPT = """
+() => {
+  const pane = document.querySelector('flt-glass-pane');
+  const host = (pane && pane.shadowRoot && pane.shadowRoot.querySelector('flt-semantics-host'))
+    || document.querySelector('flt-semantics-host');
+  return host ? host.querySelectorAll('[flt-semantics-identifier="app-item"]').length : 0;
+}
+"""
+
+
+def changing_keys(names, query, window):
+    # For each prefix of the query, whether it changes the first `window` items of
+    # the filtered list (AppListScreen.filteredApps), i.e. what the page renders
+    previous = names[:window]
+    changes = []
+    for end in range(1, len(query) + 1):
+        current = [name for name in names if query[:end].lower() in name][:window]
+        changes.append(current != previous)
+        previous = current
+    return changes
+
+
+async def type_query(page, query, changes, timeout_ms):
+    latencies = []
+    unchanged = missed = 0
+    for char, changes_results in zip(query, changes):
+        if changes_results:
+            await page.evaluate(SEARCH_PROBE_SCRIPT, timeout_ms)
+        await page.keyboard.press(char if char != " " else "Space")
+        if not changes_results:
+            unchanged += 1
+            continue
+        latency = await page.evaluate("() => window.__fltSearchLatency")
+        if latency is None:
+            missed += 1
+        else:
+            latencies.append(latency)
+    return latencies, unchanged, missed
+
+
+async def run_size(size, args):
+    session = AppSession(trace=False, capture_events=False, seed=app_data(catalog=size))
+    names = [entry.split("|")[0].lower() for entry in synthetic_catalog(size)]
+    latencies = []
+    unchanged = missed = 0
+    try:
+        page = await session.start()
+        app_list = session.pages.app_list
+        if not await app_list.open():
+            print("   app list did not open")
+            return latencies, unchanged, missed
+        await app_list.app(0).wait_for(timeout=20000)
+        search = app_list.control("search").first
+        for _ in range(args.rounds):
+            for query in QUERIES:
+                window = await page.evaluate(RENDERED_ITEMS_SCRIPT)
+                await search.click()
+                query_latencies, query_unchanged, query_missed = await type_query(
+                    page, query, changing_keys(names, query, window), args.timeout)
+                latencies.extend(query_latencies)
+                unchanged += query_unchanged
+                missed += query_missed
+                # Clear the field and let the full list come back before the next query
+                await search.fill("")
+                await app_list.app(0).wait_for(timeout=5000)
+    except async_api.Error as e:
+        print(f"   run failed: {str(e).splitlines()[0]}")
+    finally:
+        await session.close()
+    return latencies, unchanged, missed
+
+
+def fmt(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark search keystroke-to-render latency")
+    parser.add_argument("--sizes", default="100,1000,10000", help="comma-separated catalog sizes")
+    parser.add_argument("--rounds", type=int, default=3, help="passes over the query list")
+    parser.add_argument("--timeout", type=int, default=3000, help="ms to wait for results per key")
+    args = parser.parse_args()
+
+    results = {}
+    for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        print(f"\n[{size} apps]")
+        latencies, unchanged, missed = await run_size(size, args)
+        record_samples(f"{size}.keystroke_ms", latencies)
+        results[size] = {
+            "keys": len(latencies) + unchanged + missed,
+            "unchanged": unchanged,
+            "missed": missed,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": max(latencies) if latencies else None,
+        }
+        print(f"   {len(latencies)} timed keys, {missed} missed, p50 {fmt(results[size]['p50_ms'])} ms")
+
+    print("\n" + "=" * 80)
+    print(f"{'apps':>8}{'keys':>8}{'unchanged':>11}{'missed':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    print("-" * 80)
+    for size, r in results.items():
+        print(f"{size:>8}{r['keys']:>8}{r['unchanged']:>11}{r['missed']:>8}{fmt(r['p50_ms']):>10}"
+              f"{fmt(r['p95_ms']):>10}{fmt(r['p99_ms']):>10}{fmt(r['max_ms']):>10}")
+
+    record("search", results)
+    append_history("search", {"rounds": args.rounds, "results": results})
+    print(f"\nResults saved to {flush_report()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
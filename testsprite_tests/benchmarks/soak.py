@@ -0,0 +1,234 @@
+import argparse
+import asyncio
+import random
+import sys
+import time
+from playwright import async_api
+from harness import (
+    AppSession,
+    MemoryProbe,
+    TimeSeries,
+    app_data,
+    append_history,
+    flush_report,
+    record,
+)
+
+# Soak run: a weighted mix of the TC flows looped on one long-lived page.
+#
+# Leaks in lib/services/memory_manager.dart and background_service.dart only
+# show after hours of use, so the page is never reloaded. A sampler records JS
+# heap, DOM nodes, event listeners and browser RSS every --interval seconds into
+# a TimeSeries; after the warm-up, a least-squares line per metric gives its
+# growth per hour, and the run fails (exit code 1) when any growth exceeds its
+# threshold. Clones are created and removed at the same rate by default, so the
+# app's data stays roughly the same size.
+#
+# The interaction, web-vitals and browser-event recorders keep in-page or
+# in-process logs that grow with every flow, so they are off for soak runs;
+# otherwise their growth would be fitted as the app's. Whatever was sampled is
+# saved even when the run is interrupted.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.soak --minutes 120 --interval 5
+
+QUERIES = ("chrome", "cal", "music", "weather", "photos")
+
+FIELDS = ("js_heap_mb", "dom_nodes", "listeners", "rss_mb")
+
+# Maximum growth per hour after warm-up
+THRESHOLDS = {
+    "js_heap_mb": 10,
+    "dom_nodes": 2000,
+    "listeners": 500,
+    "rss_mb": 100,
+}
+
+
+async def flow_clone(pages, rng):
+    # TC001 / TC006
+    if await pages.app_list.open():
+        count = await pages.app_list.app_count()
+        return bool(count) and await pages.app_list.clone(rng.randrange(count))
+    return False
+
+
+async def flow_delete(pages, rng):
+    # TC009
+    if not await pages.cloned_apps.open() or not await pages.cloned_apps.app_count():
+        return False
+    if not await pages.cloned_apps.open_options(0):
+        return False
+    return await pages.cloned_apps.tap("remove") and await pages.cloned_apps.tap("confirm_remove")
+
+
+async def flow_launch(pages, rng):
+    # TC017
+    if await pages.cloned_apps.open():
+        count = await pages.cloned_apps.app_count()
+        if count:
+            await pages.cloned_apps.label("app")
+            await pages.cloned_apps.app(rng.randrange(count)).click(timeout=2000)
+            return True
+    return False
+
+
+async def flow_search(pages, rng):
+    # TC007
+    if not await pages.app_list.open():
+        return False
+    await pages.app_list.search(rng.choice(QUERIES))
+    await asyncio.sleep(0.5)
+    await pages.app_list.search("")
+    return True
+
+
+async def flow_settings(pages, rng):
+    # TC008
+    if not await pages.home.open() or not await pages.home.tap("settings_tab"):
+        return False
+    await asyncio.sleep(0.5)
+    return await pages.home.tap("apps_tab")
+
+
+FLOWS = {
+    "clone": flow_clone,
+    "delete": flow_delete,
+    "launch": flow_launch,
+    "search": flow_search,
+    "settings": flow_settings,
+}
+
+DEFAULT_MIX = "clone=2,delete=2,launch=3,search=3,settings=2"
+
+
+def parse_mix(spec):
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in FLOWS:
+            raise SystemExit(f"Unknown flow {name!r}; choose from {', '.join(FLOWS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+async def sample_loop(memory, series, start, interval, stop):
+    while not stop.is_set():
+        try:
+            series.append(time.monotonic() - start, await memory.sample())
+        except async_api.Error as e:
+            # A missed sample leaves a gap; the page may recover on the next flow
+            print(f"   sample failed: {str(e).splitlines()[0]}")
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+def fmt(value, spec=".1f"):
+    return "-" if value is None else format(value, spec)
+
+
+def report(series, counts, mix, args):
+    # Prints and saves the growth fits; returns the metrics above their limit
+    warmup_s = args.warmup * 60
+    growth = {}
+    failed = []
+    print("\n" + "=" * 80)
+    print(f"{'metric':<14}{'first':>10}{'last':>10}{'growth/h':>12}{'limit/h':>10}{'r2':>7}  verdict")
+    print("-" * 80)
+    for field in FIELDS:
+        slope, r2 = series.fit(field, since=warmup_s)
+        limit = getattr(args, f"max_{field}")
+        points = series.points(field, since=warmup_s)
+        verdict = "-" if slope is None else ("FAIL" if slope > limit else "ok")
+        if verdict == "FAIL":
+            failed.append(field)
+        growth[field] = {"per_hour": slope, "r2": r2, "limit": limit, "verdict": verdict}
+        print(f"{field:<14}{fmt(points[0][1] if points else None):>10}{fmt(points[-1][1] if points else None):>10}"
+              f"{fmt(slope, '+.2f'):>12}{limit:>10g}{fmt(r2, '.2f'):>7}  {verdict}")
+    print("-" * 80)
+    print("flows: " + ", ".join(f"{name} {c['runs']} ({c['failed']} failed)" for name, c in counts.items()))
+
+    elapsed_min = series.times[-1] / 60 if len(series) else 0
+    record("soak", {"minutes": args.minutes, "sampled_minutes": elapsed_min, "mix": mix, "flows": counts,
+                    "growth": growth, "series": series.to_dict()})
+    append_history("soak", {"minutes": args.minutes, "sampled_minutes": elapsed_min, "mix": mix, "flows": counts,
+                            "growth": growth})
+    print(f"\nTime series saved to {flush_report()}")
+    if failed:
+        print(f"Growth above the limit: {', '.join(failed)}")
+    return failed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Loop TC flows on one page and track memory growth")
+    parser.add_argument("--minutes", type=float, default=60, help="soak duration")
+    parser.add_argument("--warmup", type=float, default=2, help="minutes excluded from the growth fit")
+    parser.add_argument("--interval", type=float, default=5, help="seconds between samples")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="flow weights, e.g. clone=2,search=3")
+    parser.add_argument("--catalog", type=int, default=200, help="synthetic installed apps")
+    parser.add_argument("--clones", type=int, default=20, help="clones present at the start")
+    parser.add_argument("--think", type=float, default=1.0, help="seconds between flows")
+    parser.add_argument("--seed", type=int, default=0)
+    for field, limit in THRESHOLDS.items():
+        parser.add_argument(f"--max-{field.replace('_', '-')}", type=float, default=limit, dest=f"max_{field}",
+                            help=f"allowed {field} growth per hour (default {limit})")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    rng = random.Random(args.seed)
+    series = TimeSeries(FIELDS)
+    counts = {name: {"runs": 0, "failed": 0} for name in names}
+
+    session = AppSession(trace=False, capture_events=False, interactions=False, web_vitals=False,
+                         seed=app_data(catalog=args.catalog, clones=args.clones))
+    stop = asyncio.Event()
+    sampler = None
+    memory = None
+    try:
+        page = await session.start()
+        pages = session.pages
+        memory = MemoryProbe(page)
+        start = time.monotonic()
+        end = start + args.minutes * 60
+        sampler = asyncio.create_task(sample_loop(memory, series, start, args.interval, stop))
+        print(f"Soaking for {args.minutes:g} min with {args.mix}")
+        last_report = start
+        while time.monotonic() < end and not sampler.done():
+            name = rng.choices(names, weights)[0]
+            counts[name]["runs"] += 1
+            try:
+                if not await FLOWS[name](pages, rng):
+                    counts[name]["failed"] += 1
+            except async_api.Error:
+                counts[name]["failed"] += 1
+                await pages.home.open()
+            await asyncio.sleep(args.think)
+            if time.monotonic() - last_report >= 60 and len(series):
+                last_report = time.monotonic()
+                latest = {field: series.columns[field][-1] for field in FIELDS}
+                print(f"   {(last_report - start) / 60:5.1f} min: heap {latest['js_heap_mb']:.1f} MB, "
+                      f"{latest['dom_nodes']:.0f} nodes, RSS {latest['rss_mb']:.0f} MB")
+        stop.set()
+        # Re-raises whatever ended the sampler early
+        await sampler
+    finally:
+        stop.set()
+        if sampler and not sampler.done():
+            sampler.cancel()
+        try:
+            if memory:
+                await memory.close()
+            await session.close()
+        finally:
+            # Partial runs keep their samples
+            failed = report(series, counts, mix, args)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
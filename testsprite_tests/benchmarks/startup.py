@@ -0,0 +1,147 @@
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+from playwright import async_api
+from harness import (
+    APP_URL,
+    BROWSER,
+    DEVICE,
+    AppPages,
+    append_history,
+    device_context_options,
+    device_profile,
+    emulate_device,
+    flush_report,
+    enable_flutter_semantics,
+    engine_launch_options,
+    install_device_hints,
+    install_first_frame_probe,
+    load_launch_profile,
+    record_samples,
+    register_flutter_selectors,
+    summarize,
+    wait_for_first_frame,
+)
+
+# Cold and warm startup of the web build: navigation start -> first Flutter
+# frame -> interactive home screen (semantics enabled, "MultiSpace" title on
+# screen), all as performance.now() offsets from navigation start.
+#
+#   cold  a fresh browser profile per launch: empty HTTP cache, no service worker
+#   warm  one profile reused by every launch: cached assets, service worker kept
+#
+# Warm-up launches are discarded. --cpus pins the benchmark (and the browser it
+# spawns, which inherits the affinity) to fixed cores to cut scheduler noise.
+# TESTSPRITE_DEVICE=<profile> emulates a slower phone (see harness/devices.py).
+# Summaries are printed and appended to the run history.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.startup --runs 15 --cpus 2,3
+
+PHASES = (
+    ("first_frame_ms", "first frame ms"),
+    ("interactive_ms", "interactive ms"),
+)
+
+
+def pin_cpus(spec):
+    cpus = {int(c) for c in spec.split(",") if c.strip()}
+    if not hasattr(os, "sched_setaffinity"):
+        print("CPU pinning is not supported on this platform; running unpinned")
+        return None
+    os.sched_setaffinity(0, cpus)
+    return sorted(cpus)
+
+
+async def launch_once(pw, engine, profile, device, user_data_dir, url):
+    sample = {"first_frame_ms": None, "interactive_ms": None}
+    options = engine_launch_options(engine, profile)
+    if device:
+        options.update(device_context_options(device, engine))
+    context = await getattr(pw, engine).launch_persistent_context(user_data_dir, service_workers="allow", **options)
+    try:
+        await install_first_frame_probe(context)
+        page = context.pages[0] if context.pages else await context.new_page()
+        if device:
+            await install_device_hints(context, device)
+            await emulate_device(page, device)
+        await page.goto(url, wait_until="commit", timeout=30000)
+        sample["first_frame_ms"] = await wait_for_first_frame(page, timeout=30000)
+        if await enable_flutter_semantics(page) and await AppPages(page).home.wait_active(timeout=30000):
+            sample["interactive_ms"] = await page.evaluate("() => performance.now()")
+    except async_api.Error as e:
+        print(f"   launch failed: {str(e).splitlines()[0]}")
+    finally:
+        await context.close()
+    return sample
+
+
+async def run_mode(pw, mode, engine, profile, device, url, runs, warmup):
+    samples = []
+    shared_dir = tempfile.mkdtemp(prefix="testsprite-warm-") if mode == "warm" else None
+    try:
+        for i in range(warmup + runs):
+            user_data_dir = shared_dir or tempfile.mkdtemp(prefix="testsprite-cold-")
+            try:
+                sample = await launch_once(pw, engine, profile, device, user_data_dir, url)
+            finally:
+                if not shared_dir:
+                    shutil.rmtree(user_data_dir, ignore_errors=True)
+            measured = i >= warmup
+            label = f"run {i - warmup + 1}" if measured else "warm-up"
+            print(f"   [{mode}] {label}: first frame {sample['first_frame_ms']} ms, "
+                  f"interactive {sample['interactive_ms']} ms")
+            if measured:
+                samples.append(sample)
+    finally:
+        if shared_dir:
+            shutil.rmtree(shared_dir, ignore_errors=True)
+    return samples
+
+
+def fmt(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold and warm startup of the web build")
+    parser.add_argument("--runs", type=int, default=10, help="measured launches per mode")
+    parser.add_argument("--warmup", type=int, default=2, help="discarded launches per mode")
+    parser.add_argument("--modes", default="cold,warm")
+    parser.add_argument("--cpus", help="comma-separated CPU ids to pin to, e.g. 2,3")
+    parser.add_argument("--url", default=APP_URL)
+    args = parser.parse_args()
+
+    cpus = pin_cpus(args.cpus) if args.cpus else None
+    profile_name, profile = load_launch_profile() if BROWSER == "chromium" else (None, None)
+    device = device_profile(DEVICE)
+
+    results = {}
+    async with async_api.async_playwright() as pw:
+        await register_flutter_selectors(pw)
+        for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            print(f"\n[{mode}] {args.warmup} warm-up + {args.runs} launches")
+            samples = await run_mode(pw, mode, BROWSER, profile, device, args.url, args.runs, args.warmup)
+            results[mode] = {key: summarize([s[key] for s in samples]) for key, _ in PHASES}
+            results[mode]["failures"] = sum(s["interactive_ms"] is None for s in samples)
+            for key, _ in PHASES:
+                record_samples(f"{mode}.{key}", [s[key] for s in samples])
+
+    print("\n" + "=" * 80)
+    print(f"{'mode':<8}{'phase':<18}{'median':>10}{'p90':>10}{'MAD':>10}{'n':>6}{'failed':>8}")
+    print("-" * 80)
+    for mode, summary in results.items():
+        for key, label in PHASES:
+            s = summary[key]
+            print(f"{mode:<8}{label:<18}{fmt(s.get('median')):>10}{fmt(s.get('p90')):>10}"
+                  f"{fmt(s.get('mad')):>10}{s['n']:>6}{summary['failures']:>8}")
+
+    append_history("startup", {"engine": BROWSER, "launch_profile": profile_name, "device": DEVICE, "cpus": cpus,
+                               "runs": args.runs, "results": results})
+    print(f"\nResults appended to the run history; samples saved to {flush_report()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,270 @@
+import argparse
+import asyncio
+from playwright import async_api
+from harness import (
+    AppPages,
+    AppSession,
+    app_data,
+    append_history,
+    enable_flutter_semantics,
+    flush_report,
+    linear_fit,
+    percentile,
+    record,
+    record_samples,
+)
+
+# Cross-instance sync propagation, the measured version of TC011.
+#
+# One source page and --peers peer pages of the app share a browser context, as
+# tabs of one profile do. An init script logs every SharedPreferences write
+# (localStorage "flutter.*" keys) and every storage event, with epoch timestamps
+# that are comparable across pages.
+#
+#   ui     the source clones an app through the UI. We time the write's storage
+#          event at each peer, then check whether the peer's cloned apps screen
+#          shows the clone after its refresh path (--refresh tab: switch tabs,
+#          which reloads the list; reload: reload the page).
+#   rates  the source writes a clone settings key (DataIsolationService's
+#          clone_settings_<package>_<id>) at increasing rates. Each rate
+#          reports delivery and lag percentiles; sync "falls behind" when
+#          events are lost or the p95 lag exceeds --budget.
+#
+# The source is brought to the front before each rate step: a background tab's
+# timers are throttled, which would cap the write loop rather than sync. A step
+# whose writer still managed less than WRITER_LIMITED of the offered rate is
+# reported as "writer-limited" and does not count as sync falling behind.
+#
+# The app keeps SharedPreferences values in memory and never calls reload(), so
+# tab refreshes are expected to show stale data; that is what "ui" verifies.
+#
+#     cd testsprite_tests
+#     python -m benchmarks.sync --peers 3 --rates 10,50,100,250,500,1000
+
+SYNC_PROBE_SCRIPT = """
+(() => {
+  const digest = (value) => {
+    let hash = 2166136261;
+    for (let i = 0; i < value.length; i++) hash = Math.imul(hash ^ value.charCodeAt(i), 16777619);
+    return value.length + ':' + (hash >>> 0).toString(16);
+  };
+  const epoch = () => performance.timeOrigin + performance.now();
+  const writes = window.__syncWrites = [];
+  const events = window.__syncEvents = [];
+  const setItem = Storage.prototype.setItem;
+  Storage.prototype.setItem = function (key, value) {
+    setItem.call(this, key, value);
+    if (this === localStorage && key.startsWith('flutter.')) writes.push([key, digest(String(value)), epoch()]);
+  };
+  window.addEventListener('storage', (event) => {
+    if (event.key && event.key.startsWith('flutter.') && event.newValue !== null) {
+      events.push([event.key, digest(event.newValue), epoch()]);
+    }
+  });
+})();
+"""
+
+WRITE_LOOP_SCRIPT = """
+async ({ key, rate, seconds }) => {
+  const start = performance.now();
+  let sent = 0;
+  while (performance.now() - start < seconds * 1000) {
+    const due = Math.floor((performance.now() - start) * rate / 1000) + 1;
+    for (; sent < due; sent++) localStorage.setItem(key, JSON.stringify(`sync:${rate}:${sent}`));
+    await new Promise((resolve) => setTimeout(resolve, 1));
+  }
+  return sent;
+}
+"""
+
+SETTINGS_KEY = "flutter.clone_settings_com.synthetic.sync_1"
+
+# Fraction of the offered rate the write loop must reach for a step to test sync
+WRITER_LIMITED = 0.9
+
+
+async def read_log(page, name):
+    return await page.evaluate(f"() => window.{name}.splice(0)")
+
+
+async def open_page(session, context):
+    page = await context.new_page()
+    await session.emulate(page)
+    await session.open(page)
+    return page, AppPages(page)
+
+
+def lags_for(writes, events):
+    # Lag in ms of each write's storage event at one peer, matched by key and value digest
+    arrivals = {}
+    for key, digest, at in events:
+        arrivals.setdefault((key, digest), at)
+    return [(at, arrivals[(key, digest)] - at) for key, digest, at in writes if (key, digest) in arrivals]
+
+
+async def reflected(peer, expected, refresh, timeout_s):
+    # Whether the peer's cloned apps screen shows `expected` clones after its refresh path
+    if refresh == "reload":
+        await peer.page.reload(wait_until="commit")
+        await enable_flutter_semantics(peer.page)
+    else:
+        await peer.home.open()
+        await peer.home.tap("settings_tab")
+        await peer.home.tap("apps_tab")
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_s
+    while loop.time() < deadline:
+        if await peer.cloned_apps.is_active() and await peer.cloned_apps.app_count() >= expected:
+            return await peer.page.evaluate("() => performance.timeOrigin + performance.now()")
+        await asyncio.sleep(0.1)
+    return None
+
+
+async def ui_phase(source, peers, args):
+    event_lags = []
+    reflect_lags = []
+    stale = 0
+    for i in range(args.rounds):
+        await read_log(source.page, "__syncWrites")
+        for peer in peers:
+            await read_log(peer.page, "__syncEvents")
+        if not await source.app_list.clone(i, custom_name=f"Sync {i}"):
+            print(f"   round {i + 1}: clone failed")
+            continue
+        writes = [w for w in await read_log(source.page, "__syncWrites") if w[0] == "flutter.cloned_apps"]
+        if not writes:
+            print(f"   round {i + 1}: no cloned_apps write seen")
+            continue
+        write = writes[-1]
+        await source.cloned_apps.open()
+        expected = await source.cloned_apps.app_count()
+        await asyncio.sleep(0.5)
+        round_stale = 0
+        for peer in peers:
+            event_lags.extend(lag for _, lag in lags_for([write], await read_log(peer.page, "__syncEvents")))
+            seen_at = await reflected(peer, expected, args.refresh, args.reflect_timeout)
+            if seen_at is None:
+                round_stale += 1
+            else:
+                reflect_lags.append(seen_at - write[2])
+        stale += round_stale
+        print(f"   round {i + 1}: {expected} clones at the source, {round_stale} of {len(peers)} peers stale")
+    return {
+        "rounds": args.rounds,
+        "event_p50_ms": percentile(event_lags, 50),
+        "event_p95_ms": percentile(event_lags, 95),
+        "reflected": len(reflect_lags),
+        "stale": stale,
+        "reflect_p50_ms": percentile(reflect_lags, 50),
+    }, event_lags
+
+
+async def rate_step(source, peers, rate, args):
+    for page in [source.page] + [peer.page for peer in peers]:
+        await read_log(page, "__syncWrites")
+        await read_log(page, "__syncEvents")
+    await source.page.bring_to_front()
+    sent = await source.page.evaluate(WRITE_LOOP_SCRIPT, {"key": SETTINGS_KEY, "rate": rate, "seconds": args.seconds})
+    await asyncio.sleep(args.grace)
+    writes = [w for w in await read_log(source.page, "__syncWrites") if w[0] == SETTINGS_KEY]
+    lags = []
+    delivered = []
+    trends = []
+    for peer in peers:
+        matched = lags_for(writes, await read_log(peer.page, "__syncEvents"))
+        delivered.append(len(matched) / len(writes) if writes else 0)
+        lags.extend(lag for _, lag in matched)
+        if len(matched) >= 2:
+            # Lag growth in ms per second of writing; positive means a growing backlog
+            slope, _, _ = linear_fit([(at - matched[0][0]) / 1000 for at, _ in matched], [lag for _, lag in matched])
+            trends.append(slope)
+    result = {
+        "offered_per_s": rate,
+        "sent": sent,
+        "achieved_per_s": sent / args.seconds,
+        "delivered": min(delivered) if delivered else 0,
+        "p50_ms": percentile(lags, 50),
+        "p95_ms": percentile(lags, 95),
+        "max_ms": max(lags) if lags else None,
+        "lag_trend_ms_per_s": max(trends) if trends else None,
+    }
+    result["writer_limited"] = result["achieved_per_s"] < WRITER_LIMITED * rate
+    result["behind"] = not result["writer_limited"] and (
+        result["delivered"] < 0.99 or (result["p95_ms"] or 0) > args.budget)
+    return result, lags
+
+
+def fmt(value, spec=".1f"):
+    return "-" if value is None else format(value, spec)
+
+
+def state(result):
+    if result["writer_limited"]:
+        return "writer-limited"
+    return "behind" if result["behind"] else "ok"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync propagation between app instances")
+    parser.add_argument("--peers", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=5, help="UI clone rounds")
+    parser.add_argument("--refresh", choices=("tab", "reload"), default="tab", help="peer refresh path")
+    parser.add_argument("--reflect-timeout", type=float, default=5, help="seconds for a peer to show a change")
+    parser.add_argument("--rates", default="10,50,100,250,500,1000", help="writes per second to sweep")
+    parser.add_argument("--seconds", type=float, default=5, help="seconds per rate")
+    parser.add_argument("--grace", type=float, default=1, help="seconds to wait for late events")
+    parser.add_argument("--budget", type=float, default=100, help="p95 lag in ms above which sync is behind")
+    parser.add_argument("--catalog", type=int, default=20, help="synthetic installed apps")
+    args = parser.parse_args()
+
+    session = AppSession(trace=False, capture_events=False, seed=app_data(catalog=args.catalog))
+    ui = None
+    rates = {}
+    try:
+        await session.start()
+        context = await session.new_context()
+        await context.add_init_script(SYNC_PROBE_SCRIPT)
+        _, source = await open_page(session, context)
+        peers = [(await open_page(session, context))[1] for _ in range(args.peers)]
+
+        print(f"\n[ui] {args.rounds} clones, peers refresh by {args.refresh}")
+        ui, event_lags = await ui_phase(source, peers, args)
+        record_samples("ui.event_ms", event_lags)
+
+        for rate in [int(r) for r in args.rates.split(",") if r.strip()]:
+            result, lags = await rate_step(source, peers, rate, args)
+            rates[rate] = result
+            record_samples(f"rate_{rate}.lag_ms", lags)
+            print(f"   [{rate}/s] delivered {result['delivered']:.1%}, p95 {fmt(result['p95_ms'])} ms"
+                  f"{' (behind)' if result['behind'] else ''}"
+                  f"{' (writer-limited)' if result['writer_limited'] else ''}")
+        await context.close()
+    except async_api.Error as e:
+        print(f"Run failed: {str(e).splitlines()[0]}")
+    finally:
+        await session.close()
+
+    if ui:
+        print("\n" + "=" * 80)
+        print(f"UI clones: storage event p50 {fmt(ui['event_p50_ms'])} ms, p95 {fmt(ui['event_p95_ms'])} ms; "
+              f"peers reflecting the clone: {ui['reflected']}, stale: {ui['stale']}")
+    print("=" * 80)
+    print(f"{'offered/s':>10}{'sent/s':>10}{'delivered':>11}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"
+          f"{'trend ms/s':>12}  state")
+    print("-" * 80)
+    for rate, r in rates.items():
+        print(f"{rate:>10}{r['achieved_per_s']:>10.0f}{r['delivered']:>11.1%}{fmt(r['p50_ms']):>9}"
+              f"{fmt(r['p95_ms']):>9}{fmt(r['max_ms']):>9}{fmt(r['lag_trend_ms_per_s'], '+.2f'):>12}"
+              f"  {state(r)}")
+    behind = [rate for rate, r in rates.items() if r["behind"]]
+    falls_behind_at = min(behind) if behind else None
+    print(f"\nSync falls behind at: {f'{falls_behind_at} writes/s' if falls_behind_at else 'no tested rate'}")
+
+    record("sync", {"peers": args.peers, "refresh": args.refresh, "ui": ui, "rates": rates,
+                    "falls_behind_at": falls_behind_at})
+    append_history("sync", {"peers": args.peers, "ui": ui, "rates": rates, "falls_behind_at": falls_behind_at})
+    print(f"Results saved to {flush_report()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+from .flutter_selectors import (
+    ENGINE_NAME,
+    register_flutter_selectors,
+    enable_flutter_semantics,
+    semantics_selector,
+)
+from .launch import (
+    BROWSER,
+    ENGINES,
+    PROFILES,
+    load_launch_profile,
+    save_launch_profile,
+    launch_options,
+    engine_launch_options,
+    installed_engines,
+)
+from .devices import (
+    DEVICE,
+    DEVICES,
+    device_profile,
+    device_context_options,
+    install_device_hints,
+    emulate_device,
+)
+from .processes import browser_processes, browser_rss_mb
+from .memory import MemoryProbe, app_memory_mb, memory_delta, format_sample
+from .heap_snapshot import take_heap_snapshot, summarize_heap_snapshot
+from .profiler import PROFILE_ENABLED, CpuProfiler, function_times, aggregate
+from .source_map import SourceMap
+from .timing import (
+    INPUT_LATENCY_ENABLED,
+    install_first_frame_probe,
+    wait_for_first_frame,
+    first_frame_ms,
+    measure_input_latency,
+    frame_stats,
+    FrameRecorder,
+)
+from .interactions import (
+    install_interaction_probe,
+    label_interaction,
+    collect_interactions,
+    interaction_samples,
+    interaction_table,
+    format_interaction_table,
+    APPEAR_PROBE_SCRIPT,
+    timed_tap,
+    fling,
+)
+from .web_vitals import install_web_vitals, collect_web_vitals, format_web_vitals, inp, total_blocking_time
+from .stats import percentile, mad, bootstrap_ci, summarize, linear_fit, scaling_exponent
+from .timeseries import TimeSeries
+from .seed import CATALOG_BUILD_ARG, synthetic_catalog, synthetic_clones, seed_preferences, app_data
+from .asset_cache import ASSET_CACHE, AssetCache, install_asset_cache
+from .static_server import CROSS_ORIGIN_ISOLATION, StaticServer, StaticServerThread
+from .artifacts import ARTIFACT_DIR, artifact_path, record, flush_report, load_report, test_name
+from .history import HISTORY_FILE, append_history, load_history
+from .regression import BASELINE_FILE, record_samples, compare, load_baselines, save_baselines, bless
+from .tracing import RollingTracer
+from .events import EventCollector
+from .clock import VIRTUAL_CLOCK, install_virtual_clock
+from .session import APP_URL, AppSession
+from .pages import (
+    AppPages,
+    HomePage,
+    ClonedAppsPage,
+    AppListPage,
+    SettingsPage,
+    PerformanceSettingsPage,
+    SecuritySettingsPage,
+)
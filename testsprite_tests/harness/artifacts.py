@@ -0,0 +1,49 @@
+import json
+import os
+import sys
+
+# Per-test side channel between a TC process and run_all_tests.py.
+#
+# Harness components record() values while the test runs; AppSession.close()
+# flushes them to artifacts/<TC name>.json and the runner merges that file into
+# the test's entry in testsprite_backend_results.json.
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARTIFACT_DIR = os.environ.get("TESTSPRITE_ARTIFACT_DIR", os.path.join(TESTS_DIR, "artifacts"))
+
+_report = {}
+
+
+def test_name():
+    # TC006_Performance_under_... for `python TC006_Performance_under_....py`
+    return os.path.splitext(os.path.basename(sys.argv[0]))[0] or "interactive"
+
+
+def artifact_path(suffix, name=None):
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    return os.path.join(ARTIFACT_DIR, f"{name or test_name()}{suffix}")
+
+
+def record(key, value):
+    _report[key] = value
+
+
+def flush_report(name=None):
+    if not _report:
+        return None
+    path = artifact_path(".json", name)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(_report, f, indent=2, ensure_ascii=False, default=str)
+    return path
+
+
+def report_path(name):
+    return os.path.join(ARTIFACT_DIR, f"{name}.json")
+
+
+def load_report(name):
+    try:
+        with open(report_path(name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
@@ -0,0 +1,175 @@
+import asyncio
+import hashlib
+import os
+import re
+from playwright import async_api
+
+# Process-wide cache for immutable Flutter build assets.
+#
+# The browser HTTP cache belongs to a single context, so every new context
+# downloads main.dart.js, CanvasKit and the fonts again. Routing those URLs
+# through this cache fetches each one once per process and fulfills later
+# requests from memory. Bodies are kept as the bytes objects Playwright handed
+# us and passed back to route.fulfill() as-is, with no per-request copy.
+#
+# The cache lives in memory only, so it pays off where one process opens many
+# contexts: isolation --boot-app, sync, and the benchmarks that start a session
+# per size or trial (search, scroll, clone_stress). run_all_tests.py starts every
+# TC in a fresh process, where it only helps a TC that opens more than one
+# context. AppSession.close() records stats() as "asset_cache" in the
+# run's report, so the hit rate is visible either way.
+#
+# flutter_bootstrap.js is never cached: it embeds the build's service worker
+# version, so its hash identifies the build and a new hash flushes the cache.
+# Only content-hashed URLs (CDN CanvasKit under its engine revision, Google
+# Fonts) are fulfilled as immutable; main.dart.js, assets/ and the rest keep
+# their name across builds and are sent with no-cache so the browser's own
+# cache revalidates them against this one.
+#
+# Service workers bypass page.route(), so contexts that use the cache should be
+# created with service_workers="block" (AppSession does this).
+
+_ASSETS = re.compile(
+    r"(main\.dart\.(js|mjs|wasm)"
+    r"|canvaskit[^?]*\.(js|wasm|symbols)"
+    r"|/(assets|fonts)/[^?]*"
+    r"|\.(ttf|otf|woff2?))(\?.*)?$"
+)
+_BUILD_ENTRY = re.compile(r"flutter_bootstrap\.js(\?.*)?$")
+# A path segment that is a long hex digest, or a host that only serves versioned files
+_HASHED = re.compile(r"/[0-9a-f]{16,}/|^https://fonts\.gstatic\.com/")
+
+_CONTENT_TYPES = {
+    ".js": "text/javascript",
+    ".mjs": "text/javascript",
+    ".wasm": "application/wasm",
+    ".json": "application/json",
+    ".ttf": "font/ttf",
+    ".otf": "font/otf",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".svg": "image/svg+xml",
+    ".frag": "application/octet-stream",
+    ".bin": "application/octet-stream",
+    ".symbols": "text/plain",
+}
+
+
+def content_type_for(url, fallback="application/octet-stream"):
+    path = url.split("?", 1)[0]
+    return _CONTENT_TYPES.get(os.path.splitext(path)[1].lower(), fallback)
+
+
+class AssetCache:
+
+    def __init__(self):
+        self.build_hash = None
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes_served = 0
+        self._pending = {}
+
+    def stats(self):
+        return {
+            "build_hash": self.build_hash,
+            "entries": len(self.entries),
+            "bytes_cached": sum(len(body) for body, _ in self.entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes_served": self.bytes_served,
+        }
+
+    def invalidate(self, build_hash=None):
+        self.entries.clear()
+        self.build_hash = build_hash
+
+    async def install(self, context):
+        await context.route(_BUILD_ENTRY, self._serve_build_entry)
+        await context.route(_ASSETS, self._serve_asset)
+
+    async def _serve_build_entry(self, route):
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except async_api.Error:
+            # Aborted or redirected; let the browser load it itself
+            await route.continue_()
+            return
+        build_hash = hashlib.sha1(body).hexdigest()
+        if build_hash != self.build_hash:
+            self.invalidate(build_hash)
+        await route.fulfill(response=response, body=body)
+
+    async def _serve_asset(self, route):
+        request = route.request
+        if request.method != "GET":
+            await route.fallback()
+            return
+
+        entry = self.entries.get(request.url)
+        if entry is None:
+            entry = await self._fetch(route)
+            if entry is None:
+                return
+        else:
+            self.hits += 1
+
+        body, content_type = entry
+        self.bytes_served += len(body)
+        hashed = _HASHED.search(request.url)
+        await route.fulfill(
+            status=200,
+            body=body,
+            headers={
+                "content-type": content_type,
+                "content-length": str(len(body)),
+                "cache-control": "public, max-age=31536000, immutable" if hashed else "no-cache",
+                "access-control-allow-origin": "*",
+            },
+        )
+
+    async def _fetch(self, route):
+        # Concurrent misses on one URL (parallel contexts) share a single fetch
+        url = route.request.url
+        pending = self._pending.get(url)
+        if pending is not None:
+            entry = await pending
+            if entry is None:
+                await route.fallback()
+            return entry
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[url] = future
+        entry = None
+        try:
+            try:
+                response = await route.fetch()
+                if response.status == 200:
+                    body = await response.body()
+                    # Dev servers often send wasm as octet-stream, which disables streaming compile
+                    content_type = content_type_for(url, fallback=response.headers.get("content-type") or "application/octet-stream")
+                    entry = (body, content_type)
+                    self.entries[url] = entry
+                    self.misses += 1
+                else:
+                    # Errors and redirects pass through untouched and uncached
+                    await route.fulfill(response=response)
+            except async_api.Error:
+                # The fetch or its body failed (aborted, redirected); every route must be resolved
+                await route.continue_()
+        finally:
+            future.set_result(entry)
+            del self._pending[url]
+        return entry
+
+
+# Shared by every context created in this process
+ASSET_CACHE = AssetCache()
+
+
+async def install_asset_cache(context, cache=ASSET_CACHE):
+    await cache.install(context)
+    return cache
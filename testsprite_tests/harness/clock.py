@@ -0,0 +1,40 @@
+import asyncio
+import os
+
+# Virtual clock mode (TESTSPRITE_VIRTUAL_CLOCK=1).
+#
+# Installs Playwright's fake clock (Date, performance.now, setTimeout/Interval,
+# requestAnimationFrame) before the app boots. Time keeps flowing normally, so the
+# app loads as usual, but tests can jump it forward: Timer.periodic callbacks in
+# background_service.dart, performance_service.dart, memory_manager.dart and the
+# PerformanceMonitor widget then fire in milliseconds instead of minutes.
+#
+# performance.now() is faked too, so timing benchmarks must not use this mode.
+
+VIRTUAL_CLOCK = os.environ.get("TESTSPRITE_VIRTUAL_CLOCK", "0") == "1"
+
+
+async def install_virtual_clock(context):
+    # Needs Playwright >= 1.45
+    if not hasattr(context, "clock"):
+        raise RuntimeError("Virtual clock mode needs Playwright 1.45 or newer")
+    await context.clock.install()
+
+
+async def advance(page, seconds, step=None):
+    # Jumps app time forward. fast_forward() fires each due timer at most once, so
+    # a periodic timer fires once per step; pass step=<period> to see every tick.
+    step = step or seconds
+    remaining = seconds
+    while remaining > 0:
+        jump = min(step, remaining)
+        await page.clock.fast_forward(int(jump * 1000))
+        remaining -= jump
+
+
+async def wait(page, seconds, virtual):
+    # Drop-in for asyncio.sleep() in TCs: real time normally, timers-only with the virtual clock
+    if virtual:
+        await page.clock.run_for(int(seconds * 1000))
+    else:
+        await asyncio.sleep(seconds)
@@ -0,0 +1,116 @@
+import os
+from playwright import async_api
+
+# Named device profiles for running TCs and benchmarks as if on the low-RAM
+# Android phones the app targets (TESTSPRITE_DEVICE=<name>).
+#
+# A profile sets the context's viewport, scale and touch support, overrides the
+# navigator.deviceMemory / hardwareConcurrency hints, and on Chromium slows the
+# renderer CPU (Emulation.setCPUThrottlingRate) and the network
+# (Network.emulateNetworkConditions) through a CDP session kept open per page.
+# Firefox and WebKit only get the viewport and the hints.
+#
+# CPU rates are slowdown factors relative to the machine running the tests, so
+# compare results from the same machine only.
+
+DEVICE = os.environ.get("TESTSPRITE_DEVICE") or None
+
+_KBPS = 1000 / 8  # bytes per second
+
+DEVICES = {
+    # Reference: what the TCs run as without a device profile
+    "desktop": {
+        "cpu_slowdown": 1,
+        "network": None,
+        "viewport": {"width": 1280, "height": 720},
+        "scale": 1,
+        "mobile": False,
+        "device_memory": 8,
+        "cpu_cores": 8,
+    },
+    # Recent mid-range phone on a good 4G connection
+    "mid-range": {
+        "cpu_slowdown": 2,
+        "network": {"latency_ms": 40, "download_kbps": 9000, "upload_kbps": 1500},
+        "viewport": {"width": 412, "height": 915},
+        "scale": 2.625,
+        "mobile": True,
+        "device_memory": 4,
+        "cpu_cores": 8,
+    },
+    # Budget phone on slow 4G (the throttling Lighthouse uses for mobile)
+    "low-end": {
+        "cpu_slowdown": 4,
+        "network": {"latency_ms": 150, "download_kbps": 1600, "upload_kbps": 750},
+        "viewport": {"width": 360, "height": 640},
+        "scale": 2,
+        "mobile": True,
+        "device_memory": 2,
+        "cpu_cores": 4,
+    },
+    # Android Go class device with 1 GB of RAM on a 3G connection
+    "android-go": {
+        "cpu_slowdown": 6,
+        "network": {"latency_ms": 400, "download_kbps": 400, "upload_kbps": 400},
+        "viewport": {"width": 320, "height": 640},
+        "scale": 1.5,
+        "mobile": True,
+        "device_memory": 1,
+        "cpu_cores": 4,
+    },
+}
+
+_HINTS_SCRIPT = """
+(() => {
+  const hints = { deviceMemory: %(device_memory)s, hardwareConcurrency: %(cpu_cores)s };
+  for (const [name, value] of Object.entries(hints)) {
+    Object.defineProperty(Navigator.prototype, name, { get: () => value, configurable: true });
+  }
+})();
+"""
+
+
+def device_profile(name):
+    # None for no emulation; unknown names fail early with the valid choices
+    if not name:
+        return None
+    if name not in DEVICES:
+        raise ValueError(f"Unknown device profile {name!r}; choose from {', '.join(DEVICES)}")
+    return DEVICES[name]
+
+
+def device_context_options(device, engine="chromium"):
+    # Keyword arguments for Browser.new_context(); Firefox does not support is_mobile
+    options = {
+        "viewport": dict(device["viewport"]),
+        "device_scale_factor": device["scale"],
+        "has_touch": device["mobile"],
+    }
+    if engine != "firefox":
+        options["is_mobile"] = device["mobile"]
+    return options
+
+
+async def install_device_hints(context, device):
+    await context.add_init_script(_HINTS_SCRIPT % device)
+
+
+async def emulate_device(page, device):
+    # Returns the CDP session holding the throttling, or None where CDP is unavailable.
+    # Detaching the session lifts the throttling, so keep it until the page is done.
+    try:
+        cdp = await page.context.new_cdp_session(page)
+    except async_api.Error:
+        print("CPU and network throttling need Chromium; emulating viewport and hints only")
+        return None
+    await cdp.send("Emulation.setCPUThrottlingRate", {"rate": device["cpu_slowdown"]})
+    network = device["network"]
+    if network:
+        await cdp.send("Network.enable")
+        await cdp.send("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": network["latency_ms"],
+            "downloadThroughput": network["download_kbps"] * _KBPS,
+            "uploadThroughput": network["upload_kbps"] * _KBPS,
+        })
+    return cdp
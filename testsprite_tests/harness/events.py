@@ -0,0 +1,155 @@
+import asyncio
+import time
+from collections import Counter, OrderedDict, deque
+from playwright import async_api
+
+# Bounded capture of browser console output, uncaught exceptions and slow or
+# failed network requests for every page in a context.
+#
+# Chromium pages are observed through a CDP session (Runtime + Network domains);
+# other engines fall back to Playwright's page events. Every event bumps a
+# counter, but only errors, warnings, exceptions and slow/failed requests are
+# stored, each in a fixed-size ring buffer, so a chatty app costs a dict lookup
+# per event and memory stays constant.
+
+# Flutter web reports unimplemented MethodChannel calls through these exceptions
+_CHANNEL_ERRORS = ("MissingPluginException", "PlatformException")
+_MAX_TEXT = 500
+
+
+def _console_text(args):
+    parts = []
+    for arg in args:
+        value = arg.get("value")
+        parts.append(str(value) if value is not None else arg.get("description", arg.get("type", "")))
+    return " ".join(parts)[:_MAX_TEXT]
+
+
+class EventCollector:
+
+    def __init__(self, capacity=200, slow_request_ms=1000, max_inflight=2000):
+        self.slow_request_ms = slow_request_ms
+        self.max_inflight = max_inflight
+        self.counters = Counter()
+        self.events = deque(maxlen=capacity)
+        self.requests = deque(maxlen=capacity)
+        self._inflight = OrderedDict()
+        self._pages = set()
+        self._start = time.monotonic()
+
+    def attach_context(self, context):
+        # Pages opened later (popups, context.new_page() in a TC) are picked up too
+        context.on("page", lambda page: asyncio.ensure_future(self.attach(page)))
+
+    async def attach(self, page):
+        if id(page) in self._pages:
+            return
+        self._pages.add(id(page))
+        try:
+            cdp = await page.context.new_cdp_session(page)
+        except async_api.Error:
+            self._attach_page_events(page)
+            return
+        cdp.on("Runtime.consoleAPICalled", self._on_console)
+        cdp.on("Runtime.exceptionThrown", self._on_exception)
+        cdp.on("Network.requestWillBeSent", self._on_request)
+        cdp.on("Network.responseReceived", self._on_response)
+        cdp.on("Network.loadingFinished", self._on_finished)
+        cdp.on("Network.loadingFailed", self._on_failed)
+        await cdp.send("Runtime.enable")
+        await cdp.send("Network.enable")
+
+    def _elapsed(self):
+        return round(time.monotonic() - self._start, 3)
+
+    def _store(self, kind, text, **extra):
+        self.events.append({"t": self._elapsed(), "kind": kind, "text": text, **extra})
+
+    def _note_console(self, level, text):
+        self.counters[f"console.{level}"] += 1
+        if any(marker in text for marker in _CHANNEL_ERRORS):
+            self.counters["channel_errors"] += 1
+            self._store("channel_error", text)
+        elif level in ("error", "warning", "assert"):
+            self._store(f"console.{level}", text)
+
+    # CDP handlers
+
+    def _on_console(self, params):
+        self._note_console(params.get("type", "log"), _console_text(params.get("args", ())))
+
+    def _on_exception(self, params):
+        self.counters["exceptions"] += 1
+        details = params.get("exceptionDetails", {})
+        exception = details.get("exception", {})
+        text = exception.get("description") or details.get("text", "")
+        self._store("exception", text[:_MAX_TEXT], url=details.get("url"), line=details.get("lineNumber"))
+
+    def _on_request(self, params):
+        self.counters["requests"] += 1
+        request = params["request"]
+        self._inflight[params["requestId"]] = [request["url"], request["method"], params["timestamp"], None]
+        if len(self._inflight) > self.max_inflight:
+            # Long-lived streams never finish; forget the oldest
+            self._inflight.popitem(last=False)
+
+    def _on_response(self, params):
+        entry = self._inflight.get(params["requestId"])
+        if entry is not None:
+            entry[3] = params["response"].get("status")
+
+    def _on_finished(self, params):
+        entry = self._inflight.pop(params["requestId"], None)
+        if entry is None:
+            return
+        url, method, started, status = entry
+        duration_ms = (params["timestamp"] - started) * 1000
+        if status is not None and status >= 400:
+            self._note_request_failure(url, method, duration_ms, f"HTTP {status}")
+        elif duration_ms >= self.slow_request_ms:
+            self.counters["requests.slow"] += 1
+            self.requests.append({"url": url, "method": method, "duration_ms": round(duration_ms, 1),
+                                  "status": status, "bytes": params.get("encodedDataLength")})
+
+    def _on_failed(self, params):
+        entry = self._inflight.pop(params["requestId"], None)
+        if entry is None:
+            return
+        url, method, started, _ = entry
+        reason = "canceled" if params.get("canceled") else params.get("errorText", "failed")
+        self._note_request_failure(url, method, (params["timestamp"] - started) * 1000, reason)
+
+    def _note_request_failure(self, url, method, duration_ms, reason):
+        self.counters["requests.failed"] += 1
+        self.requests.append({"url": url, "method": method, "duration_ms": round(duration_ms, 1), "error": reason})
+
+    # Playwright event fallback for Firefox and WebKit
+
+    def _attach_page_events(self, page):
+        page.on("console", lambda msg: self._note_console(msg.type, msg.text[:_MAX_TEXT]))
+        page.on("pageerror", self._on_page_error)
+        page.on("requestfinished", self._on_request_finished)
+        page.on("requestfailed", self._on_request_failed)
+
+    def _on_page_error(self, error):
+        self.counters["exceptions"] += 1
+        self._store("exception", str(error)[:_MAX_TEXT])
+
+    def _on_request_finished(self, request):
+        self.counters["requests"] += 1
+        duration_ms = request.timing.get("responseEnd", -1)
+        if duration_ms >= self.slow_request_ms:
+            self.counters["requests.slow"] += 1
+            self.requests.append({"url": request.url, "method": request.method, "duration_ms": round(duration_ms, 1)})
+
+    def _on_request_failed(self, request):
+        self.counters["requests"] += 1
+        self._note_request_failure(request.url, request.method, request.timing.get("responseEnd", -1), request.failure or "failed")
+
+    def summary(self):
+        return {
+            "counters": dict(self.counters),
+            "events": list(self.events),
+            # Slowest first, so the culprit for a slow test is on top
+            "requests": sorted(self.requests, key=lambda r: r["duration_ms"], reverse=True),
+        }
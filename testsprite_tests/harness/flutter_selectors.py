@@ -0,0 +1,206 @@
+import json
+from playwright import async_api
+
+# Name under which the engine is registered, e.g. page.locator('flutter=role=button label*="Clone"')
+ENGINE_NAME = "flutter"
+
+# Custom selector engine over the Flutter semantics tree.
+#
+# Flutter web paints to a canvas, so CSS selectors only ever see the flt-* host
+# elements. Once semantics are enabled the engine mirrors every widget into an
+# flt-semantics node carrying its label, role and value; this engine queries those.
+#
+# Selector grammar (terms are ANDed):
+#   role=button label*="Clone" value^="12"
+#   id="cloned-app-item"     (matches Semantics(identifier: ...) set in the Dart code)
+#   ops:  =  exact   *=  contains   ^=  prefix   $=  suffix   ~=  case-insensitive contains
+#   A selector without any term is a case-insensitive label match: flutter=Clone
+#
+# Quoted values are JSON strings, as semantics_selector() writes them.
+#
+# Node lookups are cached per document and invalidated by a MutationObserver on the
+# semantics host, so repeated queries against an unchanged screen do not rescan the DOM.
+# Only structural attributes are cached: typing changes an <input>'s value property
+# without any DOM mutation, so text field values are read live at match time.
+_ENGINE_SCRIPT = r"""
+(() => {
+  const state = { doc: null, nodes: null, dirty: true, results: new Map(), observer: null };
+  const TERM = /\s*(label|role|value|id)\s*(\*=|\^=|\$=|~=|=)\s*(?:"((?:[^"\\]|\\.)*)"|'((?:[^'\\]|\\.)*)'|(\S+))/y;
+
+  function semanticsHosts(doc) {
+    // The host lives in the light DOM on current engines and inside the glass
+    // pane's shadow root on older ones.
+    const hosts = Array.from(doc.querySelectorAll('flt-semantics-host'));
+    const pane = doc.querySelector('flt-glass-pane');
+    if (pane && pane.shadowRoot) {
+      hosts.push(...pane.shadowRoot.querySelectorAll('flt-semantics-host'));
+    }
+    return hosts;
+  }
+
+  function enableSemantics(doc) {
+    const placeholder = doc.querySelector('flt-semantics-placeholder');
+    if (placeholder) placeholder.dispatchEvent(new Event('click', { bubbles: true }));
+  }
+
+  function ownText(el) {
+    let text = '';
+    for (const child of el.childNodes) {
+      if (child.nodeType === Node.TEXT_NODE) text += child.textContent;
+      else if (child.nodeType === Node.ELEMENT_NODE && !child.tagName.startsWith('FLT-SEMANTICS')) text += child.textContent;
+    }
+    return text;
+  }
+
+  function describe(el) {
+    const input = el.querySelector(':scope > input, :scope > textarea');
+    let role = el.getAttribute('role') || '';
+    if (!role) {
+      if (input) role = 'textbox';
+      else if (el.hasAttribute('flt-tappable')) role = 'button';
+      else if (el.hasAttribute('aria-checked')) role = 'checkbox';
+    }
+    const label = (el.getAttribute('aria-label') || (input && input.getAttribute('aria-label')) || ownText(el)).trim();
+    const value = el.getAttribute('aria-valuetext') || el.getAttribute('aria-valuenow') || '';
+    const id = el.getAttribute('flt-semantics-identifier') || '';
+    // Text fields are returned as their <input> so fill()/type() work directly
+    return { el: input || el, input, role: role.toLowerCase(), label, value, id };
+  }
+
+  function valueOf(node) {
+    return node.input ? node.input.value : node.value;
+  }
+
+  function invalidate() {
+    state.dirty = true;
+    state.results.clear();
+  }
+
+  function snapshot(doc) {
+    if (state.doc === doc && !state.dirty) return state.nodes;
+    const hosts = semanticsHosts(doc);
+    if (!hosts.length) {
+      enableSemantics(doc);
+      return [];
+    }
+    if (state.observer) state.observer.disconnect();
+    state.observer = new MutationObserver(invalidate);
+    const nodes = [];
+    for (const host of hosts) {
+      state.observer.observe(host, { subtree: true, childList: true, attributes: true, characterData: true });
+      for (const el of host.querySelectorAll('flt-semantics')) nodes.push(describe(el));
+    }
+    state.doc = doc;
+    state.nodes = nodes;
+    state.dirty = false;
+    state.results.clear();
+    return nodes;
+  }
+
+  function parse(selector) {
+    const terms = [];
+    TERM.lastIndex = 0;
+    if (!TERM.test(selector)) return [{ key: 'label', op: '~=', expected: selector.trim() }];
+    TERM.lastIndex = 0;
+    while (TERM.lastIndex < selector.length && selector.slice(TERM.lastIndex).trim()) {
+      const m = TERM.exec(selector);
+      if (!m) throw new Error('Malformed flutter selector: ' + selector);
+      terms.push({ key: m[1], op: m[2], expected: unquote(m, selector) });
+    }
+    return terms;
+  }
+
+  function unquote(m, selector) {
+    if (m[5] !== undefined) return m[5];
+    // Single-quoted tokens are rewritten as the equivalent double-quoted JSON string
+    const body = m[3] !== undefined ? m[3]
+      : m[4].replace(/\\(.)|"/g, (all, ch) => ch === undefined ? '\\"' : (ch === "'" ? "'" : all));
+    try {
+      return JSON.parse('"' + body + '"');
+    } catch (e) {
+      throw new Error('Malformed flutter selector: ' + selector);
+    }
+  }
+
+  function matches(node, term) {
+    const actual = term.key === 'value' ? valueOf(node) : node[term.key];
+    switch (term.op) {
+      case '=': return actual === term.expected;
+      case '*=': return actual.includes(term.expected);
+      case '^=': return actual.startsWith(term.expected);
+      case '$=': return actual.endsWith(term.expected);
+      default: return actual.toLowerCase().includes(term.expected.toLowerCase());
+    }
+  }
+
+  function queryAll(root, selector) {
+    const doc = root.ownerDocument || root;
+    const nodes = snapshot(doc);
+    const scoped = root !== doc && root !== doc.documentElement;
+    if (!scoped && state.results.has(selector)) return state.results.get(selector);
+    const terms = parse(selector);
+    // Results that depend on live input values are never cached
+    const cacheable = !scoped && !terms.some((term) => term.key === 'value');
+    const found = [];
+    for (const node of nodes) {
+      if (scoped && !root.contains(node.el)) continue;
+      if (terms.every((term) => matches(node, term))) found.push(node.el);
+    }
+    if (cacheable && !state.dirty) state.results.set(selector, found);
+    return found;
+  }
+
+  return {
+    query(root, selector) {
+      return queryAll(root, selector)[0] || null;
+    },
+    queryAll,
+  };
+})()
+"""
+
+# Activates the semantics placeholder until the flt-semantics tree exists
+_ENABLE_SEMANTICS_SCRIPT = """
+() => {
+  if (document.querySelector('flt-semantics')) return true;
+  const pane = document.querySelector('flt-glass-pane');
+  if (pane && pane.shadowRoot && pane.shadowRoot.querySelector('flt-semantics')) return true;
+  const placeholder = document.querySelector('flt-semantics-placeholder');
+  if (placeholder) placeholder.dispatchEvent(new Event('click', { bubbles: true }));
+  return false;
+}
+"""
+
+
+async def register_flutter_selectors(playwright):
+    # Engines are registered per Playwright instance and must exist before the
+    # first browser context is created; registering twice is harmless.
+    try:
+        await playwright.selectors.register(ENGINE_NAME, script=_ENGINE_SCRIPT)
+    except async_api.Error as e:
+        if "already registered" not in str(e):
+            raise
+
+
+async def enable_flutter_semantics(page, timeout=5000):
+    # Returns False when the app never produced a semantics tree (e.g. it failed to boot)
+    try:
+        await page.wait_for_function(_ENABLE_SEMANTICS_SCRIPT, timeout=timeout, polling=100)
+        return True
+    except async_api.Error:
+        return False
+
+
+def semantics_selector(label=None, role=None, value=None, identifier=None, exact=False):
+    # Builds a selector string for the engine, e.g. semantics_selector("Clone", role="button")
+    op = "=" if exact else "*="
+    terms = []
+    if identifier:
+        terms.append(f"id={json.dumps(identifier, ensure_ascii=False)}")
+    if role:
+        terms.append(f"role={json.dumps(role, ensure_ascii=False)}")
+    if label is not None:
+        terms.append(f"label{op}{json.dumps(label, ensure_ascii=False)}")
+    if value is not None:
+        terms.append(f"value{op}{json.dumps(value, ensure_ascii=False)}")
+    return f"{ENGINE_NAME}=" + " ".join(terms)
@@ -0,0 +1,154 @@
+import json
+import re
+from collections import defaultdict
+
+# CDP heap snapshots, written to disk as they stream in and summarized without
+# loading the JSON document.
+#
+# A V8 .heapsnapshot is one object: a small "snapshot" header with the field
+# layout, then flat integer arrays ("nodes", "edges", ...) and finally the
+# "strings" table. The reader walks it in fixed-size chunks: node records are
+# folded into per-constructor counters as they are read, edges are skipped, and
+# only the strings that name a counted constructor are kept. Memory stays
+# proportional to the number of distinct constructors, not to the snapshot size.
+#
+# Objects are grouped like the DevTools "Summary" view: "object" and "native"
+# nodes by constructor name, everything else by node type ("(closure)",
+# "(string)", "(array)", ...). Sizes are self (shallow) sizes.
+
+_CHUNK_CHARS = 1 << 20
+_NUMBER = re.compile(r"\d+")
+_NAMED_TYPES = ("object", "native")
+
+
+async def take_heap_snapshot(page, path):
+    # Forces GC, then streams HeapProfiler chunks straight to path (Chromium only)
+    cdp = await page.context.new_cdp_session(page)
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            cdp.on("HeapProfiler.addHeapSnapshotChunk", lambda params: f.write(params["chunk"]))
+            await cdp.send("HeapProfiler.enable")
+            await cdp.send("HeapProfiler.collectGarbage")
+            await cdp.send("HeapProfiler.takeHeapSnapshot", {"reportProgress": False})
+    finally:
+        await cdp.detach()
+    return path
+
+
+class _ChunkReader:
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+
+    def _fill(self):
+        data = self.f.read(_CHUNK_CHARS)
+        if not data:
+            raise ValueError("Truncated heap snapshot")
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+
+    def skip_past(self, token):
+        while True:
+            index = self.buf.find(token, self.pos)
+            if index >= 0:
+                self.pos = index + len(token)
+                return
+            # Keep a tail in case the token straddles two chunks
+            self.pos = max(self.pos, len(self.buf) - len(token))
+            self._fill()
+
+    def read_until(self, token):
+        # Text from the current position up to (excluding) token; used for the small header
+        parts = []
+        while True:
+            index = self.buf.find(token, self.pos)
+            if index >= 0:
+                parts.append(self.buf[self.pos:index])
+                self.pos = index + len(token)
+                return "".join(parts)
+            keep = max(self.pos, len(self.buf) - len(token))
+            parts.append(self.buf[self.pos:keep])
+            self.pos = keep
+            self._fill()
+
+    def numbers(self):
+        # Yields lists of the integers of the array being read, up to its closing bracket
+        while True:
+            end = self.buf.find("]", self.pos)
+            if end >= 0:
+                yield [int(n) for n in _NUMBER.findall(self.buf, self.pos, end)]
+                self.pos = end + 1
+                return
+            # Stop at the last separator so no number is split across chunks
+            cut = self.buf.rfind(",", self.pos)
+            if cut > self.pos:
+                yield [int(n) for n in _NUMBER.findall(self.buf, self.pos, cut)]
+                self.pos = cut + 1
+            self._fill()
+
+    def strings(self):
+        # Yields the decoded strings of the array being read
+        decoder = json.JSONDecoder()
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n,":
+                self.pos += 1
+            if self.pos >= len(self.buf):
+                self._fill()
+                continue
+            if self.buf[self.pos] == "]":
+                self.pos += 1
+                return
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                self._fill()
+                continue
+            self.pos = end
+            yield value
+
+
+def summarize_heap_snapshot(path):
+    # {group name: {"count": n, "self_size": bytes}} for one snapshot file
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _ChunkReader(f)
+        reader.skip_past('"snapshot":')
+        header = json.loads(reader.read_until('"nodes":[').rstrip(" \t\r\n,"))
+        meta = header["meta"]
+        fields = meta["node_fields"]
+        stride = len(fields)
+        type_offset = fields.index("type")
+        name_offset = fields.index("name")
+        size_offset = fields.index("self_size")
+        type_names = meta["node_types"][type_offset]
+        named_types = {type_names.index(t) for t in _NAMED_TYPES if t in type_names}
+
+        # Keyed by string index for named types, by ~type index otherwise
+        counts = defaultdict(int)
+        sizes = defaultdict(int)
+        record = []
+        for batch in reader.numbers():
+            record.extend(batch)
+            usable = len(record) - len(record) % stride
+            for i in range(0, usable, stride):
+                node_type = record[i + type_offset]
+                key = record[i + name_offset] if node_type in named_types else ~node_type
+                counts[key] += 1
+                sizes[key] += record[i + size_offset]
+            del record[:usable]
+
+        wanted = {key for key in counts if key >= 0}
+        names = {}
+        reader.skip_past('"strings":[')
+        for index, value in enumerate(reader.strings()):
+            if index in wanted:
+                names[index] = value
+
+    summary = {}
+    for key, count in counts.items():
+        name = names.get(key, "(unknown)") if key >= 0 else f"({type_names[~key]})"
+        entry = summary.setdefault(name, {"count": 0, "self_size": 0})
+        entry["count"] += count
+        entry["self_size"] += sizes[key]
+    return summary
@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+from datetime import datetime
+from .artifacts import ARTIFACT_DIR, TESTS_DIR
+
+# Run history: one JSON line per benchmark run or test result, appended across
+# runs so trends and baselines can be compared over revisions.
+#
+#     {"kind": "startup", "time": "...", "revision": "a3c1ebe", ...}
+
+HISTORY_FILE = os.environ.get("TESTSPRITE_HISTORY_FILE", os.path.join(ARTIFACT_DIR, "run_history.jsonl"))
+
+
+def current_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=TESTS_DIR, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def append_history(kind, entry):
+    os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+    line = {"kind": kind, "time": datetime.now().isoformat(timespec="seconds"), "revision": current_revision(),
+            **entry}
+    with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(line, default=str) + "\n")
+    return line
+
+
+def load_history(kind=None):
+    entries = []
+    try:
+        with open(HISTORY_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if kind is None or entry.get("kind") == kind:
+                    entries.append(entry)
+    except OSError:
+        pass
+    return entries
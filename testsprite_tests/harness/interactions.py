@@ -0,0 +1,210 @@
+import asyncio
+from collections import defaultdict
+from playwright import async_api
+from .stats import percentile
+
+# Latency of every click, fill and key press a test makes, recorded in the page.
+#
+# For each trusted pointerdown, keydown or input event the probe stores the
+# event timestamp and the time of the first DOM change that follows it: the
+# frame in which Flutter updated the semantics tree or the scene, i.e. the
+# first visible reaction. Long tasks come from a PerformanceObserver and are
+# matched to the interactions they overlap when the results are collected.
+#
+# Interactions are named after the harness control that made them (see
+# ScreenPage in pages.py), or else after the aria-label under the pointer, so
+# raw locator clicks in the TCs are covered too.
+
+# An interaction with no DOM change within this many ms is reported as "no change"
+CHANGE_TIMEOUT_MS = 2000
+
+# Long task time above this counts as blocking, as in Total Blocking Time
+BLOCKING_THRESHOLD_MS = 50
+
+# Interactions and long tasks kept in the page; older entries are dropped first
+MAX_RECORDS = 2000
+
+INTERACTION_SCRIPT = """
+(() => {
+  const records = window.__fltInteractions = [];
+  const longTasks = window.__fltLongTasks = [];
+  const keep = (list, item) => {
+    list.push(item);
+    if (list.length > %(max)d) list.splice(0, list.length - %(max)d);
+  };
+  try {
+    new PerformanceObserver((list) => {
+      for (const entry of list.getEntries()) keep(longTasks, [entry.startTime, entry.duration]);
+    }).observe({ type: 'longtask', buffered: true });
+  } catch (e) {}
+
+  let pending = [];
+  let lastKeydown = -Infinity;
+  const observed = new WeakSet();
+  const observer = new MutationObserver(() => {
+    const now = performance.now();
+    for (const record of pending) record[3] = now;
+    pending = [];
+  });
+  const watch = (root) => {
+    if (root && !observed.has(root)) {
+      observed.add(root);
+      observer.observe(root, { subtree: true, childList: true, attributes: true, characterData: true });
+    }
+  };
+  const labelOf = (event) => {
+    const label = window.__fltInteractionLabel;
+    window.__fltInteractionLabel = null;
+    if (label) return label;
+    for (const el of event.composedPath()) {
+      const name = el.getAttribute && (el.getAttribute('aria-label') || el.getAttribute('flt-semantics-identifier'));
+      if (name) return name.slice(0, 60);
+    }
+    return event.target && event.target.tagName ? event.target.tagName.toLowerCase() : event.type;
+  };
+  const onInput = (event) => {
+    if (!event.isTrusted) return;
+    if (event.type === 'keydown') lastKeydown = event.timeStamp;
+    // Typing fires keydown and input; count the key press once
+    if (event.type === 'input' && event.timeStamp - lastKeydown < 50) return;
+    const pane = document.querySelector('flt-glass-pane');
+    watch(document.documentElement);
+    watch(pane && pane.shadowRoot);
+    const record = [event.type, labelOf(event), event.timeStamp, null];
+    keep(records, record);
+    pending.push(record);
+    setTimeout(() => { pending = pending.filter((r) => r !== record); }, %(timeout)d);
+  };
+  for (const type of ['pointerdown', 'keydown', 'input']) {
+    window.addEventListener(type, onInput, { capture: true });
+  }
+})();
+""" % {"timeout": CHANGE_TIMEOUT_MS, "max": MAX_RECORDS}
+
+
+async def install_interaction_probe(context):
+    await context.add_init_script(INTERACTION_SCRIPT)
+
+
+async def label_interaction(page, label):
+    # Names the next input event; the page-object helpers call this before acting
+    try:
+        await page.evaluate("(label) => { window.__fltInteractionLabel = label; }", label)
+    except async_api.Error:
+        pass
+
+
+async def collect_interactions(page):
+    # One entry per interaction with its latency and the long tasks that overlapped it
+    try:
+        data = await page.evaluate(
+            "() => ({ interactions: window.__fltInteractions || [], longTasks: window.__fltLongTasks || [] })"
+        )
+    except async_api.Error:
+        return []
+    interactions = []
+    for event_type, label, start, changed in data["interactions"]:
+        end = changed if changed is not None else start + CHANGE_TIMEOUT_MS
+        overlapping = [duration for task_start, duration in data["longTasks"]
+                       if task_start < end and task_start + duration > start]
+        interactions.append({
+            "type": event_type,
+            "label": label,
+            "latency_ms": None if changed is None else changed - start,
+            "long_tasks": len(overlapping),
+            "blocking_ms": sum(max(0, d - BLOCKING_THRESHOLD_MS) for d in overlapping),
+        })
+    return interactions
+
+
+def interaction_samples(interactions):
+    # Raw latencies per "type label", as recorded for the regression gate
+    samples = defaultdict(list)
+    for interaction in interactions:
+        if interaction["latency_ms"] is not None:
+            samples[f"{interaction['type']} {interaction['label']}"].append(interaction["latency_ms"])
+    return dict(samples)
+
+
+def interaction_table(interactions):
+    # Rows per (type, label), slowest first
+    groups = defaultdict(list)
+    for interaction in interactions:
+        groups[(interaction["type"], interaction["label"])].append(interaction)
+    rows = []
+    for (event_type, label), group in groups.items():
+        latencies = [i["latency_ms"] for i in group if i["latency_ms"] is not None]
+        rows.append({
+            "type": event_type,
+            "label": label,
+            "count": len(group),
+            "no_change": len(group) - len(latencies),
+            "p50_ms": percentile(latencies, 50),
+            "max_ms": max(latencies) if latencies else None,
+            "long_tasks": sum(i["long_tasks"] for i in group),
+            "blocking_ms": sum(i["blocking_ms"] for i in group),
+        })
+    rows.sort(key=lambda row: row["max_ms"] or 0, reverse=True)
+    return rows
+
+
+def format_interaction_table(rows):
+    def fmt(value):
+        return "-" if value is None else f"{value:.1f}"
+
+    lines = [f"{'interaction':<44}{'n':>4}{'no change':>11}{'p50 ms':>9}{'max ms':>9}{'long tasks':>12}{'blocking ms':>13}"]
+    for row in rows:
+        name = f"{row['type']} {row['label']}"
+        lines.append(f"{name[:43]:<44}{row['count']:>4}{row['no_change']:>11}{fmt(row['p50_ms']):>9}"
+                     f"{fmt(row['max_ms']):>9}{row['long_tasks']:>12}{row['blocking_ms']:>13.0f}")
+    return "\n".join(lines)
+
+
+# Benchmark probes for one timed action, as opposed to the passive probe above.
+
+# Resolves with ms from the next pointerdown until the semantics tree matches
+APPEAR_PROBE_SCRIPT = """
+({ selector, text, timeoutMs }) => {
+  const pane = document.querySelector('flt-glass-pane');
+  const host = (pane && pane.shadowRoot && pane.shadowRoot.querySelector('flt-semantics-host'))
+    || document.querySelector('flt-semantics-host');
+  const present = () => (selector && host.querySelector(selector))
+    || (text && [...host.querySelectorAll('[aria-label]')].some((el) => el.getAttribute('aria-label').includes(text)))
+    || (text && host.textContent.includes(text));
+  window.__fltAppearLatency = new Promise((resolve) => {
+    const deadline = setTimeout(() => resolve(null), timeoutMs);
+    window.addEventListener('pointerdown', (event) => {
+      const start = event.timeStamp;
+      const check = () => {
+        if (present()) {
+          clearTimeout(deadline);
+          resolve(performance.now() - start);
+        } else {
+          requestAnimationFrame(check);
+        }
+      };
+      requestAnimationFrame(check);
+    }, { once: true, capture: true });
+  });
+}
+"""
+
+
+async def timed_tap(page, screen, control, probe, timeout_ms):
+    # ms from tapping a ScreenPage control until probe's selector or text is on screen, or None
+    await page.evaluate(APPEAR_PROBE_SCRIPT, dict(probe, timeoutMs=timeout_ms))
+    if not await screen.tap(control):
+        return None
+    return await page.evaluate("() => window.__fltAppearLatency")
+
+
+# Wheel events per fling and the delay between them (one per 60 Hz frame)
+FLING_EVENTS = 20
+FLING_STEP_PX = 120
+FLING_INTERVAL_S = 1 / 60
+
+
+async def fling(page, direction):
+    for _ in range(FLING_EVENTS):
+        await page.mouse.wheel(0, direction * FLING_STEP_PX)
+        await asyncio.sleep(FLING_INTERVAL_S)
@@ -0,0 +1,97 @@
+import json
+import os
+
+# Chromium launch profiles compared by benchmarks/launch_profiles.py. The winner
+# is written to launch_profile.json, which AppSession reads on every launch.
+PROFILE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "launch_profile.json")
+
+# Browser engine for AppSession; benchmarks/engine_matrix.py sets it per run
+ENGINES = ("chromium", "firefox", "webkit")
+BROWSER = os.environ.get("TESTSPRITE_BROWSER", "chromium")
+
+# Used when no benchmark result exists yet; these are the flags the TCs shipped with
+DEFAULT_PROFILE = "legacy"
+
+_WINDOW = "--window-size=1280,720"
+
+PROFILES = {
+    # Original hard-coded flags
+    "legacy": {
+        "headless": True,
+        "args": [_WINDOW, "--disable-dev-shm-usage", "--ipc=host", "--single-process"],
+    },
+    # Same, but with separate renderer processes
+    "multi-process": {
+        "headless": True,
+        "args": [_WINDOW, "--disable-dev-shm-usage", "--ipc=host"],
+    },
+    # headless=True runs the lightweight chromium-headless-shell build; also the
+    # baseline for the shared-memory comparison below
+    "headless-shell": {
+        "headless": True,
+        "args": [_WINDOW],
+    },
+    # The "chromium" channel runs the full browser in new headless mode
+    "new-headless": {
+        "headless": True,
+        "channel": "chromium",
+        "args": [_WINDOW],
+    },
+    "no-gpu": {
+        "headless": True,
+        "args": [_WINDOW, "--disable-gpu", "--disable-gpu-compositing"],
+    },
+    # /dev/shm is often tiny in containers; compare it with the /tmp fallback
+    "no-shm": {
+        "headless": True,
+        "args": [_WINDOW, "--disable-dev-shm-usage"],
+    },
+}
+
+
+def load_launch_profile():
+    # TESTSPRITE_LAUNCH_PROFILE=<name> overrides the benchmarked choice
+    name = os.environ.get("TESTSPRITE_LAUNCH_PROFILE")
+    if name:
+        return name, PROFILES[name]
+    try:
+        with open(PROFILE_FILE, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        return saved["profile"], {
+            "headless": saved.get("headless", True),
+            "channel": saved.get("channel"),
+            "args": saved["args"],
+        }
+    except (OSError, ValueError, KeyError):
+        return DEFAULT_PROFILE, PROFILES[DEFAULT_PROFILE]
+
+
+def save_launch_profile(name, profile, measured):
+    with open(PROFILE_FILE, "w", encoding="utf-8") as f:
+        json.dump({
+            "profile": name,
+            "headless": profile.get("headless", True),
+            "channel": profile.get("channel"),
+            "args": profile["args"],
+            "measured": measured,
+        }, f, indent=2)
+
+
+def launch_options(profile):
+    # Keyword arguments for BrowserType.launch()
+    options = {"headless": profile.get("headless", True), "args": list(profile["args"])}
+    if profile.get("channel"):
+        options["channel"] = profile["channel"]
+    return options
+
+
+def engine_launch_options(engine, profile=None):
+    # Launch profiles are Chromium flags; Firefox and WebKit get plain headless defaults
+    if engine == "chromium":
+        return launch_options(profile or PROFILES[DEFAULT_PROFILE])
+    return {"headless": True}
+
+
+def installed_engines(pw):
+    # Engines whose browser build has been fetched with `playwright install`
+    return [name for name in ENGINES if os.path.exists(getattr(pw, name).executable_path)]
@@ -0,0 +1,75 @@
+from playwright import async_api
+from .processes import browser_rss_mb
+
+# Memory of the app under test, not of the Python test process.
+#
+# On Chromium the renderer is queried over CDP: Runtime.getHeapUsage for the JS
+# heap (optionally after HeapProfiler.collectGarbage) and Performance.getMetrics
+# for live DOM nodes, event listeners and documents. The browser process-tree
+# RSS is added on every engine; the CDP fields stay None on Firefox and WebKit.
+
+_MB = 1024 * 1024
+
+
+class MemoryProbe:
+
+    def __init__(self, page):
+        self.page = page
+        self._cdp = None
+        self._supported = True
+
+    async def _session(self):
+        if self._cdp is None and self._supported:
+            try:
+                self._cdp = await self.page.context.new_cdp_session(self.page)
+                await self._cdp.send("Performance.enable")
+            except async_api.Error:
+                self._supported = False
+        return self._cdp
+
+    async def sample(self, gc=False):
+        data = {"js_heap_mb": None, "js_heap_total_mb": None, "dom_nodes": None, "listeners": None,
+                "documents": None}
+        cdp = await self._session()
+        if cdp:
+            if gc:
+                await cdp.send("HeapProfiler.collectGarbage")
+            heap = await cdp.send("Runtime.getHeapUsage")
+            metrics = {m["name"]: m["value"] for m in (await cdp.send("Performance.getMetrics"))["metrics"]}
+            data.update(
+                js_heap_mb=heap["usedSize"] / _MB,
+                js_heap_total_mb=heap["totalSize"] / _MB,
+                dom_nodes=int(metrics.get("Nodes", 0)),
+                listeners=int(metrics.get("JSEventListeners", 0)),
+                documents=int(metrics.get("Documents", 0)),
+            )
+        data["rss_mb"] = browser_rss_mb()
+        return data
+
+    async def close(self):
+        if self._cdp:
+            try:
+                await self._cdp.detach()
+            except async_api.Error:
+                pass
+            self._cdp = None
+
+
+def app_memory_mb(sample):
+    # JS heap where the engine exposes it, otherwise the browser's RSS
+    return sample["js_heap_mb"] if sample["js_heap_mb"] is not None else sample["rss_mb"]
+
+
+def memory_delta(before, after):
+    return {key: (after[key] - before[key]) if before[key] is not None and after[key] is not None else None
+            for key in after}
+
+
+def format_sample(sample):
+    parts = []
+    if sample["js_heap_mb"] is not None:
+        parts.append(f"JS heap {sample['js_heap_mb']:.2f} MB")
+        parts.append(f"DOM nodes {sample['dom_nodes']}")
+        parts.append(f"listeners {sample['listeners']}")
+    parts.append(f"browser RSS {sample['rss_mb']:.2f} MB")
+    return ", ".join(parts)
@@ -0,0 +1,250 @@
+import asyncio
+from playwright import async_api
+from .flutter_selectors import ENGINE_NAME, semantics_selector
+from .interactions import label_interaction
+
+# Page objects for the screens in lib/screens/.
+#
+# Every control is declared once as a semantics selector and turned into a
+# Playwright Locator on first use. Locators are lazy and re-resolve on each
+# action, so the cached objects stay valid across Flutter re-renders, unlike the
+# element-handle snapshots returned by query_selector_all.
+#
+# Clicks and fills made through these helpers are named after the control in
+# the per-test interaction-latency table (see interactions.py).
+
+
+class ScreenPage:
+    # Semantics selector per control name; subclasses fill this in
+    controls = {}
+    # Control whose visibility means the screen is on top
+    anchor = None
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.page = pages.page
+        self._locators = {}
+
+    def control(self, name):
+        locator = self._locators.get(name)
+        if locator is None:
+            locator = self.page.locator(self.controls[name])
+            self._locators[name] = locator
+        return locator
+
+    async def is_active(self):
+        try:
+            return await self.control(self.anchor).first.is_visible()
+        except async_api.Error:
+            return False
+
+    async def wait_active(self, timeout=5000):
+        try:
+            await self.control(self.anchor).first.wait_for(state="visible", timeout=timeout)
+            return True
+        except async_api.Error:
+            return False
+
+    async def label(self, name):
+        await label_interaction(self.page, f"{type(self).__name__}.{name}")
+
+    async def tap(self, name, timeout=2000):
+        # Returns False instead of raising when the control is not on screen
+        try:
+            await self.label(name)
+            await self.control(name).first.click(timeout=timeout)
+            return True
+        except async_api.Error:
+            return False
+
+
+class HomePage(ScreenPage):
+    # lib/screens/home_screen.dart
+    anchor = "title"
+    controls = {
+        "title": semantics_selector("MultiSpace", exact=True),
+        "apps_tab": f'{ENGINE_NAME}=label^="Apps"',
+        "settings_tab": f'{ENGINE_NAME}=label^="Settings"',
+        "add_app": semantics_selector("Add app", role="button"),
+        "help": semantics_selector("Help & Support"),
+    }
+
+    async def open(self):
+        if await self.is_active():
+            return True
+        # The app list is the only route pushed on top of home
+        if await self.pages.app_list.is_active():
+            await self.pages.app_list.tap("back")
+        return await self.wait_active()
+
+
+class ClonedAppsPage(ScreenPage):
+    # lib/screens/cloned_apps_screen.dart, the "Apps" tab of home
+    anchor = "system_status"
+    controls = {
+        "system_status": semantics_selector("System Status"),
+        "memory": semantics_selector("Memory"),
+        "clone_count": f'{ENGINE_NAME}=label^="Cloned Apps"',
+        "empty_state": semantics_selector("No cloned apps yet"),
+        "app_items": semantics_selector(identifier="cloned-app-item"),
+        # Long-press options sheet
+        "launch": semantics_selector("Launch App"),
+        "clone_again": semantics_selector("Clone Again"),
+        "statistics": semantics_selector("View Statistics"),
+        "storage": semantics_selector("Manage Storage"),
+        "remove": semantics_selector("Remove Clone"),
+        "confirm_remove": semantics_selector("Remove", role="button", exact=True),
+    }
+
+    async def open(self):
+        if await self.is_active():
+            return True
+        await self.pages.home.open()
+        await self.pages.home.tap("apps_tab")
+        return await self.wait_active()
+
+    def app(self, name_or_index):
+        if isinstance(name_or_index, int):
+            return self.control("app_items").nth(name_or_index)
+        return self.page.locator(semantics_selector(name_or_index, identifier="cloned-app-item")).first
+
+    async def app_count(self):
+        return await self.control("app_items").count()
+
+    async def open_options(self, name_or_index=0, hold_ms=800):
+        # Long-press a clone to open its options sheet; Playwright has no long-press action
+        try:
+            box = await self.app(name_or_index).bounding_box(timeout=2000)
+        except async_api.Error:
+            return False
+        if not box:
+            return False
+        await self.label("options")
+        await self.page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
+        await self.page.mouse.down()
+        await asyncio.sleep(hold_ms / 1000)
+        await self.page.mouse.up()
+        try:
+            await self.control("remove").first.wait_for(state="visible", timeout=2000)
+            return True
+        except async_api.Error:
+            return False
+
+
+class AppListPage(ScreenPage):
+    # lib/screens/app_list_screen.dart, pushed by the home FAB
+    anchor = "title"
+    controls = {
+        "title": semantics_selector("Add to MultiSpace"),
+        "back": semantics_selector("Back", role="button"),
+        "search": f'{ENGINE_NAME}=role=textbox',
+        "app_items": semantics_selector(identifier="app-item"),
+        "clone_selected": f'{ENGINE_NAME}=role=button label^="CLONE "',
+        # "Customize Clone" dialog
+        "custom_name": f'{ENGINE_NAME}=role=textbox label*="e.g."',
+        "skip": semantics_selector("Skip", role="button", exact=True),
+        "confirm_clone": semantics_selector("Clone", role="button", exact=True),
+        "ok": semantics_selector("OK", role="button", exact=True),
+    }
+
+    async def open(self):
+        if await self.is_active():
+            return True
+        await self.pages.home.open()
+        await self.pages.home.tap("add_app")
+        return await self.wait_active()
+
+    async def search(self, text):
+        await self.label("search")
+        await self.control("search").first.fill(text)
+
+    def app(self, index_or_name=0):
+        items = self.control("app_items")
+        if isinstance(index_or_name, int):
+            return items.nth(index_or_name)
+        return self.page.locator(semantics_selector(index_or_name, identifier="app-item")).first
+
+    async def app_count(self):
+        return await self.control("app_items").count()
+
+    async def clone(self, index_or_name=0, custom_name=None):
+        # Select an app, press CLONE and walk through the customize/result dialogs
+        try:
+            await self.label("app")
+            await self.app(index_or_name).click(timeout=2000)
+        except async_api.Error:
+            return False
+        if not await self.tap("clone_selected"):
+            return False
+        if custom_name:
+            try:
+                await self.label("custom_name")
+                await self.control("custom_name").first.fill(custom_name, timeout=2000)
+            except async_api.Error:
+                pass
+            await self.tap("confirm_clone")
+        else:
+            await self.tap("skip")
+        await self.tap("ok", timeout=5000)
+        return True
+
+
+class SettingsPage(ScreenPage):
+    # A screen reached from its "entry" tile on the Settings tab of home
+
+    async def open(self):
+        # HomeScreen does not link these screens today, in which case this
+        # returns False without reloading.
+        if await self.is_active():
+            return True
+        await self.pages.home.open()
+        await self.pages.home.tap("settings_tab")
+        if not await self.tap("entry"):
+            return False
+        return await self.wait_active()
+
+
+class PerformanceSettingsPage(SettingsPage):
+    # lib/screens/performance_settings_screen.dart
+    # The entry tile shares the screen title, so a section header is the anchor
+    anchor = "monitoring_section"
+    controls = {
+        "monitoring_section": semantics_selector("Performance Monitoring"),
+        "entry": semantics_selector("Performance Settings"),
+        "start_monitoring": f'{ENGINE_NAME}=role=button label="Start"',
+        "stop_monitoring": f'{ENGINE_NAME}=role=button label="Stop"',
+        "optimize_performance": semantics_selector("Optimize Performance", role="button"),
+        "optimize_memory": semantics_selector("Optimize Memory", role="button"),
+        "cleanup_spaces": semantics_selector("Cleanup Virtual Spaces", role="button"),
+        "global_cleanup": semantics_selector("Global Cleanup", role="button"),
+    }
+
+
+class SecuritySettingsPage(SettingsPage):
+    # lib/screens/security_settings_screen.dart
+    anchor = "runtime_protection"
+    controls = {
+        "entry": semantics_selector("Security Settings"),
+        "run_check": semantics_selector("Run Security Check", role="button"),
+        "runtime_protection": semantics_selector("Runtime Protection"),
+        "master_key": semantics_selector("Generate Master Key"),
+        "integrity": semantics_selector("Check App Integrity"),
+        "test_encryption": semantics_selector("Test Encryption", role="button"),
+        "test_obfuscation": semantics_selector("Test Obfuscation", role="button"),
+    }
+
+
+class AppPages:
+    # One instance per Playwright page; holds a page object for every screen
+
+    def __init__(self, page):
+        self.page = page
+        self.home = HomePage(self)
+        self.cloned_apps = ClonedAppsPage(self)
+        self.app_list = AppListPage(self)
+        self.performance_settings = PerformanceSettingsPage(self)
+        self.security_settings = SecuritySettingsPage(self)
+
+    async def goto(self, name):
+        # Navigates through the app's own routes; never reloads the page
+        return await getattr(self, name).open()
@@ -0,0 +1,28 @@
+import psutil
+
+# Chromium runs as grandchildren of the test process (python -> playwright
+# driver -> browser), so its processes are found by walking our own tree.
+_BROWSER_NAMES = ("chrome", "chromium", "headless_shell", "firefox", "webkit", "minibrowser")
+
+
+def browser_processes():
+    found = []
+    for proc in psutil.Process().children(recursive=True):
+        try:
+            name = proc.name().lower()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        if any(part in name for part in _BROWSER_NAMES):
+            found.append(proc)
+    return found
+
+
+def browser_rss_mb():
+    # Sum of resident memory over every browser process (browser, GPU, renderers)
+    total = 0
+    for proc in browser_processes():
+        try:
+            total += proc.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return total / 1024 / 1024
@@ -0,0 +1,119 @@
+import json
+import os
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from .artifacts import artifact_path
+
+# Opt-in renderer CPU profiling (TESTSPRITE_CPU_PROFILE=1) and .cpuprofile
+# aggregation.
+#
+# CpuProfiler wraps a phase in CDP Profiler.start/stop and writes the result as
+# artifacts/<TC>.<phase>.cpuprofile, which DevTools opens directly. aggregate()
+# folds many profiles into per-function self and total time; total time counts
+# a function once per sample even when it recurses. With a SourceMap for
+# main.dart.js, frames are renamed to their Dart names and source lines.
+
+PROFILE_ENABLED = os.environ.get("TESTSPRITE_CPU_PROFILE", "0") == "1"
+SAMPLING_INTERVAL_US = int(os.environ.get("TESTSPRITE_CPU_PROFILE_INTERVAL", "200"))
+
+
+class CpuProfiler:
+
+    def __init__(self, page, interval_us=SAMPLING_INTERVAL_US):
+        self.page = page
+        self.interval_us = interval_us
+        self.saved = []
+        self._cdp = None
+
+    async def start(self):
+        self._cdp = await self.page.context.new_cdp_session(self.page)
+        await self._cdp.send("Profiler.enable")
+        await self._cdp.send("Profiler.setSamplingInterval", {"interval": self.interval_us})
+        await self._cdp.send("Profiler.start")
+
+    async def stop(self, phase="test"):
+        result = await self._cdp.send("Profiler.stop")
+        await self._cdp.detach()
+        self._cdp = None
+        path = artifact_path(f".{phase}.cpuprofile")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(result["profile"], f)
+        self.saved.append(path)
+        return path
+
+    @asynccontextmanager
+    async def phase(self, name):
+        await self.start()
+        try:
+            yield self
+        finally:
+            await self.stop(name)
+
+
+def _frame_key(call_frame, source_maps):
+    name = call_frame.get("functionName") or "(anonymous)"
+    url = call_frame.get("url", "")
+    line = call_frame.get("lineNumber", -1)
+    source_map = source_maps.get(url.rsplit("/", 1)[-1]) if url else None
+    if source_map is not None and line >= 0:
+        mapped = source_map.lookup(line, call_frame.get("columnNumber", 0))
+        if mapped:
+            source, source_line, mapped_name = mapped
+            return f"{mapped_name or name} ({source}:{source_line})"
+    if not url:
+        return name
+    return f"{name} ({url.rsplit('/', 1)[-1]}:{line + 1})"
+
+
+def load_profile(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def function_times(profile, source_maps=None):
+    # {function: [self ms, total ms]} for one profile
+    source_maps = source_maps or {}
+    nodes = {node["id"]: node for node in profile["nodes"]}
+    parents = {}
+    for node in profile["nodes"]:
+        for child in node.get("children", ()):
+            parents[child] = node["id"]
+    keys = {node_id: _frame_key(node["callFrame"], source_maps) for node_id, node in nodes.items()}
+
+    # Sample i lasts until sample i+1 (the last one has no known duration)
+    node_ms = defaultdict(float)
+    samples = profile.get("samples", [])
+    deltas = profile.get("timeDeltas", [])
+    for i, node_id in enumerate(samples[:-1]):
+        node_ms[node_id] += deltas[i + 1] / 1000
+
+    # Functions on the stack of each node, filled root-first without recursion
+    stacks = {}
+
+    def stack_keys(node_id):
+        chain = []
+        while node_id is not None and node_id not in stacks:
+            chain.append(node_id)
+            node_id = parents.get(node_id)
+        inherited = stacks[node_id] if node_id is not None else frozenset()
+        for chained in reversed(chain):
+            inherited = stacks[chained] = inherited | {keys[chained]}
+        return inherited
+
+    times = defaultdict(lambda: [0.0, 0.0])
+    for node_id, ms in node_ms.items():
+        times[keys[node_id]][0] += ms
+        for key in stack_keys(node_id):
+            times[key][1] += ms
+    return times
+
+
+def aggregate(paths, source_maps=None):
+    # Mean per-profile {function: [self ms, total ms]} over several profiles
+    totals = defaultdict(lambda: [0.0, 0.0])
+    for path in paths:
+        for key, (self_ms, total_ms) in function_times(load_profile(path), source_maps).items():
+            totals[key][0] += self_ms
+            totals[key][1] += total_ms
+    count = max(1, len(paths))
+    return {key: [self_ms / count, total_ms / count] for key, (self_ms, total_ms) in totals.items()}
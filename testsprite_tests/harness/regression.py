@@ -0,0 +1,131 @@
+import json
+import math
+import os
+import random
+import statistics
+from datetime import datetime
+from .artifacts import TESTS_DIR, record
+from .history import current_revision
+
+# Benchmark regression gate: raw samples per metric are recorded by benchmarks
+# (record_samples), compared with a stored baseline distribution, and a metric
+# only fails when it is significantly slower AND slower by more than a minimum
+# effect size, so noise and trivial shifts do not block anyone.
+#
+# Baselines live in baselines.json next to the TCs and are rewritten by
+# `python -m benchmarks.gate bless`.
+
+BASELINE_FILE = os.environ.get("TESTSPRITE_BASELINE_FILE", os.path.join(TESTS_DIR, "baselines.json"))
+
+# Fewer samples than this on either side gives "insufficient", never a failure
+MIN_SAMPLES = 5
+
+_samples = {}
+
+
+def record_samples(metric, values, lower_is_better=True):
+    # Adds raw samples to this run's report under "samples"
+    values = [v for v in values if v is not None]
+    entry = _samples.setdefault(metric, {"values": [], "lower_is_better": lower_is_better})
+    entry["values"].extend(values)
+    record("samples", _samples)
+
+
+def mann_whitney_u(baseline, current):
+    # One-sided p-value that current tends to be larger than baseline (normal approximation, tie-corrected)
+    n1, n2 = len(current), len(baseline)
+    combined = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, side) in zip(ranks, combined) if side == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def bootstrap_ratio_ci(baseline, current, confidence=0.95, resamples=2000, seed=0):
+    # Bootstrap interval of median(current) / median(baseline)
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(resamples):
+        base = statistics.median(rng.choices(baseline, k=len(baseline)))
+        cur = statistics.median(rng.choices(current, k=len(current)))
+        if base:
+            ratios.append(cur / base)
+    ratios.sort()
+    if not ratios:
+        return (None, None)
+    tail = (1 - confidence) / 2
+    return (ratios[int(tail * (len(ratios) - 1))], ratios[int((1 - tail) * (len(ratios) - 1))])
+
+
+def compare(baseline, current, lower_is_better=True, method="mannwhitney", alpha=0.05, min_effect=0.05):
+    # Verdict for one metric: "regressed", "improved", "ok" or "insufficient"
+    result = {"baseline_n": len(baseline), "current_n": len(current), "method": method}
+    if len(baseline) < MIN_SAMPLES or len(current) < MIN_SAMPLES:
+        return dict(result, verdict="insufficient")
+    base_median = statistics.median(baseline)
+    cur_median = statistics.median(current)
+    # Positive change = worse, whichever direction the metric improves in
+    sign = 1 if lower_is_better else -1
+    change = sign * (cur_median - base_median) / base_median if base_median else 0.0
+    result.update(baseline_median=base_median, current_median=cur_median, change=change)
+
+    if method == "bootstrap":
+        # Two-sided interval whose tails match a one-sided test at alpha
+        low, high = bootstrap_ratio_ci(baseline, current, confidence=1 - 2 * alpha)
+        if low is None:
+            return dict(result, verdict="insufficient")
+        result.update(ci_low=low, ci_high=high)
+        significant_worse = low > 1 if lower_is_better else high < 1
+        significant_better = high < 1 if lower_is_better else low > 1
+    else:
+        _, p_worse = mann_whitney_u(baseline, current) if lower_is_better else mann_whitney_u(current, baseline)
+        _, p_better = mann_whitney_u(current, baseline) if lower_is_better else mann_whitney_u(baseline, current)
+        result.update(p_value=p_worse)
+        significant_worse = p_worse < alpha
+        significant_better = p_better < alpha
+
+    if significant_worse and change > min_effect:
+        verdict = "regressed"
+    elif significant_better and change < -min_effect:
+        verdict = "improved"
+    else:
+        verdict = "ok"
+    return dict(result, verdict=verdict)
+
+
+def load_baselines():
+    try:
+        with open(BASELINE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baselines(baselines):
+    with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+
+
+def bless(baselines, key, entry):
+    baselines[key] = {
+        "values": entry["values"],
+        "lower_is_better": entry.get("lower_is_better", True),
+        "revision": current_revision(),
+        "blessed": datetime.now().isoformat(timespec="seconds"),
+    }
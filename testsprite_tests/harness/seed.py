@@ -0,0 +1,70 @@
+import json
+import random
+
+# Synthetic app data written straight into the app's SharedPreferences.
+#
+# shared_preferences_web keeps every key in localStorage as "flutter.<key>" with
+# a JSON-encoded value. The seed runs as an init script, once per tab (guarded by
+# sessionStorage), so reloads and in-app deletes are not undone by re-seeding.
+#
+#   cloned_apps      appName|packageName|cloneId|displayName  (AppService._addToClonedApps)
+#   web_app_catalog  appName|packageName  (AppService._loadWebAppCatalog)
+#
+# The app only reads web_app_catalog in web builds made with CATALOG_BUILD_ARG;
+# release builds without it never fall back to seeded data.
+
+CATALOG_BUILD_ARG = "--dart-define=WEB_TEST_CATALOG=true"
+
+_SEED_SCRIPT = """
+((values) => {
+  if (sessionStorage.getItem('__testspriteSeeded')) return;
+  for (const [key, value] of Object.entries(values)) {
+    localStorage.setItem('flutter.' + key, JSON.stringify(value));
+  }
+  sessionStorage.setItem('__testspriteSeeded', '1');
+})(%s)
+"""
+
+_WORDS = (
+    "Chrome", "Calculator", "Calendar", "Camera", "Chat", "Clock", "Cloud", "Contacts", "Drive", "Email",
+    "Files", "Fitness", "Gallery", "Games", "Maps", "Messages", "Music", "News", "Notes", "Pay",
+    "Photos", "Podcasts", "Radio", "Reader", "Shop", "Social", "Sports", "Tasks", "Travel", "Video",
+    "Wallet", "Weather",
+)
+_SUFFIXES = ("", " Lite", " Pro", " Plus", " Business", " Go")
+
+
+def synthetic_catalog(count, seed=0):
+    # Deterministic "appName|packageName" entries with realistic, searchable names
+    rng = random.Random(seed)
+    entries = []
+    for i in range(count):
+        name = f"{rng.choice(_WORDS)} {rng.choice(_WORDS)}{rng.choice(_SUFFIXES)}"
+        entries.append(f"{name}|com.synthetic.{name.lower().replace(' ', '')}.{i:05d}")
+    return entries
+
+
+def synthetic_clones(count, apps=None, seed=0):
+    # "appName|packageName|cloneId|displayName" entries, several clones per app
+    apps = apps or synthetic_catalog(max(1, count // 3), seed)
+    clone_ids = {}
+    entries = []
+    for i in range(count):
+        app_name, package = apps[i % len(apps)].split("|")[:2]
+        clone_ids[package] = clone_ids.get(package, 0) + 1
+        entries.append(f"{app_name}|{package}|{clone_ids[package]}|Clone {clone_ids[package]}")
+    return entries
+
+
+async def seed_preferences(context, values):
+    # values: {preference key: JSON-serializable value}; must run before navigation
+    await context.add_init_script(_SEED_SCRIPT % json.dumps(values))
+
+
+def app_data(catalog=0, clones=0, seed=0):
+    # Preferences for a catalog of installed apps and clones drawn from it
+    apps = synthetic_catalog(catalog or max(1, clones // 3), seed)
+    values = {"web_app_catalog": apps} if catalog else {}
+    if clones:
+        values["cloned_apps"] = synthetic_clones(clones, apps, seed)
+    return values
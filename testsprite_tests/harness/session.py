@@ -0,0 +1,277 @@
+import asyncio
+import contextlib
+import os
+import sys
+from playwright import async_api
+from .flutter_selectors import register_flutter_selectors, enable_flutter_semantics
+from .pages import AppPages
+from .launch import BROWSER, load_launch_profile, engine_launch_options
+from .asset_cache import ASSET_CACHE, install_asset_cache
+from .artifacts import record, flush_report
+from .tracing import TRACE_ENABLED, RollingTracer
+from .events import EventCollector
+from .processes import browser_rss_mb
+from .timing import INPUT_LATENCY_ENABLED, install_first_frame_probe, first_frame_ms, measure_input_latency
+from .seed import seed_preferences
+from .web_vitals import install_web_vitals, collect_web_vitals, format_web_vitals
+from .interactions import (
+    install_interaction_probe,
+    collect_interactions,
+    interaction_samples,
+    interaction_table,
+    format_interaction_table,
+)
+from .regression import record_samples
+from .profiler import PROFILE_ENABLED, CpuProfiler
+from .clock import VIRTUAL_CLOCK, install_virtual_clock, advance, wait
+from .devices import DEVICE, device_profile, device_context_options, install_device_hints, emulate_device
+
+# URL of the Flutter web build under test
+APP_URL = os.environ.get("TESTSPRITE_APP_URL", "http://localhost:5174")
+
+# Hard limit enforced by run_all_tests.py; the trace is saved shortly before it
+TEST_TIMEOUT = float(os.environ.get("TESTSPRITE_TEST_TIMEOUT", "60"))
+_TIMEOUT_MARGIN = 5
+
+
+class AppSession:
+    # Shared browser/context/page lifecycle used by every TC script:
+    #
+    #     session = AppSession()
+    #     try:
+    #         page = await session.start()
+    #         ...
+    #     finally:
+    #         await session.close()
+
+    def __init__(self, url=APP_URL, default_timeout=5000, semantics=True, asset_cache=True, trace=TRACE_ENABLED,
+                 capture_events=True, virtual_clock=VIRTUAL_CLOCK, engine=BROWSER, seed=None, cpu_profile=PROFILE_ENABLED,
+                 device=DEVICE, interactions=True, web_vitals=True, input_latency=INPUT_LATENCY_ENABLED):
+        self.url = url
+        # SharedPreferences written before the app boots (see harness/seed.py)
+        self.seed = seed
+        self.engine = engine
+        # Named low-end device emulation (see harness/devices.py)
+        self.device_name = device
+        self.device = device_profile(device)
+        self._device_sessions = []
+        self.default_timeout = default_timeout
+        self.semantics = semantics
+        # Cached assets are fulfilled without touching the network, which would skip its throttling
+        self.asset_cache = asset_cache and not (self.device and self.device["network"])
+        self.trace = trace
+        self.tracer = None
+        self.events = EventCollector() if capture_events else None
+        self.virtual_clock = virtual_clock
+        # Event timestamps and the faked performance.now() disagree under the virtual clock
+        self.interactions = interactions and not virtual_clock
+        self.web_vitals = web_vitals
+        # Clicks an inert probe element in measure(); off unless asked for (TESTSPRITE_INPUT_LATENCY=1)
+        self.input_latency = input_latency and not virtual_clock
+        self.cpu_profile = cpu_profile
+        self.profiler = None
+        self._phase_profilers = []
+        self._watchdog = None
+        self.pw = None
+        self.profile_name = None
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.pages = None
+        self.semantics_enabled = False
+
+    async def start(self):
+        # Start a Playwright session in asynchronous mode
+        self.pw = await async_api.async_playwright().start()
+
+        # Selector engines must be registered before any context exists
+        await register_flutter_selectors(self.pw)
+
+        # Launch the engine; Chromium uses the benchmarked profile (see benchmarks/launch_profiles.py)
+        profile = None
+        if self.engine == "chromium":
+            self.profile_name, profile = load_launch_profile()
+        self.browser = await getattr(self.pw, self.engine).launch(**engine_launch_options(self.engine, profile))
+
+        # Create a new browser context (like an incognito window)
+        self.context = await self.new_context()
+
+        # Keep a rolling trace that is only written out if the test fails or times out
+        if self.trace:
+            self.tracer = RollingTracer(self.context)
+            await self.tracer.start()
+            self._watchdog = asyncio.create_task(self._save_trace_before_timeout())
+
+        # Open a new page in the browser context
+        self.page = await self.context.new_page()
+        await self.emulate(self.page)
+        if self.events:
+            await self.events.attach(self.page)
+        self.pages = AppPages(self.page)
+
+        # Whole-test renderer CPU profile, load included (TESTSPRITE_CPU_PROFILE=1)
+        if self.cpu_profile:
+            self.profiler = CpuProfiler(self.page)
+            await self.profiler.start()
+
+        await self.open(self.page)
+        return self.page
+
+    async def new_context(self, **options):
+        # Service workers would bypass the asset cache routes, so they are blocked
+        if self.asset_cache:
+            options.setdefault("service_workers", "block")
+        if self.device:
+            options = dict(device_context_options(self.device, self.engine), **options)
+        context = await self.browser.new_context(**options)
+        context.set_default_timeout(self.default_timeout)
+        if self.device:
+            await install_device_hints(context, self.device)
+        if self.virtual_clock:
+            await install_virtual_clock(context)
+        await install_first_frame_probe(context)
+        if self.web_vitals:
+            await install_web_vitals(context)
+        if self.interactions:
+            await install_interaction_probe(context)
+        if self.seed:
+            await seed_preferences(context, self.seed)
+        if self.events:
+            self.events.attach_context(context)
+        if self.asset_cache:
+            await install_asset_cache(context)
+        return context
+
+    async def emulate(self, page):
+        # Applies the device's CPU and network throttling; call it for extra pages a TC opens
+        if self.device:
+            cdp = await emulate_device(page, self.device)
+            if cdp:
+                self._device_sessions.append(cdp)
+
+    async def open(self, page):
+        # Navigate to the app and wait until the network request is committed
+        await page.goto(self.url, wait_until="commit", timeout=10000)
+
+        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        try:
+            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+        except async_api.Error:
+            pass
+
+        # Iterate through all iframes and wait for them to load as well
+        for frame in page.frames:
+            try:
+                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
+            except async_api.Error:
+                pass
+
+        # Canvas-rendered widgets are only queryable through the semantics tree
+        if self.semantics:
+            self.semantics_enabled = await enable_flutter_semantics(page)
+
+    async def wait(self, seconds):
+        # Use instead of asyncio.sleep() when waiting on the app's own timers
+        await wait(self.page, seconds, self.virtual_clock)
+
+    async def advance(self, seconds, step=None):
+        # Fast-forwards app time; a no-op returning False without the virtual clock
+        if not self.virtual_clock:
+            return False
+        await advance(self.page, seconds, step)
+        return True
+
+    async def measure(self):
+        # Per-engine load, input latency and memory, compared by benchmarks/engine_matrix.py
+        return {
+            "engine": self.engine,
+            "launch_profile": self.profile_name,
+            "device": self.device_name,
+            "first_frame_ms": await first_frame_ms(self.page),
+            "input_latency_ms": await measure_input_latency(self.page) if self.input_latency else None,
+            "rss_mb": round(browser_rss_mb(), 1),
+        }
+
+    def profile(self, phase):
+        # `async with session.profile("clone"):` writes <TC>.clone.cpuprofile when profiling is on
+        if not self.cpu_profile:
+            return contextlib.nullcontext()
+        profiler = CpuProfiler(self.page)
+        self._phase_profilers.append(profiler)
+        return profiler.phase(phase)
+
+    async def _record_web_vitals(self):
+        # One entry per open page of the session's context, main page first
+        pages = [self.page] + [p for p in self.context.pages if p is not self.page and not p.is_closed()]
+        vitals = [v for v in [await collect_web_vitals(p) for p in pages] if v]
+        for v in vitals:
+            print(f"Web vitals ({v['url']}): {format_web_vitals(v)}")
+        record("web_vitals", vitals)
+
+    async def _save_trace_before_timeout(self):
+        await asyncio.sleep(max(1, TEST_TIMEOUT - _TIMEOUT_MARGIN))
+        print("Test is about to time out; saving trace")
+        record("traces", await self.tracer.save("timeout"))
+        if self.events:
+            record("browser_events", self.events.summary())
+        if self.asset_cache:
+            record("asset_cache", ASSET_CACHE.stats())
+        flush_report()
+
+    async def close(self):
+        # Called from the TC's finally block, so an in-flight exception means failure
+        failed = sys.exc_info()[0] is not None
+        if self._watchdog:
+            self._watchdog.cancel()
+        if self.profiler:
+            try:
+                await self.profiler.stop("test")
+            except async_api.Error as e:
+                print(f"Could not save CPU profile: {e}")
+            profilers = [self.profiler] + self._phase_profilers
+            record("cpu_profiles", [path for profiler in profilers for path in profiler.saved])
+        if self.page and not self.page.is_closed():
+            if self.interactions:
+                interactions = await collect_interactions(self.page)
+                table = interaction_table(interactions)
+                if table:
+                    print(f"\nInteraction latency:\n{format_interaction_table(table)}")
+                record("interactions", table)
+                # Gives the regression gate samples from every TC, not only the timed ones
+                for name, latencies in interaction_samples(interactions).items():
+                    record_samples(f"interaction.{name}", latencies)
+            # Before measure(), whose probe clicks would count as interactions
+            if self.web_vitals:
+                await self._record_web_vitals()
+            record("performance", await self.measure())
+        if self.tracer:
+            try:
+                if failed:
+                    record("traces", await self.tracer.save())
+                    print(f"Trace saved: {', '.join(self.tracer.saved)}")
+                else:
+                    if self.tracer.saved:
+                        # The watchdog saved a trace near the timeout, but the test passed in time
+                        for path in self.tracer.saved:
+                            try:
+                                os.remove(path)
+                            except OSError:
+                                pass
+                        record("traces", [])
+                        print("Test passed after the timeout watchdog fired; dropped its trace")
+                    await self.tracer.discard()
+            except async_api.Error as e:
+                print(f"Could not save trace: {e}")
+            await self.tracer.close()
+        if self.events:
+            record("browser_events", self.events.summary())
+        if self.asset_cache:
+            record("asset_cache", ASSET_CACHE.stats())
+        flush_report()
+
+        if self.context:
+            await self.context.close()
+        if self.browser:
+            await self.browser.close()
+        if self.pw:
+            await self.pw.stop()
@@ -0,0 +1,69 @@
+import bisect
+import json
+
+# Minimal Source Map v3 reader for symbolizing main.dart.js positions back to
+# Dart. `flutter build web --source-maps` writes build/web/main.dart.js.map.
+
+_BASE64 = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")}
+
+
+def _decode_vlq(segment):
+    values = []
+    value = shift = 0
+    for char in segment:
+        digit = _BASE64[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+        else:
+            values.append(-(value >> 1) if value & 1 else value >> 1)
+            value = shift = 0
+    return values
+
+
+class SourceMap:
+
+    def __init__(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.sources = data.get("sources", [])
+        self.names = data.get("names", [])
+        # Per generated line: sorted columns and parallel (source, line, column, name) tuples
+        self._columns = []
+        self._targets = []
+        source = src_line = src_col = name = 0
+        for line in data.get("mappings", "").split(";"):
+            columns = []
+            targets = []
+            col = 0
+            for segment in line.split(","):
+                if not segment:
+                    continue
+                fields = _decode_vlq(segment)
+                col += fields[0]
+                if len(fields) >= 4:
+                    source += fields[1]
+                    src_line += fields[2]
+                    src_col += fields[3]
+                    target_name = None
+                    if len(fields) >= 5:
+                        name += fields[4]
+                        target_name = name
+                    columns.append(col)
+                    targets.append((source, src_line, src_col, target_name))
+            self._columns.append(columns)
+            self._targets.append(targets)
+
+    def lookup(self, line, column):
+        # 0-based generated position -> (source path, 1-based line, name or None), or None
+        if line < 0 or line >= len(self._columns):
+            return None
+        index = bisect.bisect_right(self._columns[line], column) - 1
+        if index < 0:
+            return None
+        source, src_line, _, name = self._targets[line][index]
+        return (
+            self.sources[source] if source < len(self.sources) else None,
+            src_line + 1,
+            self.names[name] if name is not None and name < len(self.names) else None,
+        )
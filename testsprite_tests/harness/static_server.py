@@ -0,0 +1,365 @@
+import argparse
+import asyncio
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+from email.utils import formatdate
+from urllib.parse import unquote
+from .asset_cache import content_type_for
+from .seed import CATALOG_BUILD_ARG
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Harness-managed static server for the Flutter web build (build/web).
+#
+# Every file is indexed once at startup: strong ETag from the content hash, and
+# brotli/gzip variants for compressible types written to a content-addressed
+# cache directory, so a second server (or the next run) reuses them. Responses
+# are sent with loop.sendfile(), which maps to os.sendfile() on Linux, over
+# persistent HTTP/1.1 connections. Nothing is read into Python per request.
+# A single byte range ("Range: bytes=a-b", honouring If-Range) is served from the
+# uncompressed file; multi-range requests get the whole file. Empty files are
+# served with an empty body, and any range on them is unsatisfiable (416).
+#
+#     cd testsprite_tests
+#     python -m harness.static_server --root ../build/web --port 5174
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_ROOT = os.path.join(os.path.dirname(TESTS_DIR), "build", "web")
+DEFAULT_CACHE_DIR = os.path.join(TESTS_DIR, ".static_cache")
+
+_COMPRESSIBLE = (".js", ".mjs", ".wasm", ".json", ".html", ".css", ".svg", ".ttf", ".otf", ".symbols", ".frag", ".txt", ".map")
+_MIN_COMPRESS_BYTES = 1024
+_IDLE_TIMEOUT = 30
+
+# skwasm's multi-threaded renderer needs SharedArrayBuffer, i.e. a cross-origin isolated page
+CROSS_ORIGIN_ISOLATION = {
+    "Cross-Origin-Opener-Policy": "same-origin",
+    "Cross-Origin-Embedder-Policy": "require-corp",
+}
+
+_REASONS = {200: "OK", 206: "Partial Content", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+            405: "Method Not Allowed", 416: "Range Not Satisfiable"}
+
+
+class _Variant:
+    __slots__ = ("path", "size", "etag")
+
+    def __init__(self, path, size, etag):
+        self.path = path
+        self.size = size
+        self.etag = etag
+
+
+class _Entry:
+    __slots__ = ("content_type", "cache_control", "variants")
+
+    def __init__(self, content_type, cache_control, variants):
+        self.content_type = content_type
+        self.cache_control = cache_control
+        # encoding ("identity", "br", "gzip") -> _Variant
+        self.variants = variants
+
+
+def _sha1_file(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _precompress(path, digest, cache_dir):
+    variants = {}
+    data = None
+    encoders = [("gzip", lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.insert(0, ("br", lambda raw: brotli.compress(raw, quality=11)))
+    for encoding, encode in encoders:
+        target = os.path.join(cache_dir, f"{digest}.{encoding}")
+        if not os.path.exists(target):
+            if data is None:
+                with open(path, "rb") as f:
+                    data = f.read()
+            compressed = encode(data)
+            if len(compressed) >= len(data):
+                continue
+            tmp = target + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp, target)
+        variants[encoding] = _Variant(target, os.path.getsize(target), f'"{digest}-{encoding}"')
+    return variants
+
+
+def build_index(root, cache_dir=DEFAULT_CACHE_DIR):
+    # URL path -> _Entry for every file below root
+    os.makedirs(cache_dir, exist_ok=True)
+    index = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            url_path = "/" + os.path.relpath(path, root).replace(os.sep, "/")
+            size = os.path.getsize(path)
+            digest = _sha1_file(path)
+            variants = {"identity": _Variant(path, size, f'"{digest}"')}
+            ext = os.path.splitext(filename)[1].lower()
+            if ext in _COMPRESSIBLE and size >= _MIN_COMPRESS_BYTES:
+                variants.update(_precompress(path, digest, cache_dir))
+            content_type = content_type_for(filename, fallback=mimetypes.guess_type(filename)[0] or "application/octet-stream")
+            if content_type.startswith("text/") and "charset" not in content_type:
+                content_type += "; charset=utf-8"
+            # Flutter build output is not content-hashed, so clients revalidate by ETag
+            index[url_path] = _Entry(content_type, "no-cache", variants)
+    if "/index.html" in index:
+        index["/"] = index["/index.html"]
+    return index
+
+
+def _accepted_encodings(header):
+    accepted = set()
+    for part in header.split(","):
+        token, _, params = part.partition(";")
+        quality = 1.0
+        name, _, value = params.partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                pass
+        if quality > 0:
+            accepted.add(token.strip().lower())
+    return accepted
+
+
+def _byte_range(header, size):
+    # (start, end) inclusive for a single "bytes=" range, None to send the whole
+    # file, or False when the range cannot be satisfied
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            start, end = max(0, size - int(last)), size - 1
+    except ValueError:
+        return None
+    if start > end and first and last:
+        return None
+    if start >= size or start > end:
+        return False
+    return start, min(end, size - 1)
+
+
+class StaticServer:
+
+    def __init__(self, root=DEFAULT_ROOT, host="127.0.0.1", port=5174, cache_dir=DEFAULT_CACHE_DIR, headers=None):
+        self.root = os.path.abspath(root)
+        # Extra response headers, e.g. CROSS_ORIGIN_ISOLATION for skwasm builds
+        self.extra_headers = "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+        self.host = host
+        self.port = port
+        self.cache_dir = cache_dir
+        self.index = None
+        self.requests = 0
+        self.bytes_sent = 0
+        self._server = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        if not os.path.isfile(os.path.join(self.root, "index.html")):
+            raise FileNotFoundError(f"No Flutter web build at {self.root} "
+                                    f"(run `flutter build web {CATALOG_BUILD_ARG}`)")
+        # Hashing and compression are CPU-bound; keep the loop responsive meanwhile
+        self.index = await asyncio.get_running_loop().run_in_executor(None, build_index, self.root, self.cache_dir)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port, backlog=1024)
+        if self.port == 0:
+            self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def _lookup(self, path):
+        entry = self.index.get(path)
+        if entry is None and "." not in path.rsplit("/", 1)[-1]:
+            # Client-side routes fall back to the app shell
+            entry = self.index.get("/index.html")
+        return entry
+
+    async def _handle_connection(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), _IDLE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._send_status(writer, 400, keep_alive=False)
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+
+                # Request bodies are not expected; drain them to keep the stream in sync
+                try:
+                    length = int(headers.get("content-length", "0") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._send_status(writer, 400, keep_alive=False)
+                    return
+                if length:
+                    await reader.readexactly(length)
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+
+                if method not in ("GET", "HEAD"):
+                    await self._send_status(writer, 405, keep_alive, extra="Allow: GET, HEAD\r\n")
+                elif not await self._send_file(loop, writer, method, unquote(target.split("?", 1)[0]), headers, keep_alive):
+                    await self._send_status(writer, 404, keep_alive)
+                self.requests += 1
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _send_status(self, writer, status, keep_alive, extra=""):
+        writer.write((
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Length: 0\r\n{extra}"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode("latin-1"))
+        await writer.drain()
+
+    async def _send_file(self, loop, writer, method, path, headers, keep_alive):
+        entry = self._lookup(path)
+        if entry is None:
+            return False
+
+        # Ranges refer to the uncompressed file, so a ranged request is served without encoding
+        identity = entry.variants["identity"]
+        byte_range = None
+        if "range" in headers and headers.get("if-range", identity.etag) == identity.etag:
+            byte_range = _byte_range(headers["range"], identity.size)
+
+        accepted = _accepted_encodings(headers.get("accept-encoding", ""))
+        encoding = "identity"
+        for candidate in ("br", "gzip"):
+            if byte_range is None and candidate in entry.variants and candidate in accepted:
+                encoding = candidate
+                break
+        variant = entry.variants[encoding]
+
+        common = (
+            f"ETag: {variant.etag}\r\n"
+            f"Cache-Control: {entry.cache_control}\r\n"
+            f"Vary: Accept-Encoding\r\n"
+            f"Accept-Ranges: bytes\r\n"
+            f"Date: {formatdate(usegmt=True)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            f"{self.extra_headers}"
+        )
+        if variant.etag in headers.get("if-none-match", ""):
+            writer.write(f"HTTP/1.1 304 Not Modified\r\n{common}\r\n".encode("latin-1"))
+            await writer.drain()
+            return True
+
+        if byte_range is False:
+            await self._send_status(writer, 416, keep_alive, extra=f"Content-Range: bytes */{variant.size}\r\n")
+            return True
+        offset, count = 0, variant.size
+        status = "200 OK"
+        extra = ""
+        if byte_range:
+            offset, count = byte_range[0], byte_range[1] - byte_range[0] + 1
+            status = "206 Partial Content"
+            extra = f"Content-Range: bytes {byte_range[0]}-{byte_range[1]}/{variant.size}\r\n"
+
+        writer.write((
+            f"HTTP/1.1 {status}\r\n{common}{extra}"
+            f"Content-Type: {entry.content_type}\r\n"
+            f"Content-Length: {count}\r\n"
+            + (f"Content-Encoding: {encoding}\r\n" if encoding != "identity" else "")
+            + "\r\n"
+        ).encode("latin-1"))
+        if method == "HEAD":
+            await writer.drain()
+            return True
+
+        await writer.drain()
+        if count:
+            # sendfile() rejects a zero count; an empty file is just its headers
+            with open(variant.path, "rb") as f:
+                await loop.sendfile(writer.transport, f, offset, count)
+        self.bytes_sent += count
+        return True
+
+
+class StaticServerThread:
+    # Runs a StaticServer on its own event loop so synchronous callers
+    # (run_all_tests.py) can serve the build while spawning TC processes.
+
+    def __init__(self, **kwargs):
+        self.server = StaticServer(**kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        return self.server.url
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.server.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+async def _serve_forever(args):
+    server = StaticServer(root=args.root, host=args.host, port=args.port)
+    await server.start()
+    compressed = sum(len(entry.variants) - 1 for entry in set(server.index.values()))
+    print(f"Serving {server.root} at {server.url} ({len(server.index)} paths, {compressed} precompressed variants"
+          f"{'' if brotli else ', brotli unavailable'})")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the Flutter web build for the TC suite")
+    parser.add_argument("--root", default=DEFAULT_ROOT)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5174)
+    try:
+        asyncio.run(_serve_forever(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
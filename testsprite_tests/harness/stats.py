@@ -0,0 +1,81 @@
+import math
+import random
+import statistics
+
+# Summary statistics for benchmark samples. Only the standard library is used:
+# percentiles interpolate linearly, confidence intervals come from a seeded
+# bootstrap so repeated reports of the same samples agree.
+
+
+def percentile(values, q):
+    # q in [0, 100]; linear interpolation between closest ranks
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def mad(values):
+    # Median absolute deviation
+    if not values:
+        return None
+    center = statistics.median(values)
+    return statistics.median(abs(v - center) for v in values)
+
+
+def bootstrap_ci(values, estimator=statistics.median, confidence=0.95, resamples=2000, seed=0):
+    # (low, high) bootstrap percentile interval of estimator(values)
+    if len(values) < 2:
+        return (None, None)
+    rng = random.Random(seed)
+    estimates = sorted(estimator(rng.choices(values, k=len(values))) for _ in range(resamples))
+    tail = (1 - confidence) / 2 * 100
+    return (percentile(estimates, tail), percentile(estimates, 100 - tail))
+
+
+def summarize(values):
+    values = [v for v in values if v is not None]
+    if not values:
+        return {"n": 0}
+    low, high = bootstrap_ci(values)
+    return {
+        "n": len(values),
+        "median": statistics.median(values),
+        "p90": percentile(values, 90),
+        "mad": mad(values),
+        "min": min(values),
+        "max": max(values),
+        "ci_low": low,
+        "ci_high": high,
+    }
+
+
+def linear_fit(xs, ys):
+    # Least-squares (slope, intercept, r2) of ys against xs
+    n = len(xs)
+    if n < 2:
+        return (None, None, None)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        return (None, None, None)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+    ss_total = sum((y - mean_y) ** 2 for y in ys)
+    ss_residual = sum((y - intercept - slope * x) ** 2 for x, y in zip(xs, ys))
+    r2 = 1.0 if ss_total == 0 else 1 - ss_residual / ss_total
+    return (slope, intercept, r2)
+
+
+def scaling_exponent(sizes, values):
+    # Slope of log(value) against log(size): ~0 flat, ~1 linear, > 1 super-linear
+    pairs = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if s and v and s > 0 and v > 0]
+    if len(pairs) < 2:
+        return None
+    slope, _, _ = linear_fit([x for x, _ in pairs], [y for _, y in pairs])
+    return slope
@@ -0,0 +1,42 @@
+import math
+from array import array
+from .stats import linear_fit
+
+# Compact time series for long runs: one array('d') per field, timestamps in
+# seconds. Missing values are stored as NaN, so hours of samples stay a few
+# bytes per point and no per-sample dicts are kept.
+
+
+class TimeSeries:
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        self.times = array("d")
+        self.columns = {field: array("d") for field in self.fields}
+
+    def __len__(self):
+        return len(self.times)
+
+    def append(self, t, values):
+        self.times.append(t)
+        for field in self.fields:
+            value = values.get(field)
+            self.columns[field].append(math.nan if value is None else value)
+
+    def points(self, field, since=0):
+        # (t, value) pairs at or after `since`, skipping missing values
+        return [(t, v) for t, v in zip(self.times, self.columns[field]) if t >= since and not math.isnan(v)]
+
+    def fit(self, field, since=0):
+        # Least-squares growth of a field: (slope per hour, r2), or (None, None) without enough points
+        points = self.points(field, since)
+        slope, _, r2 = linear_fit([t / 3600 for t, _ in points], [v for _, v in points])
+        return slope, r2
+
+    def to_dict(self):
+        # JSON-friendly columns; NaN becomes None
+        def column(values):
+            return [None if math.isnan(v) else round(v, 3) for v in values]
+
+        return {"t": [round(t, 2) for t in self.times],
+                **{field: column(values) for field, values in self.columns.items()}}
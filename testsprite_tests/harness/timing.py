@@ -0,0 +1,145 @@
+import asyncio
+import os
+import statistics
+from playwright import async_api
+from .stats import percentile
+
+# Records when the Flutter engine renders its first frame. flutter.js dispatches
+# "flutter-first-frame" on window; performance.now() is relative to navigation start.
+FIRST_FRAME_SCRIPT = """
+window.addEventListener('flutter-first-frame', () => {
+  if (window.__fltFirstFrameMs === undefined) window.__fltFirstFrameMs = performance.now();
+});
+"""
+
+
+async def install_first_frame_probe(context):
+    # Must run before navigation so the listener exists when the event fires
+    await context.add_init_script(FIRST_FRAME_SCRIPT)
+
+
+async def wait_for_first_frame(page, timeout=15000):
+    # Milliseconds from navigation start to the first Flutter frame, or None on timeout
+    try:
+        handle = await page.wait_for_function(
+            "() => window.__fltFirstFrameMs", timeout=timeout, polling=50
+        )
+        return await handle.json_value()
+    except async_api.Error:
+        return None
+
+
+async def first_frame_ms(page):
+    # Non-blocking read of the probe; None if the probe is missing or the frame never came
+    try:
+        return await page.evaluate("() => window.__fltFirstFrameMs ?? null")
+    except async_api.Error:
+        return None
+
+
+# Input-to-frame sampling clicks the page, so sessions only do it when asked
+# (engine_matrix.py turns it on for its runs)
+INPUT_LATENCY_ENABLED = os.environ.get("TESTSPRITE_INPUT_LATENCY", "0") == "1"
+
+# Arms a promise resolving with the delay between the next pointerdown's timestamp
+# and the animation frame that follows it. The click lands on a transparent probe
+# element above the Flutter view that swallows its events, so no widget sees it.
+INPUT_LATENCY_SCRIPT = """
+() => {
+  let probe = document.getElementById('__flt-input-probe');
+  if (!probe) {
+    probe = document.createElement('div');
+    probe.id = '__flt-input-probe';
+    probe.style.cssText = 'position:fixed;left:0;top:0;width:8px;height:8px;z-index:2147483647;background:transparent';
+    for (const type of ['pointerdown', 'pointerup', 'mousedown', 'mouseup', 'click']) {
+      probe.addEventListener(type, (event) => event.stopPropagation());
+    }
+    document.body.appendChild(probe);
+  }
+  window.__fltInputLatency = new Promise((resolve) => {
+    window.addEventListener('pointerdown', (event) => {
+      requestAnimationFrame(() => resolve(performance.now() - event.timeStamp));
+    }, { once: true, capture: true });
+  });
+}
+"""
+
+
+async def measure_input_latency(page, samples=5):
+    # Median input-to-next-frame delay of clicks on the inert probe element, in ms
+    delays = []
+    try:
+        for _ in range(samples):
+            await page.evaluate(INPUT_LATENCY_SCRIPT)
+            await page.mouse.click(4, 4)
+            delays.append(await asyncio.wait_for(page.evaluate("() => window.__fltInputLatency"), 2))
+    except (async_api.Error, asyncio.TimeoutError):
+        return None
+    finally:
+        try:
+            await page.evaluate("() => document.getElementById('__flt-input-probe')?.remove()")
+        except async_api.Error:
+            pass
+    return statistics.median(delays)
+
+
+# 60 Hz frame budget in ms
+FRAME_BUDGET_MS = 1000 / 60
+
+_FRAMES_START = """
+() => {
+  const frames = window.__fltFrames = [];
+  window.__fltRecording = true;
+  let last = null;
+  const tick = (now) => {
+    if (last !== null) frames.push(now - last);
+    last = now;
+    if (window.__fltRecording) requestAnimationFrame(tick);
+  };
+  requestAnimationFrame(tick);
+}
+"""
+
+_FRAMES_STOP = "() => { window.__fltRecording = false; return window.__fltFrames || []; }"
+
+
+def frame_stats(deltas, budget=FRAME_BUDGET_MS):
+    # Percentiles of frame intervals plus frames missed against the budget
+    if not deltas:
+        return {"frames": 0}
+    return {
+        "frames": len(deltas),
+        "p50_ms": percentile(deltas, 50),
+        "p95_ms": percentile(deltas, 95),
+        "p99_ms": percentile(deltas, 99),
+        "longest_ms": max(deltas),
+        "dropped": sum(max(0, round(d / budget) - 1) for d in deltas),
+    }
+
+
+class FrameRecorder:
+    # requestAnimationFrame intervals while a scripted interaction runs:
+    #
+    #     async with FrameRecorder(page) as frames:
+    #         await page.mouse.wheel(0, 3000)
+    #     frames.stats["p95_ms"]
+
+    def __init__(self, page):
+        self.page = page
+        self.deltas = []
+        self.stats = None
+
+    async def start(self):
+        await self.page.evaluate(_FRAMES_START)
+
+    async def stop(self):
+        self.deltas = await self.page.evaluate(_FRAMES_STOP)
+        self.stats = frame_stats(self.deltas)
+        return self.stats
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import shutil
+import tempfile
+from collections import deque
+from playwright import async_api
+from .artifacts import artifact_path
+
+# Failure-only Playwright tracing.
+#
+# Tracing runs for the whole test, but is cut into chunks every chunk_seconds
+# with tracing.stop_chunk()/start_chunk(). Only the chunks covering the last
+# window_seconds are kept, in tmpfs when /dev/shm is available, and older ones
+# are deleted as new ones arrive. save() copies the kept chunks to artifacts/
+# when a test fails or times out; a passing test just discards them.
+
+TRACE_ENABLED = os.environ.get("TESTSPRITE_TRACE", "1") != "0"
+WINDOW_SECONDS = float(os.environ.get("TESTSPRITE_TRACE_WINDOW", "30"))
+CHUNK_SECONDS = float(os.environ.get("TESTSPRITE_TRACE_CHUNK", "5"))
+
+
+def _scratch_dir():
+    base = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+    return tempfile.mkdtemp(prefix="testsprite-trace-", dir=base)
+
+
+class RollingTracer:
+
+    def __init__(self, context, window_seconds=WINDOW_SECONDS, chunk_seconds=CHUNK_SECONDS):
+        self.context = context
+        self.chunk_seconds = chunk_seconds
+        # One extra chunk so the kept span never drops below the window
+        self.max_chunks = max(1, int(window_seconds // chunk_seconds) + 1)
+        self.chunks = deque()
+        self.saved = None
+        self._dir = None
+        self._counter = 0
+        self._lock = asyncio.Lock()
+        self._rotation = None
+        self._running = False
+
+    async def start(self):
+        self._dir = _scratch_dir()
+        await self.context.tracing.start(screenshots=True, snapshots=True)
+        await self.context.tracing.start_chunk()
+        self._running = True
+        self._rotation = asyncio.create_task(self._rotate())
+
+    async def _rotate(self):
+        while True:
+            await asyncio.sleep(self.chunk_seconds)
+            async with self._lock:
+                if not self._running:
+                    return
+                await self._cut(restart=True)
+
+    async def _cut(self, restart):
+        self._counter += 1
+        path = os.path.join(self._dir, f"chunk-{self._counter:04d}.zip")
+        await self.context.tracing.stop_chunk(path=path)
+        self.chunks.append(path)
+        while len(self.chunks) > self.max_chunks:
+            os.remove(self.chunks.popleft())
+        if restart:
+            await self.context.tracing.start_chunk()
+
+    async def save(self, reason="failed"):
+        # Writes the kept chunks (oldest first) to artifacts/ and returns their paths
+        async with self._lock:
+            if self._running:
+                self._running = False
+                await self._cut(restart=False)
+                await self.context.tracing.stop()
+            if self.saved is None:
+                self.saved = []
+                for index, chunk in enumerate(self.chunks, 1):
+                    target = artifact_path(f".{reason}.trace-{index}.zip")
+                    shutil.copyfile(chunk, target)
+                    self.saved.append(target)
+        return self.saved
+
+    async def discard(self):
+        async with self._lock:
+            if self._running:
+                self._running = False
+                try:
+                    await self.context.tracing.stop_chunk()
+                    await self.context.tracing.stop()
+                except async_api.Error:
+                    pass
+        await self.close()
+
+    async def close(self):
+        if self._rotation:
+            self._rotation.cancel()
+            self._rotation = None
+        if self._dir:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
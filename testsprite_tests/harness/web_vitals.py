@@ -0,0 +1,114 @@
+from playwright import async_api
+
+# Core Web Vitals for every page a test opens: LCP, CLS, INP and TBT (plus FCP).
+#
+# The init script registers buffered PerformanceObservers before the app boots;
+# collect_web_vitals() reads what they saw and derives the summary values the way
+# the web-vitals library does:
+#
+#   LCP  startTime of the last largest-contentful-paint entry
+#   CLS  largest session window of layout shifts without recent input
+#        (shifts < 1 s apart, window < 5 s)
+#   INP  worst interaction duration, skipping one outlier per 50 interactions
+#   TBT  sum of long-task time beyond 50 ms, for tasks after FCP
+#
+# Flutter paints into a canvas, which is not an LCP candidate, so LCP is often
+# missing on CanvasKit builds; FCP still reports the first canvas paint.
+# Firefox and WebKit support only some entry types; the rest stay None.
+
+BLOCKING_THRESHOLD_MS = 50
+
+# Long tasks kept in the page; older ones are folded into running totals
+MAX_LONG_TASKS = 2000
+
+WEB_VITALS_SCRIPT = """
+(() => {
+  const vitals = window.__fltVitals = {
+    lcp: null, fcp: null, cls: 0, longTasks: [], droppedTasks: 0, droppedBlocking: 0, interactions: {},
+  };
+  const observe = (type, callback, options = {}) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(callback))
+        .observe(Object.assign({ type, buffered: true }, options));
+    } catch (e) {}
+  };
+  observe('largest-contentful-paint', (entry) => { vitals.lcp = entry.startTime; });
+  observe('paint', (entry) => {
+    if (entry.name === 'first-contentful-paint') vitals.fcp = entry.startTime;
+  });
+  let sessionValue = 0;
+  let sessionFirst = null;
+  let sessionLast = null;
+  observe('layout-shift', (entry) => {
+    if (entry.hadRecentInput) return;
+    if (sessionValue && entry.startTime - sessionLast < 1000 && entry.startTime - sessionFirst < 5000) {
+      sessionValue += entry.value;
+    } else {
+      sessionValue = entry.value;
+      sessionFirst = entry.startTime;
+    }
+    sessionLast = entry.startTime;
+    vitals.cls = Math.max(vitals.cls, sessionValue);
+  });
+  observe('longtask', (entry) => {
+    vitals.longTasks.push([entry.startTime, entry.duration]);
+    if (vitals.longTasks.length > %(max)d) {
+      // Evicted tasks still count toward TBT; FCP is long known by then
+      const [start, duration] = vitals.longTasks.shift();
+      vitals.droppedTasks += 1;
+      if (vitals.fcp === null || start >= vitals.fcp) vitals.droppedBlocking += Math.max(0, duration - %(threshold)d);
+    }
+  });
+  observe('event', (entry) => {
+    if (!entry.interactionId) return;
+    const id = entry.interactionId;
+    vitals.interactions[id] = Math.max(vitals.interactions[id] || 0, entry.duration);
+  }, { durationThreshold: 16 });
+})();
+""" % {"max": MAX_LONG_TASKS, "threshold": BLOCKING_THRESHOLD_MS}
+
+
+async def install_web_vitals(context):
+    await context.add_init_script(WEB_VITALS_SCRIPT)
+
+
+def inp(durations):
+    # High percentile of interaction durations: the worst, ignoring one per 50 interactions
+    if not durations:
+        return None
+    ranked = sorted(durations, reverse=True)
+    return ranked[min(len(ranked) - 1, len(ranked) // 50)]
+
+
+def total_blocking_time(long_tasks, fcp=None):
+    start = fcp or 0
+    return sum(max(0, duration - BLOCKING_THRESHOLD_MS) for task_start, duration in long_tasks if task_start >= start)
+
+
+async def collect_web_vitals(page):
+    # None when the page is gone or the script never ran
+    try:
+        raw = await page.evaluate("() => window.__fltVitals || null")
+    except async_api.Error:
+        return None
+    if raw is None:
+        return None
+    durations = list(raw["interactions"].values())
+    return {
+        "url": page.url,
+        "fcp_ms": raw["fcp"],
+        "lcp_ms": raw["lcp"],
+        "cls": round(raw["cls"], 4),
+        "inp_ms": inp(durations),
+        "interactions": len(durations),
+        "tbt_ms": total_blocking_time(raw["longTasks"], raw["fcp"]) + raw.get("droppedBlocking", 0),
+        "long_tasks": len(raw["longTasks"]) + raw.get("droppedTasks", 0),
+    }
+
+
+def format_web_vitals(vitals):
+    def fmt(value, unit="ms"):
+        return "-" if value is None else f"{value:.0f} {unit}"
+
+    return (f"FCP {fmt(vitals['fcp_ms'])}, LCP {fmt(vitals['lcp_ms'])}, CLS {vitals['cls']:.3f}, "
+            f"INP {fmt(vitals['inp_ms'])} ({vitals['interactions']} interactions), TBT {fmt(vitals['tbt_ms'])}")
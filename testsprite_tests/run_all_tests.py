@@ -1,11 +1,16 @@
+import glob
 import os
 import subprocess
 import json
 import time
 from datetime import datetime
+from harness.static_server import DEFAULT_ROOT, StaticServerThread
+from harness.artifacts import ARTIFACT_DIR, load_report
+from harness.history import append_history
+from harness.web_vitals import format_web_vitals
 
 # Test directory
-test_dir = "G:\\multispace_cloner1\\multispace_cloner\\testsprite_tests"
+test_dir = os.path.dirname(os.path.abspath(__file__))
 
 # Get all test files
 test_files = [f for f in os.listdir(test_dir) if f.startswith('TC') and f.endswith('.py')]
@@ -19,6 +24,19 @@ print("\n" + "="*80)
 print("STARTING TESTSPRITE MCP BACKEND TEST EXECUTION")
 print("="*80)
 
+# Per-test timeout, shared with the harness so it can save a trace before the kill
+test_timeout = 60
+test_env = dict(os.environ)
+test_env["TESTSPRITE_TEST_TIMEOUT"] = str(test_timeout)
+
+# Serve build/web ourselves unless the suite was pointed at another server; an
+# ephemeral port avoids clashing with a dev server already on the default one
+static_server = None
+if "TESTSPRITE_APP_URL" not in test_env and os.path.isfile(os.path.join(DEFAULT_ROOT, "index.html")):
+    static_server = StaticServerThread(root=DEFAULT_ROOT, port=0)
+    test_env["TESTSPRITE_APP_URL"] = static_server.start()
+    print(f"Serving {DEFAULT_ROOT} at {test_env['TESTSPRITE_APP_URL']}")
+
 # Test results storage
 test_results = {
     "execution_time": datetime.now().isoformat(),
@@ -28,91 +46,108 @@ test_results = {
     "results": []
 }
 
-# Execute each test
-for i, test_file in enumerate(test_files, 1):
-    print(f"\n[{i}/{len(test_files)}] Executing: {test_file}")
-    print("-" * 60)
+try:
+    # Execute each test
+    for i, test_file in enumerate(test_files, 1):
+        print(f"\n[{i}/{len(test_files)}] Executing: {test_file}")
+        print("-" * 60)
+    
+        # Drop artifacts left by a previous run of this test
+        test_name = os.path.splitext(test_file)[0]
+        for stale in glob.glob(os.path.join(ARTIFACT_DIR, glob.escape(test_name) + ".*")):
+            os.remove(stale)
     
-    start_time = time.time()
+        start_time = time.time()
     
-    try:
-        # Run the test
-        result = subprocess.run(
-            ["python", test_file],
-            cwd=test_dir,
-            capture_output=True,
-            text=True,
-            timeout=60  # 60 second timeout per test
-        )
+        try:
+            # Run the test
+            result = subprocess.run(
+                ["python", test_file],
+                cwd=test_dir,
+                env=test_env,
+                capture_output=True,
+                text=True,
+                timeout=test_timeout
+            )
         
-        execution_time = time.time() - start_time
+            execution_time = time.time() - start_time
         
-        # Analyze result
-        if result.returncode == 0:
-            status = "PASSED"
-            test_results["passed"] += 1
-            print(f"✅ PASSED ({execution_time:.2f}s)")
-        else:
-            status = "FAILED"
-            test_results["failed"] += 1
-            print(f"❌ FAILED ({execution_time:.2f}s)")
-            
-            # Extract error info
-            if "AssertionError" in result.stderr:
-                error_type = "Assertion Failure"
-            elif "TimeoutError" in result.stderr:
-                error_type = "Timeout Error"
-            elif "NameError" in result.stderr:
-                error_type = "Name Error"
+            # Analyze result
+            if result.returncode == 0:
+                status = "PASSED"
+                test_results["passed"] += 1
+                print(f"✅ PASSED ({execution_time:.2f}s)")
             else:
-                error_type = "Runtime Error"
+                status = "FAILED"
+                test_results["failed"] += 1
+                print(f"❌ FAILED ({execution_time:.2f}s)")
+            
+                # Extract error info
+                if "AssertionError" in result.stderr:
+                    error_type = "Assertion Failure"
+                elif "TimeoutError" in result.stderr:
+                    error_type = "Timeout Error"
+                elif "NameError" in result.stderr:
+                    error_type = "Name Error"
+                else:
+                    error_type = "Runtime Error"
                 
-            print(f"   Error Type: {error_type}")
+                print(f"   Error Type: {error_type}")
             
-            # Show last few lines of error
-            error_lines = result.stderr.strip().split('\n')
-            if error_lines:
-                print(f"   Error: {error_lines[-1]}")
+                # Show last few lines of error
+                error_lines = result.stderr.strip().split('\n')
+                if error_lines:
+                    print(f"   Error: {error_lines[-1]}")
         
-        # Store result
-        test_results["results"].append({
-            "test_file": test_file,
-            "status": status,
-            "execution_time": execution_time,
-            "return_code": result.returncode,
-            "stdout": result.stdout[:500] if result.stdout else "",
-            "stderr": result.stderr[:500] if result.stderr else ""
-        })
+            # Store result
+            test_results["results"].append({
+                "test_file": test_file,
+                "status": status,
+                "execution_time": execution_time,
+                "return_code": result.returncode,
+                "stdout": result.stdout[:500] if result.stdout else "",
+                "stderr": result.stderr[:500] if result.stderr else ""
+            })
         
-    except subprocess.TimeoutExpired:
-        execution_time = time.time() - start_time
-        status = "TIMEOUT"
-        test_results["failed"] += 1
-        print(f"⏰ TIMEOUT ({execution_time:.2f}s)")
+        except subprocess.TimeoutExpired:
+            execution_time = time.time() - start_time
+            status = "TIMEOUT"
+            test_results["failed"] += 1
+            print(f"⏰ TIMEOUT ({execution_time:.2f}s)")
         
-        test_results["results"].append({
-            "test_file": test_file,
-            "status": status,
-            "execution_time": execution_time,
-            "return_code": -1,
-            "stdout": "",
-            "stderr": "Test execution timed out after 60 seconds"
-        })
+            test_results["results"].append({
+                "test_file": test_file,
+                "status": status,
+                "execution_time": execution_time,
+                "return_code": -1,
+                "stdout": "",
+                "stderr": f"Test execution timed out after {test_timeout} seconds"
+            })
         
-    except Exception as e:
-        execution_time = time.time() - start_time
-        status = "ERROR"
-        test_results["failed"] += 1
-        print(f"💥 ERROR ({execution_time:.2f}s): {str(e)}")
+        except Exception as e:
+            execution_time = time.time() - start_time
+            status = "ERROR"
+            test_results["failed"] += 1
+            print(f"💥 ERROR ({execution_time:.2f}s): {str(e)}")
         
-        test_results["results"].append({
-            "test_file": test_file,
-            "status": status,
-            "execution_time": execution_time,
-            "return_code": -2,
-            "stdout": "",
-            "stderr": str(e)
-        })
+            test_results["results"].append({
+                "test_file": test_file,
+                "status": status,
+                "execution_time": execution_time,
+                "return_code": -2,
+                "stdout": "",
+                "stderr": str(e)
+            })
+    
+        # Attach whatever the harness recorded (traces of failed runs, browser events, ...)
+        test_results["results"][-1].update(load_report(test_name))
+        web_vitals = test_results["results"][-1].get("web_vitals")
+        if web_vitals:
+            append_history("web_vitals", {"test": test_name, "status": test_results["results"][-1]["status"],
+                                          "pages": web_vitals})
+finally:
+    if static_server:
+        static_server.stop()
 
 print("\n" + "="*80)
 print("TESTSPRITE MCP BACKEND TEST EXECUTION COMPLETED")
@@ -152,6 +187,23 @@ with open(report_file, 'w', encoding='utf-8') as f:
         f.write(f"- **Return Code:** {result['return_code']}\n")
         if result['stderr']:
             f.write(f"- **Error:** {result['stderr'][:200]}...\n")
+        counters = result.get('browser_events', {}).get('counters')
+        if counters:
+            f.write(f"- **Browser Events:** {', '.join(f'{k}={v}' for k, v in sorted(counters.items()))}\n")
+        asset_cache = result.get('asset_cache')
+        if asset_cache:
+            f.write(f"- **Asset Cache:** {asset_cache['hits']} hits, {asset_cache['misses']} misses, "
+                    f"{asset_cache['bytes_served'] / 1024:.0f} KB served\n")
+        for trace in result.get('traces', []):
+            f.write(f"- **Trace:** `{os.path.relpath(trace, test_dir)}`\n")
+        for profile in result.get('cpu_profiles', []):
+            f.write(f"- **CPU Profile:** `{os.path.relpath(profile, test_dir)}`\n")
+        for vitals in result.get('web_vitals', [])[:1]:
+            f.write(f"- **Web Vitals:** {format_web_vitals(vitals)}\n")
+        slowest = [row for row in result.get('interactions', []) if row.get('max_ms') is not None][:3]
+        if slowest:
+            names = ', '.join(f"{row['label']} {row['max_ms']:.0f}ms" for row in slowest)
+            f.write(f"- **Slowest Interactions:** {names}\n")
         f.write("\n")
 
 print(f"Summary report saved to: {report_file}")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Lets the tests import harness the way the TCs and benchmarks do, from testsprite_tests/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
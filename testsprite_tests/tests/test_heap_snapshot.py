@@ -0,0 +1,49 @@
+import json
+import pytest
+from harness import heap_snapshot
+from harness.heap_snapshot import summarize_heap_snapshot
+
+NODE_TYPES = ["hidden", "array", "string", "object", "code", "closure", "regexp", "number", "native"]
+
+
+def write_snapshot(path):
+    snapshot = {
+        "snapshot": {
+            "meta": {
+                "node_fields": ["type", "name", "id", "self_size", "edge_count"],
+                "node_types": [NODE_TYPES, "string", "number", "number", "number"],
+            },
+            "node_count": 4,
+        },
+        # object Foo 10, object Foo 20, closure "fn" 5, native Bar 7
+        "nodes": [3, 1, 1, 10, 0, 3, 1, 3, 20, 0, 5, 2, 5, 5, 0, 8, 3, 7, 7, 0],
+        "edges": [1, 2, 3, 1, 2, 3],
+        "strings": ["", "Foo", "fn", "Bar"],
+    }
+    path.write_text(json.dumps(snapshot, separators=(",", ":")), encoding="utf-8")
+    return str(path)
+
+
+EXPECTED = {
+    "Foo": {"count": 2, "self_size": 30},
+    "(closure)": {"count": 1, "self_size": 5},
+    "Bar": {"count": 1, "self_size": 7},
+}
+
+
+def test_summarize_groups_like_devtools(tmp_path):
+    assert summarize_heap_snapshot(write_snapshot(tmp_path / "a.heapsnapshot")) == EXPECTED
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 7, 16])
+def test_summarize_across_chunk_boundaries(tmp_path, monkeypatch, chunk):
+    monkeypatch.setattr(heap_snapshot, "_CHUNK_CHARS", chunk)
+    assert summarize_heap_snapshot(write_snapshot(tmp_path / "a.heapsnapshot")) == EXPECTED
+
+
+def test_truncated_snapshot(tmp_path):
+    path = tmp_path / "a.heapsnapshot"
+    text = open(write_snapshot(path), encoding="utf-8").read()
+    path.write_text(text[:text.index('"edges"')], encoding="utf-8")
+    with pytest.raises(ValueError):
+        summarize_heap_snapshot(str(path))
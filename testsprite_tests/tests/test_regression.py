@@ -0,0 +1,44 @@
+import pytest
+from harness.regression import compare, mann_whitney_u
+
+
+def test_mann_whitney_u_known_answer():
+    # Current entirely above baseline: U = n1 * n2, normal approximation with continuity correction
+    u, p = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+    assert u == 25
+    assert p == pytest.approx(0.00609, abs=1e-4)
+
+
+def test_mann_whitney_u_is_one_sided():
+    _, p = mann_whitney_u([6, 7, 8, 9, 10], [1, 2, 3, 4, 5])
+    assert p > 0.99
+
+
+def test_mann_whitney_u_all_tied():
+    assert mann_whitney_u([3, 3, 3], [3, 3, 3]) == (4.5, 1.0)
+
+
+def test_compare_flags_significant_slowdown():
+    result = compare([10, 11, 10, 12, 11, 10], [15, 16, 15, 17, 16, 15])
+    assert result["verdict"] == "regressed"
+    assert result["change"] == pytest.approx(5 / 10.5)
+
+
+def test_compare_ignores_small_effect():
+    baseline = [100, 101, 100, 102, 101, 100]
+    assert compare(baseline, [v + 2 for v in baseline], min_effect=0.05)["verdict"] == "ok"
+
+
+def test_compare_higher_is_better():
+    result = compare([100, 101, 99, 100, 102], [60, 61, 59, 60, 62], lower_is_better=False)
+    assert result["verdict"] == "regressed"
+
+
+def test_compare_bootstrap_method():
+    result = compare([10, 11, 10, 12, 11, 10], [15, 16, 15, 17, 16, 15], method="bootstrap")
+    assert result["ci_low"] > 1
+    assert result["verdict"] == "regressed"
+
+
+def test_compare_needs_enough_samples():
+    assert compare([1, 2, 3, 4], [5, 6, 7, 8, 9])["verdict"] == "insufficient"
@@ -0,0 +1,38 @@
+import json
+import pytest
+from harness.source_map import SourceMap, _decode_vlq
+
+
+@pytest.mark.parametrize("segment, values", [
+    ("AAAA", [0, 0, 0, 0]),
+    ("D", [-1]),
+    ("gB", [16]),
+    ("2H", [123]),
+    ("IACEA", [4, 0, 1, 2, 0]),
+])
+def test_decode_vlq(segment, values):
+    assert _decode_vlq(segment) == values
+
+
+@pytest.fixture
+def source_map(tmp_path):
+    path = tmp_path / "main.dart.js.map"
+    path.write_text(json.dumps({
+        "version": 3,
+        "sources": ["a.dart"],
+        "names": ["foo"],
+        "mappings": "AAAA,EAAC,IACEA;AACA",
+    }), encoding="utf-8")
+    return SourceMap(str(path))
+
+
+def test_lookup(source_map):
+    assert source_map.lookup(0, 0) == ("a.dart", 1, None)
+    assert source_map.lookup(0, 2) == ("a.dart", 1, None)
+    assert source_map.lookup(0, 7) == ("a.dart", 2, "foo")
+    assert source_map.lookup(1, 0) == ("a.dart", 3, None)
+
+
+def test_lookup_outside_mappings(source_map):
+    assert source_map.lookup(5, 0) is None
+    assert source_map.lookup(-1, 0) is None
@@ -0,0 +1,66 @@
+import asyncio
+from harness.static_server import StaticServer
+
+
+def serve(tmp_path, *requests):
+    # Sends raw requests over one connection to a server on tmp_path; (status line, headers, body) for each
+    root = tmp_path / "web"
+    root.mkdir()
+    (root / "index.html").write_text("<html></html>", encoding="utf-8")
+    (root / "empty.txt").write_bytes(b"")
+    (root / "data.bin").write_bytes(bytes(range(100)))
+
+    async def run():
+        server = await StaticServer(root=str(root), port=0, cache_dir=str(tmp_path / "cache")).start()
+        try:
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            responses = []
+            for request in requests:
+                writer.write(request.encode("latin-1"))
+                await writer.drain()
+                head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+                headers = {}
+                for line in head[1:]:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+                responses.append((head[0], headers, body))
+            writer.close()
+            return responses[0] if len(responses) == 1 else responses
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+
+def test_empty_file(tmp_path):
+    # The connection must survive the empty body and serve the next request
+    empty, index = serve(tmp_path, "GET /empty.txt HTTP/1.1\r\nHost: x\r\n\r\n", "GET / HTTP/1.1\r\nHost: x\r\n\r\n")
+    assert empty == ("HTTP/1.1 200 OK", empty[1], b"")
+    assert empty[1]["content-length"] == "0"
+    assert index[0] == "HTTP/1.1 200 OK"
+    assert index[2] == b"<html></html>"
+
+
+def test_range_on_empty_file(tmp_path):
+    status, headers, _ = serve(tmp_path, "GET /empty.txt HTTP/1.1\r\nHost: x\r\nRange: bytes=0-\r\n\r\n")
+    assert status == "HTTP/1.1 416 Range Not Satisfiable"
+    assert headers["content-range"] == "bytes */0"
+
+
+def test_suffix_range_on_empty_file(tmp_path):
+    status, _, _ = serve(tmp_path, "GET /empty.txt HTTP/1.1\r\nHost: x\r\nRange: bytes=-10\r\n\r\n")
+    assert status == "HTTP/1.1 416 Range Not Satisfiable"
+
+
+def test_byte_range(tmp_path):
+    status, headers, body = serve(tmp_path, "GET /data.bin HTTP/1.1\r\nHost: x\r\nRange: bytes=10-19\r\n\r\n")
+    assert status == "HTTP/1.1 206 Partial Content"
+    assert headers["content-range"] == "bytes 10-19/100"
+    assert body == bytes(range(10, 20))
+
+
+def test_bad_content_length(tmp_path):
+    status, _, _ = serve(tmp_path, "GET / HTTP/1.1\r\nHost: x\r\nContent-Length: -1\r\n\r\n")
+    assert status == "HTTP/1.1 400 Bad Request"
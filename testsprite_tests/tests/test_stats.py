@@ -0,0 +1,40 @@
+import pytest
+from harness.stats import bootstrap_ci, linear_fit, percentile, scaling_exponent
+
+
+def test_percentile_interpolates_between_ranks():
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([4, 1, 3, 2], 0) == 1
+    assert percentile([4, 1, 3, 2], 100) == 4
+    assert percentile([], 50) is None
+
+
+def test_bootstrap_ci_is_seeded():
+    values = [12, 15, 11, 19, 14, 13, 17, 16]
+    low, high = bootstrap_ci(values)
+    assert (low, high) == bootstrap_ci(values)
+    assert min(values) <= low <= high <= max(values)
+
+
+def test_bootstrap_ci_of_constant_values():
+    assert bootstrap_ci([7, 7, 7, 7]) == (7, 7)
+    assert bootstrap_ci([7]) == (None, None)
+
+
+def test_linear_fit_recovers_exact_line():
+    slope, intercept, r2 = linear_fit([1, 2, 3, 4], [3, 5, 7, 9])
+    assert slope == pytest.approx(2)
+    assert intercept == pytest.approx(1)
+    assert r2 == pytest.approx(1.0)
+
+
+def test_linear_fit_without_spread_in_x():
+    assert linear_fit([2, 2, 2], [1, 2, 3]) == (None, None, None)
+    assert linear_fit([1], [1]) == (None, None, None)
+
+
+def test_scaling_exponent_of_power_law():
+    sizes = [10, 100, 1000, 10000]
+    assert scaling_exponent(sizes, [s ** 2 for s in sizes]) == pytest.approx(2)
+    assert scaling_exponent(sizes, [5, 5, 5, 5]) == pytest.approx(0)
+    assert scaling_exponent([10], [100]) is None